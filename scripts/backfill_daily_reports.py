@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+日次レポート一括再生成スクリプト
+
+`devin-stat backfill` の互換ラッパーです。パッケージをインストールせずに
+リポジトリから直接実行する場合に使います。
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main(["backfill", *sys.argv[1:]]))
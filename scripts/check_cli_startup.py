@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+CLI起動時間チェックスクリプト
+
+`python -X importtime -m src.cli <command> --help` を実行し、各サブコマンドの
+import時間が予算内であること・不要な重い依存を読み込んでいないことを確認します。
+--help はハンドラの実行前に終了するため、軽いコマンドは小さな入力で実際にも実行し、
+実行中に読み込んではいけないモジュールを読み込んでいないことを確認します。
+予算を超えた場合は終了コード1を返すため、CIでの回帰検出に使えます。
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# コマンド → (import時間の予算[ms], 読み込んではいけないモジュール)
+STARTUP_BUDGETS = {
+    "": (30, {"yaml", "requests", "backoff", "src.utils.config_provider"}),
+    "convert-usage": (40, {"yaml", "requests", "backoff", "src.utils.config_provider"}),
+    "integrate-browser": (120, {"requests", "backoff"}),
+    "backfill": (150, {"requests", "backoff"}),
+    "analyze": (400, set()),
+    "pipeline": (400, set()),
+    "watch": (400, {"requests", "backoff"}),
+    "serve": (400, {"requests", "backoff"}),
+    "bench": (150, {"requests", "backoff"}),
+    "daily-report": (400, set()),
+    "sync-sessions": (400, set()),
+}
+
+SAMPLE_USAGE_TEXT = """Session
+Created At
+ACUs Used
+Fix login redirect
+Jun 3, 2025
+1.25
+View session
+Add usage export
+Jun 4, 2025
+3
+View session
+"""
+
+# 実際にも実行して読み込むモジュールを確認するコマンド → (引数（{tmp} は一時ディレクトリ）, 標準入力)
+RUN_CHECKS = {
+    "convert-usage": (["-", "{tmp}/usage_history.csv"], SAMPLE_USAGE_TEXT),
+}
+
+
+def measure_imports(command: str, args: Optional[List[str]] = None,
+                    stdin: Optional[str] = None) -> Tuple[float, Dict[str, float]]:
+    """
+    コマンドの実行（省略時はヘルプ表示）までにimportされたモジュールと合計時間を計測する
+
+    Args:
+        command: サブコマンド名
+        args: サブコマンドの引数（省略時は --help）
+        stdin: 標準入力に渡す文字列
+
+    Returns:
+        (合計時間[ms], モジュール名 → 累積時間[ms])
+    """
+    args = ["--help"] if args is None else args
+    argv = [sys.executable, "-X", "importtime", "-m", "src.cli"] + ([command] if command else []) + args
+    result = subprocess.run(argv, cwd=REPO_ROOT, input=stdin or "", capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"devin-stat {command} {' '.join(args)} が失敗しました:\n{result.stderr}")
+
+    modules = {}
+    total_us = 0
+    started = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        # インタープリタ自体の起動（site等）は除き、srcパッケージ以降だけを数える
+        if not started:
+            if name != "src":
+                continue
+            started = True
+        modules[name] = int(cumulative) / 1000
+        if not line.split("|")[2].startswith("  "):
+            total_us += int(cumulative)
+
+    return total_us / 1000, modules
+
+
+def check(commands: List[str], repeat: int) -> bool:
+    """予算をチェックし、結果を表示する（すべて予算内ならTrue）"""
+    ok = True
+    for command in commands:
+        budget_ms, forbidden = STARTUP_BUDGETS[command]
+        # 初回はバイトコードのコンパイルを含むため、最小値で比較する
+        runs = [measure_imports(command) for _ in range(repeat)]
+        total_ms = min(total for total, _ in runs)
+        loaded = forbidden & set(runs[-1][1])
+
+        label = f"devin-stat {command}".strip()
+        if loaded:
+            ok = False
+            print(f"❌ {label}: 不要なモジュールを読み込んでいます: {', '.join(sorted(loaded))}")
+        elif total_ms > budget_ms:
+            ok = False
+            print(f"❌ {label}: {total_ms:.1f}ms（予算 {budget_ms}ms）")
+        else:
+            print(f"✅ {label}: {total_ms:.1f}ms（予算 {budget_ms}ms）")
+
+        slowest = sorted(runs[-1][1].items(), key=lambda item: item[1], reverse=True)[:3]
+        print("   " + ", ".join(f"{name} {ms:.1f}ms" for name, ms in slowest))
+
+        if command in RUN_CHECKS:
+            ok = check_run(command, forbidden) and ok
+    return ok
+
+
+def check_run(command: str, forbidden: set) -> bool:
+    """小さな入力でコマンドを実際に実行し、読み込んではいけないモジュールを確認する"""
+    args, stdin = RUN_CHECKS[command]
+    with tempfile.TemporaryDirectory() as tmp:
+        total_ms, modules = measure_imports(command, [arg.format(tmp=tmp) for arg in args], stdin)
+
+    label = f"devin-stat {command}（実行）"
+    loaded = forbidden & set(modules)
+    if loaded:
+        print(f"❌ {label}: 不要なモジュールを読み込んでいます: {', '.join(sorted(loaded))}")
+        return False
+    print(f"✅ {label}: {total_ms:.1f}ms")
+    return True
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description="devin-stat の起動時間チェック")
+    parser.add_argument(
+        "commands",
+        nargs="*",
+        help="チェックするサブコマンド（省略時はすべて）"
+    )
+    parser.add_argument(
+        "--repeat",
+        help="計測回数（最小値で判定）",
+        type=int,
+        default=3
+    )
+    args = parser.parse_args()
+
+    commands = args.commands or list(STARTUP_BUDGETS)
+    sys.exit(0 if check(commands, args.repeat) else 1)
+
+
+if __name__ == "__main__":
+    main()
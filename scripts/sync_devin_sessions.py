@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Devinセッション同期スクリプト
+
+`devin-stat sync-sessions` の互換ラッパーです。パッケージをインストールせずに
+リポジトリから直接実行する場合に使います。
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main(["sync-sessions", *sys.argv[1:]]))
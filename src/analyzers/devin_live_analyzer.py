@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Devin統計のインクリメンタル集計モジュール
+
+PRデータファイルごとの寄与（作成日・マージ日・状態）を保持し、変更されたファイルだけを
+解析して日別・月別の件数や成功率を差分更新します。監視モード（devin-stat watch）用です。
+"""
+
+import json
+import os
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from ..collectors.devin_pr_collector import DevinPRCollector
+from ..collectors.pr_data_sources import SKIP_FILE_NAMES
+from ..collectors.usage_history_collector import UsageHistoryCollector
+from ..utils.config_provider import get_config_provider
+from ..utils.file_utils import atomic_write_text
+from .devin_backfill_analyzer import ESTIMATED_ACUS_PER_PR
+
+CHECKPOINT_VERSION = 1
+
+
+def event_day(timestamp: Optional[str]) -> Optional[str]:
+    """DevinStatsAnalyzer.analyze_daily_stats と同じ規則で日付（YYYY-MM-DD）に変換する"""
+    if not timestamp:
+        return None
+    return datetime.fromisoformat(timestamp.replace("Z", "")).date().isoformat()
+
+
+def _file_signature(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def is_pr_data_file(path: str) -> bool:
+    """PRデータのJSONファイルか判定する"""
+    base_name = os.path.basename(path)
+    return base_name.endswith(".json") and base_name not in SKIP_FILE_NAMES
+
+
+class LiveStatsAggregator:
+    """ファイル単位の差分でDevin統計を更新するクラス"""
+
+    def __init__(self, config=None, provider=None):
+        """初期化"""
+        self.provider = provider or get_config_provider()
+        self.config = config or self.provider.get_config()
+        self.pr_collector = DevinPRCollector(self.config, self.provider)
+        self.usage_collector = UsageHistoryCollector(self.config, self.provider)
+
+        # パス → {"signature": [サイズ, mtime_ns], "pr": 寄与（Devin PRでなければNone）}
+        self.pr_files: Dict[str, Dict] = {}
+        # パス → {"signature": [サイズ, mtime_ns], "sessions": セッションのリスト}
+        self.usage_files: Dict[str, Dict] = {}
+
+        self.daily_created = Counter()
+        self.daily_merged = Counter()
+        self.monthly_created = Counter()
+        self.monthly_merged = Counter()
+        self.counts = Counter()
+        self._usage_stats: Optional[Dict] = None
+
+        self.generation = 0
+        self.dirty = False
+
+    def _pr_record(self, pr: Dict) -> Optional[Dict]:
+        """PRデータから集計に使う値だけを取り出す（Devin PRでなければNone）"""
+        if not self.pr_collector.is_devin_pr(pr):
+            return None
+        basic_info = pr.get("basic_info", {})
+        return {
+            "created": event_day(basic_info.get("created_at")),
+            "merged": event_day(basic_info.get("merged_at")),
+            "state": basic_info.get("state", ""),
+        }
+
+    def _apply(self, record: Optional[Dict], sign: int):
+        if record is None:
+            return
+        self.counts["total"] += sign
+        if record["created"]:
+            self.daily_created[record["created"]] += sign
+            self.monthly_created[record["created"][:7]] += sign
+        if record["merged"]:
+            self.daily_merged[record["merged"]] += sign
+            self.monthly_merged[record["merged"][:7]] += sign
+            self.counts["merged"] += sign
+        elif record["state"] == "open":
+            self.counts["open"] += sign
+        elif record["state"] == "closed":
+            self.counts["closed"] += sign
+
+    def _replace_record(self, path: str, entry: Optional[Dict]) -> bool:
+        """ファイルの寄与を置き換え、集計値が変わったかを返す"""
+        old_entry = self.pr_files.pop(path, None)
+        if entry is not None:
+            self.pr_files[path] = entry
+        old_record = old_entry["pr"] if old_entry else None
+        new_record = entry["pr"] if entry else None
+        self.dirty = self.dirty or old_entry != entry
+        if old_record == new_record:
+            return False
+
+        self._apply(old_record, -1)
+        self._apply(new_record, +1)
+        self.generation += 1
+        return True
+
+    def update_pr_file(self, path: str) -> bool:
+        """
+        PRデータファイル1件の変更を反映する
+
+        Args:
+            path: PRデータファイルのパス（削除されていれば寄与を取り除く）
+
+        Returns:
+            集計値が変わったか
+        """
+        signature = _file_signature(path)
+        if signature is None:
+            return self._replace_record(path, None)
+
+        entry = self.pr_files.get(path)
+        if entry is not None and entry["signature"] == signature:
+            return False
+
+        try:
+            with open(path, "rb") as f:
+                pr = json.loads(f.read())
+        except Exception as e:
+            # 書き込み途中の可能性があるため、前回の寄与を残して次の変更で再解析する
+            print(f"{os.path.basename(path)}の読み込み中にエラー: {e}")
+            return False
+
+        record = self._pr_record(pr) if isinstance(pr, dict) else None
+        return self._replace_record(path, {"signature": signature, "pr": record})
+
+    def sync_directory(self, directory: str) -> int:
+        """
+        ディレクトリ全体を確認し、サイズ・mtimeが変わったファイルだけを解析する
+
+        Returns:
+            解析したファイル数
+        """
+        directory = os.path.abspath(directory)
+        present = set()
+        parsed = 0
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file() or not is_pr_data_file(entry.name):
+                    continue
+                present.add(entry.path)
+                known = self.pr_files.get(entry.path)
+                stat = entry.stat()
+                if known is None or known["signature"] != [stat.st_size, stat.st_mtime_ns]:
+                    self.update_pr_file(entry.path)
+                    parsed += 1
+
+        for path in [path for path in self.pr_files if os.path.dirname(path) == directory and path not in present]:
+            self._replace_record(path, None)
+        return parsed
+
+    def update_usage_file(self, path: str) -> bool:
+        """
+        Usage Historyファイルの変更を反映する（ファイル全体を読み直す）
+
+        Returns:
+            集計値が変わったか
+        """
+        signature = _file_signature(path)
+        entry = self.usage_files.get(path)
+        if entry is not None and entry["signature"] == signature:
+            return False
+
+        sessions = self.usage_collector.load_usage_data(path) if signature is not None else []
+        self.usage_files[path] = {"signature": signature, "sessions": sessions}
+        self._usage_stats = None
+        self.generation += 1
+        self.dirty = True
+        return True
+
+    def devin_pr_count(self) -> int:
+        """Devin作成PRの件数"""
+        return self.counts["total"]
+
+    def _usage_sessions(self) -> List[Dict]:
+        sessions = []
+        for entry in self.usage_files.values():
+            sessions.extend(entry["sessions"])
+        return sessions
+
+    def _acu_analysis(self) -> Dict:
+        """DevinStatsAnalyzer.analyze_acu_usage と同じ形式のACU分析"""
+        total_prs = self.counts["total"]
+        merged_prs = self.counts["merged"]
+        cost_efficiency = (merged_prs / total_prs) if total_prs > 0 else 0
+
+        usage_data = self._usage_sessions()
+        if not usage_data:
+            return {
+                "data_source": "estimated",
+                "total_estimated_acus": total_prs * ESTIMATED_ACUS_PER_PR,
+                "acus_per_pr": ESTIMATED_ACUS_PER_PR,
+                "acus_for_merged": merged_prs * ESTIMATED_ACUS_PER_PR,
+                "acus_for_failed": (total_prs - merged_prs) * ESTIMATED_ACUS_PER_PR,
+                "cost_efficiency": cost_efficiency
+            }
+
+        # セッションの集計はPR数に依存しないため、Usage Historyが変わったときだけ計算する
+        if self._usage_stats is None:
+            self._usage_stats = {
+                "pr_analysis": self.usage_collector.analyze_pr_related_sessions(usage_data, []),
+                "usage_summary": self.usage_collector.generate_usage_summary(usage_data),
+            }
+        pr_analysis = self._usage_stats["pr_analysis"]
+        total_pr_acus = pr_analysis["total_pr_acus"]
+        return {
+            "data_source": "actual_usage_history",
+            "total_acus": total_pr_acus,
+            "acus_per_pr": total_pr_acus / total_prs if total_prs > 0 else 0,
+            "pr_sessions": pr_analysis["total_pr_sessions"],
+            "daily_usage": pr_analysis["daily_usage"],
+            "full_daily_usage": self._usage_stats["usage_summary"].get("daily_summary", {}),
+            "cost_efficiency": cost_efficiency
+        }
+
+    def to_analysis(self) -> Dict:
+        """
+        DevinStatsAnalyzer.generate_comprehensive_analysis（全期間）と同じ形式の分析結果を作成する
+
+        Returns:
+            分析結果の辞書
+        """
+        total_prs = self.counts["total"]
+        if not total_prs:
+            return {"error": "分析対象のDevin PRがありません"}
+
+        merged_prs = self.counts["merged"]
+        return {
+            "summary": {
+                "total_prs": total_prs,
+                "analysis_date": datetime.now().isoformat(),
+                "period_analyzed": "全期間"
+            },
+            "daily_stats": {
+                "daily_created": dict(sorted((+self.daily_created).items())),
+                "daily_merged": dict(sorted((+self.daily_merged).items()))
+            },
+            "monthly_stats": {
+                "monthly_created": dict(sorted((+self.monthly_created).items())),
+                "monthly_merged": dict(sorted((+self.monthly_merged).items()))
+            },
+            "success_patterns": {
+                "total_prs": total_prs,
+                "merged_prs": merged_prs,
+                "failed_prs": total_prs - merged_prs,
+                "success_rate": merged_prs / total_prs * 100
+            },
+            "acu_analysis": self._acu_analysis()
+        }
+
+    def save_checkpoint(self, checkpoint_file: str):
+        """ファイルごとの寄与をチェックポイントとして保存する"""
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "devin_patterns": self.pr_collector.devin_patterns,
+            "pr_files": self.pr_files,
+            "usage_files": self.usage_files,
+        }
+        atomic_write_text(checkpoint_file, json.dumps(state, ensure_ascii=False))
+        self.dirty = False
+
+    def load_checkpoint(self, checkpoint_file: str) -> bool:
+        """
+        チェックポイントから寄与を復元する（PRデータは再解析しない）
+
+        Returns:
+            復元できたか
+        """
+        if not os.path.exists(checkpoint_file):
+            return False
+        try:
+            with open(checkpoint_file, encoding="utf-8") as f:
+                state = json.load(f)
+        except Exception as e:
+            print(f"⚠️ チェックポイント読み込みエラー: {e}")
+            return False
+
+        if state.get("version") != CHECKPOINT_VERSION or state.get("devin_patterns") != self.pr_collector.devin_patterns:
+            print("⚠️ チェックポイントの形式または devin_patterns が異なるため、すべて解析し直します")
+            return False
+
+        self.pr_files = {}
+        for counter in (self.daily_created, self.daily_merged, self.monthly_created, self.monthly_merged, self.counts):
+            counter.clear()
+        for path, entry in state.get("pr_files", {}).items():
+            self.pr_files[path] = entry
+            self._apply(entry["pr"], +1)
+        self.usage_files = state.get("usage_files", {})
+        self._usage_stats = None
+        self.generation += 1
+        self.dirty = False
+        return True
+
+    def forget_usage_files(self, keep: Iterable[str]):
+        """監視対象から外れたUsage Historyファイルの寄与を取り除く"""
+        keep = set(keep)
+        for path in [path for path in self.usage_files if path not in keep]:
+            del self.usage_files[path]
+            self._usage_stats = None
+            self.generation += 1
+            self.dirty = True
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Devin統計のクエリ用インデックス
+
+Devin作成PRとUsage Historyのセッションを日付順の配列と累積和に変換して保持し、
+期間を指定した件数・成功率・マージ済みPRあたりのACUなどを二分探索で求めます。
+ローカルHTTP API（devin-stat serve）用です。
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+from ..collectors.usage_history_collector import UsageHistoryCollector
+from ..utils.config_provider import get_config_provider
+from .devin_backfill_analyzer import ESTIMATED_ACUS_PER_PR
+from .devin_live_analyzer import event_day
+
+GROUP_KEY_LENGTH = {"day": 10, "month": 7}
+
+
+def _range(keys: List[str], since: Optional[str], until: Optional[str]) -> Tuple[int, int]:
+    """ソート済みの日付配列で、since〜until（両端を含む）に入る添字の範囲"""
+    lo = bisect_left(keys, since) if since else 0
+    hi = bisect_right(keys, until) if until else len(keys)
+    return lo, max(lo, hi)
+
+
+class StatsQueryIndex:
+    """期間指定の統計クエリに答えるためのインデックス"""
+
+    def __init__(self, devin_prs: List[Dict], usage_data: Optional[List[Dict]] = None,
+                 config=None, provider=None):
+        """
+        初期化（PRとセッションを1回ずつ走査する）
+
+        Args:
+            devin_prs: Devin作成PRのリスト
+            usage_data: Usage Historyのセッションリスト（省略時はACUを推定値で返す）
+        """
+        self.provider = provider or get_config_provider()
+        self.config = config or self.provider.get_config()
+
+        created = []
+        merged_days = []
+        for pr in devin_prs:
+            basic_info = pr.get("basic_info", {})
+            created_day = event_day(basic_info.get("created_at"))
+            merged_day = event_day(basic_info.get("merged_at"))
+            if created_day:
+                created.append((created_day, 1 if merged_day else 0))
+            if merged_day:
+                merged_days.append(merged_day)
+        created.sort()
+
+        self.total_prs = len(devin_prs)
+        self.created_days = [day for day, _ in created]
+        self.created_merged_prefix = [0] + list(accumulate(flag for _, flag in created))
+        self.merged_days = sorted(merged_days)
+
+        # 種別 → (ソート済みの日付配列, 日別件数)
+        self.daily: Dict[str, Tuple[List[str], List[int]]] = {}
+        for name, days in (("created", self.created_days), ("merged", self.merged_days)):
+            daily = sorted(Counter(days).items())
+            self.daily[name] = ([day for day, _ in daily], [count for _, count in daily])
+
+        self.usage_available = bool(usage_data)
+        sessions = [session for session in usage_data or [] if session.get("date")]
+        pr_analysis = UsageHistoryCollector(self.config, self.provider).analyze_pr_related_sessions(sessions, [])
+        pr_session_ids = {id(session) for session in pr_analysis["pr_sessions"]}
+
+        pr_sessions_by_day = sorted(
+            (session["date"], session["acus_used"]) for session in sessions if id(session) in pr_session_ids
+        )
+        self.pr_session_days = [day for day, _ in pr_sessions_by_day]
+        self.pr_session_acus_prefix = [0.0] + list(accumulate(acus for _, acus in pr_sessions_by_day))
+
+        self.sessions_by_acus = sorted(
+            (
+                {
+                    "session_name": session["session_name"],
+                    "created_at": session["created_at"],
+                    "date": session["date"],
+                    "acus_used": session["acus_used"],
+                    "pr_related": id(session) in pr_session_ids,
+                }
+                for session in sessions
+            ),
+            key=lambda session: session["acus_used"],
+            reverse=True,
+        )
+        self.session_count = len(sessions)
+
+    def counts(self, by: str = "day", since: Optional[str] = None, until: Optional[str] = None) -> Dict:
+        """
+        期間内の作成・マージ件数を日別または月別に集計する
+
+        Args:
+            by: day / month
+            since: 開始日（YYYY-MM-DD、当日を含む）
+            until: 終了日（YYYY-MM-DD、当日を含む）
+
+        Returns:
+            {"by", "created": {期間: 件数}, "merged": {期間: 件数}}
+        """
+        key_length = GROUP_KEY_LENGTH[by]
+        result = {"by": by, "since": since, "until": until}
+        for name, (days, day_counts) in self.daily.items():
+            lo, hi = _range(days, since, until)
+            grouped = Counter()
+            for day, count in zip(days[lo:hi], day_counts[lo:hi]):
+                grouped[day[:key_length]] += count
+            result[name] = dict(grouped)
+        return result
+
+    def success_rate(self, since: Optional[str] = None, until: Optional[str] = None) -> Dict:
+        """期間内に作成されたPRの成功率（マージ済みの割合）"""
+        lo, hi = _range(self.created_days, since, until)
+        total = hi - lo
+        merged = self.created_merged_prefix[hi] - self.created_merged_prefix[lo]
+        return {
+            "since": since,
+            "until": until,
+            "total_prs": total,
+            "merged_prs": merged,
+            "failed_prs": total - merged,
+            "success_rate": (merged / total * 100) if total > 0 else 0
+        }
+
+    def acus_per_merged_pr(self, since: Optional[str] = None, until: Optional[str] = None) -> Dict:
+        """
+        期間内のPR関連セッションのACUを、期間内にマージされたPR数で割った値
+
+        Usage Historyがない場合は、期間内に作成されたPR数 × 推定ACUを使う。
+        """
+        lo, hi = _range(self.merged_days, since, until)
+        merged = hi - lo
+
+        if self.usage_available:
+            session_lo, session_hi = _range(self.pr_session_days, since, until)
+            total_acus = self.pr_session_acus_prefix[session_hi] - self.pr_session_acus_prefix[session_lo]
+            data_source = "actual_usage_history"
+        else:
+            created_lo, created_hi = _range(self.created_days, since, until)
+            total_acus = (created_hi - created_lo) * ESTIMATED_ACUS_PER_PR
+            data_source = "estimated"
+
+        return {
+            "since": since,
+            "until": until,
+            "data_source": data_source,
+            "total_acus": total_acus,
+            "merged_prs": merged,
+            "acus_per_merged_pr": (total_acus / merged) if merged > 0 else None
+        }
+
+    def top_sessions(self, since: Optional[str] = None, until: Optional[str] = None,
+                     limit: int = 10, pr_related_only: bool = False) -> Dict:
+        """期間内のACU使用量が多いセッション"""
+        sessions = []
+        for session in self.sessions_by_acus:
+            if len(sessions) >= limit:
+                break
+            if since and session["date"] < since or until and session["date"] > until:
+                continue
+            if pr_related_only and not session["pr_related"]:
+                continue
+            sessions.append(session)
+        return {"since": since, "until": until, "limit": limit, "sessions": sessions}
+
@@ -8,18 +8,21 @@ Devin作成PRの統計分析を行います。
 import json
 from collections import defaultdict
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Dict, List, Optional
 
-from ..utils.github_api import load_config
+from ..collectors.pr_date_filter import parse_pr_timestamp
+from ..utils.config_provider import get_config_provider
+from ..utils.file_utils import atomic_open
+from ..utils.metrics import timed
 
 
 class DevinStatsAnalyzer:
     """Devin統計分析クラス"""
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, provider=None):
         """初期化"""
-        self.config = config or load_config()
+        self.provider = provider or get_config_provider()
+        self.config = config or self.provider.get_config()
         self.analysis_config = self.config["analysis"]
 
     def analyze_daily_stats(self, devin_prs: List[Dict]) -> Dict:
@@ -104,8 +107,9 @@ class DevinStatsAnalyzer:
         
         if usage_data:
             from ..collectors.usage_history_collector import UsageHistoryCollector
-            collector = UsageHistoryCollector()
+            collector = UsageHistoryCollector(self.config, self.provider)
             pr_analysis = collector.analyze_pr_related_sessions(usage_data, devin_prs)
+            usage_summary = collector.generate_usage_summary(usage_data)
             
             return {
                 "data_source": "actual_usage_history",
@@ -113,6 +117,7 @@ class DevinStatsAnalyzer:
                 "acus_per_pr": pr_analysis["avg_acus_per_pr"],
                 "pr_sessions": pr_analysis["total_pr_sessions"],
                 "daily_usage": pr_analysis["daily_usage"],
+                "full_daily_usage": usage_summary.get("daily_summary", {}),
                 "cost_efficiency": (merged_prs / total_prs) if total_prs > 0 else 0
             }
         else:
@@ -128,16 +133,31 @@ class DevinStatsAnalyzer:
                 "cost_efficiency": (merged_prs / total_prs) if total_prs > 0 else 0
             }
 
-    def generate_comprehensive_analysis(self, devin_prs: List[Dict], usage_data: Optional[List[Dict]] = None) -> Dict:
-        """包括的な分析を実行する"""
+    @timed("analyze")
+    def generate_comprehensive_analysis(self, devin_prs: List[Dict], usage_data: Optional[List[Dict]] = None,
+                                        date_window=None) -> Dict:
+        """包括的な分析を実行する
+
+        date_window（DateWindow）を指定した場合、devin_prsは収集時点で期間内に絞り込まれている前提で、
+        Usage Historyも同じ期間に絞り込む。
+        """
         if not devin_prs:
             return {"error": "分析対象のDevin PRがありません"}
         
+        period_analyzed = "全期間"
+        if date_window is not None and not date_window.is_unbounded:
+            period_analyzed = date_window.describe()
+            if usage_data:
+                usage_data = [
+                    session for session in usage_data
+                    if session.get("date") and date_window.contains(parse_pr_timestamp(session["date"]))
+                ]
+        
         analysis = {
             "summary": {
                 "total_prs": len(devin_prs),
                 "analysis_date": datetime.now().isoformat(),
-                "period_analyzed": "全期間"
+                "period_analyzed": period_analyzed
             },
             "daily_stats": self.analyze_daily_stats(devin_prs),
             "monthly_stats": self.analyze_monthly_stats(devin_prs),
@@ -147,12 +167,24 @@ class DevinStatsAnalyzer:
         
         return analysis
 
-    def save_analysis_results(self, analysis: Dict, output_file: str):
-        """分析結果をJSONファイルに保存する"""
-        output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+    def save_analysis_results(self, analysis: Dict, output_file: str, build_cache=None) -> bool:
+        """分析結果をJSONファイルに保存する
+
+        build_cache（ReportBuildCache）を指定した場合、実行時刻以外の内容が前回と同じなら書き込まない。
+        """
+        digest = None
+        if build_cache is not None:
+            from ..generators.report_build_cache import analysis_inputs, fingerprint
+            digest = fingerprint(analysis_inputs(analysis))
+            if build_cache.is_up_to_date(output_file, digest):
+                print(f"変更なし: {output_file} の書き込みをスキップしました")
+                return False
         
-        with open(output_path, "w", encoding="utf-8") as f:
+        with atomic_open(output_file) as f:
             json.dump(analysis, f, ensure_ascii=False, indent=2)
         
+        if build_cache is not None:
+            build_cache.record(output_file, digest)
+        
         print(f"分析結果を {output_file} に保存しました")
+        return True
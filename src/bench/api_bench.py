@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+APIクライアントのベンチマーク
+
+FakeAPIServer（Devin API / GitHub APIの代替サーバー）に対して、DevinAPIClient と src/utils/github_api.py の
+ページング・並列取得・再試行・キャッシュのスループットとレイテンシ（p50 / p95 / p99）を計測します。
+結果は BenchmarkSuite と同じ形式のため、compare_results でベースラインと比較できます。
+"""
+
+import contextlib
+import io
+import math
+import os
+import platform
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.config_provider import ConfigProvider, get_config_provider
+from .fake_api import FakeAPIServer, RateLimitWindow
+from .runner import RESULTS_FORMAT_VERSION, git_commit
+
+SEARCH_QUERY = "is:pr org:team-mirai-volunteer author:app/devin-ai-integration sort:updated-asc"
+
+
+def percentile(values: List[float], q: float) -> float:
+    """最近傍順位法によるパーセンタイル（q は 0〜100）"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(round_times: List[float], latencies: List[float], operations: int) -> Dict:
+    """
+    計測結果を集計する
+
+    Args:
+        round_times: 1回ごとの所要時間（秒）
+        latencies: 全回分のリクエストごとの所要時間（秒）
+        operations: 1回あたりのリクエスト（操作）数
+
+    Returns:
+        runner.measure と同じ統計に、スループットとレイテンシのパーセンタイルを加えたもの
+    """
+    median = statistics.median(round_times)
+    return {
+        "rounds": len(round_times),
+        "min": min(round_times),
+        "median": median,
+        "mean": statistics.mean(round_times),
+        "max": max(round_times),
+        "stddev": statistics.stdev(round_times) if len(round_times) > 1 else 0.0,
+        "operations": operations,
+        "throughput_per_second": operations / median if median > 0 else None,
+        "latency_ms": {
+            "p50": percentile(latencies, 50) * 1000,
+            "p95": percentile(latencies, 95) * 1000,
+            "p99": percentile(latencies, 99) * 1000,
+            "max": max(latencies) * 1000,
+        },
+    }
+
+
+def _timed_call(func: Callable, *args) -> float:
+    started = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - started
+
+
+class APIBenchmarkSuite:
+    """代替サーバーを起動してAPIクライアントのベンチマークを実行するクラス"""
+
+    def __init__(self, config=None, provider=None, rounds: int = 5, warmup: int = 1):
+        """
+        初期化
+
+        Args:
+            rounds: 各ベンチマークの計測回数
+            warmup: 計測前に実行する回数
+        """
+        self.provider = provider or get_config_provider()
+        self.config = config or self.provider.get_config()
+        self.api_config = self.config.get("bench", {}).get("api", {})
+        self.rounds = rounds
+        self.warmup = warmup
+        self.workers = self.api_config.get("workers", 8)
+        self.requests = self.api_config.get("requests", 200)
+        self.error_rate = self.api_config.get("error_rate", 0.05)
+        self.rate_limit = self.api_config.get("rate_limit", 30)
+        self.rate_limit_window = self.api_config.get("rate_limit_window", 1.0)
+
+    def create_server(self, size: int) -> FakeAPIServer:
+        """セッション数・PR数 size の代替サーバーを作成する"""
+        return FakeAPIServer(
+            sessions=size,
+            prs=size,
+            latency_ms=self.api_config.get("latency_ms", 20),
+            jitter_ms=self.api_config.get("jitter_ms", 10),
+            slow_rate=self.api_config.get("slow_rate", 0.01),
+            slow_ms=self.api_config.get("slow_ms", 200),
+        )
+
+    def client_provider(self, server: FakeAPIServer, work_dir: Path, http_cache: bool = False) -> ConfigProvider:
+        """代替サーバーに接続する設定プロバイダを作成する（レート制限・可用性・キャッシュの状態は毎回新しくなる）"""
+        config = server.client_config(self.config)
+        config["api"]["request_delay"] = 0
+        config["data"]["temp_dir"] = str(work_dir)
+        config.setdefault("http_cache", {})["enabled"] = http_cache
+        return ConfigProvider.from_dict(config)
+
+    def cases(self, server: FakeAPIServer, work_dir: Path) -> List[Tuple[str, Callable[[], List[float]]]]:
+        """
+        ベンチマーク対象の処理（名前と、リクエストごとの所要時間のリストを返す関数）
+
+        1回の処理で1リクエストしか計測できないもの（内部でページング・並列化するもの）は、処理全体の時間を返す。
+        """
+        from ..collectors.devin_api_client import DevinAPIClient
+        from ..collectors.devin_consumption_cache import ConsumptionCache
+        from ..collectors.devin_session_store import DevinSessionStore
+        from ..collectors.github_graphql_pr_collector import GitHubGraphQLPRCollector
+        from ..utils.github_api import make_github_api_request
+
+        session_ids = [session["session_id"] for session in server.sessions]
+        detail_ids = [session_ids[index % len(session_ids)] for index in range(self.requests)]
+        page_size = self.config["devin_api"].get("sync_page_size", 100)
+        search_pages = max(1, min(10, math.ceil(len(server.search_prs(SEARCH_QUERY)) / 100)))
+        counter = iter(range(10 ** 9))
+
+        def new_client(http_cache: bool = False) -> DevinAPIClient:
+            provider = self.client_provider(server, work_dir / f"run-{next(counter)}", http_cache)
+            return DevinAPIClient(provider.get_config(), provider)
+
+        def list_sessions_paged():
+            client = new_client()
+            return [
+                _timed_call(client.list_sessions, page_size, offset)
+                for offset in range(0, len(session_ids), page_size)
+            ]
+
+        def sync_sessions():
+            client = new_client()
+            store_dir = work_dir / f"store-{next(counter)}"
+            return [_timed_call(client.sync_sessions, DevinSessionStore(str(store_dir / "sessions.json")))]
+
+        def session_details_concurrent(client=None, ids=detail_ids):
+            client = client or new_client()
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                return list(executor.map(lambda session_id: _timed_call(client.get_session_details, session_id), ids))
+
+        def session_details_cached():
+            client = new_client(http_cache=True)
+            ids = detail_ids[:max(1, self.requests // 2)]
+            # 1巡目でキャッシュに載せ、2巡目はキャッシュから返す
+            return session_details_concurrent(client, ids) + session_details_concurrent(client, ids)
+
+        def session_details_retry():
+            server.error_rate = self.error_rate
+            try:
+                return session_details_concurrent(ids=detail_ids[:max(1, self.requests // 4)])
+            finally:
+                server.error_rate = 0.0
+
+        def daily_consumption():
+            client = new_client()
+            end = date.today()
+            cache = ConsumptionCache(str(work_dir / f"consumption-{next(counter)}.json"))
+            return [_timed_call(client.get_daily_consumption, (end - timedelta(days=364)).isoformat(),
+                                end.isoformat(), "week", self.workers, cache)]
+
+        def graphql_search():
+            provider = self.client_provider(server, work_dir / f"run-{next(counter)}")
+            collector = GitHubGraphQLPRCollector(provider.get_config(), provider,
+                                                 store_file=str(work_dir / "graphql_prs.json"))
+            return [_timed_call(collector.fetch_prs)]
+
+        def rest_search_pages():
+            provider = self.client_provider(server, work_dir / f"run-{next(counter)}")
+            url = f"{server.url}/search/issues"
+            return [
+                _timed_call(make_github_api_request, url, {"q": SEARCH_QUERY, "per_page": 100, "page": page},
+                            None, provider)
+                for page in range(1, search_pages + 1)
+            ]
+
+        def rest_search_rate_limited():
+            # ウィンドウあたり rate_limit 回の制限で 2倍の回数を送り、残り回数に応じた待機を含めて計測する
+            provider = self.client_provider(server, work_dir / f"run-{next(counter)}")
+            url = f"{server.url}/search/issues"
+            original = server.rate_limits["github"]
+            server.rate_limits["github"] = RateLimitWindow(self.rate_limit, self.rate_limit_window)
+            try:
+                return [
+                    _timed_call(make_github_api_request, url, {"q": SEARCH_QUERY, "per_page": 10, "page": 1},
+                                None, provider)
+                    for _ in range(self.rate_limit * 2)
+                ]
+            finally:
+                server.rate_limits["github"] = original
+
+        return [
+            ("devin_list_sessions_paged", list_sessions_paged),
+            ("devin_sync_sessions", sync_sessions),
+            ("devin_session_details_concurrent", session_details_concurrent),
+            ("devin_session_details_cached", session_details_cached),
+            ("devin_session_details_retry", session_details_retry),
+            ("devin_daily_consumption", daily_consumption),
+            ("github_graphql_search", graphql_search),
+            ("github_rest_search_pages", rest_search_pages),
+            ("github_rest_search_rate_limited", rest_search_rate_limited),
+        ]
+
+    def measure_case(self, server: FakeAPIServer, func: Callable[[], List[float]]) -> Dict:
+        """1つの処理を warmup + rounds 回実行して集計する（代替サーバー側の記録も付ける）"""
+        round_times: List[float] = []
+        latencies: List[float] = []
+        operations = 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(self.warmup):
+                func()
+            server.reset_stats()
+            for _ in range(self.rounds):
+                started = time.perf_counter()
+                round_latencies = func()
+                round_times.append(time.perf_counter() - started)
+                latencies.extend(round_latencies)
+                operations = len(round_latencies)
+
+        stats = summarize(round_times, latencies, operations)
+        server_stats = server.get_stats()
+        stats["server"] = {
+            "requests_per_round": server_stats["requests"] / self.rounds,
+            "injected_errors": server_stats["injected_errors"],
+            "rate_limited": server_stats["rate_limited"],
+            "not_modified": server_stats["not_modified"],
+        }
+        return stats
+
+    def run(self, sizes: Iterable[int], only: Optional[Iterable[str]] = None) -> Dict:
+        """
+        ベンチマークを実行する
+
+        Args:
+            sizes: 代替サーバーのセッション数・PR数のリスト
+            only: 実行するベンチマーク名（省略時はすべて）
+
+        Returns:
+            実行環境と、件数 → ベンチマーク名 → 実行時間・スループット・レイテンシの統計
+        """
+        only = set(only or [])
+        results = {
+            "format_version": RESULTS_FORMAT_VERSION,
+            "suite": "api",
+            "created_at": datetime.now().isoformat(),
+            "environment": {
+                "commit": git_commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "rounds": self.rounds,
+            "server": {key: value for key, value in self.api_config.items() if key not in ("sizes", "baseline_file")},
+            "results": {},
+        }
+
+        for size in sizes:
+            print(f"🌐 代替APIサーバーを起動中: セッション・PR {size}件")
+            size_results = results["results"][str(size)] = {}
+            with self.create_server(size) as server, tempfile.TemporaryDirectory() as work_dir:
+                for name, func in self.cases(server, Path(work_dir)):
+                    if only and name not in only:
+                        continue
+                    stats = self.measure_case(server, func)
+                    size_results[name] = stats
+                    latency = stats["latency_ms"]
+                    print(f"  {name:<36} median {stats['median'] * 1000:8.1f}ms  "
+                          f"{stats['throughput_per_second']:8.1f}/s  "
+                          f"p50 {latency['p50']:7.1f}ms  p95 {latency['p95']:7.1f}ms  p99 {latency['p99']:7.1f}ms")
+        return results
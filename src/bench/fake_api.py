@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+Devin API / GitHub API の代替サーバー
+
+DevinAPIClient と src/utils/github_api.py をネットワークに出ずに動かすための、プロセス内のHTTPサーバーです。
+応答の遅延・エラー率・レート制限・データ件数を指定でき、並列取得・ページング・再試行・キャッシュの
+動作確認とベンチマークに使います。
+
+対応するエンドポイント:
+    Devin:  GET /sessions, GET /sessions/{id}, GET /enterprise/consumption
+    GitHub: GET /rate_limit, GET /search/issues, POST /graphql（search のみ）
+
+例:
+    with FakeAPIServer(sessions=1000, prs=5000, latency_ms=20) as server:
+        provider = ConfigProvider.from_dict(server.client_config(config))
+        DevinAPIClient(provider=provider).list_sessions(limit=100)
+"""
+
+import copy
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .synthetic_data import SyntheticDataGenerator
+
+# client_config が参照させるトークンの環境変数（未設定なら start() で設定する）
+FAKE_TOKEN_ENV = "DEVIN_STAT_FAKE_API_TOKEN"
+
+# GitHubの検索APIが返す最大件数
+SEARCH_RESULT_LIMIT = 1000
+
+INJECTED_ERROR_STATUSES = [500, 502, 503]
+
+
+class RateLimitWindow:
+    """固定ウィンドウのレート制限（X-RateLimit-* ヘッダーの値を管理する）"""
+
+    def __init__(self, limit: Optional[int], window: float = 3600, clock=time.time):
+        """
+        初期化
+
+        Args:
+            limit: ウィンドウあたりのリクエスト数（Noneなら制限しない）
+            window: ウィンドウの長さ（秒）
+        """
+        self.limit = limit
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset_at = clock() + window
+        self.used = 0
+
+    def consume(self) -> Tuple[bool, Dict[str, str]]:
+        """
+        リクエスト1回分を消費する
+
+        Returns:
+            (許可されたか, レスポンスに付けるヘッダー)
+        """
+        if self.limit is None:
+            return True, {}
+        with self._lock:
+            now = self._clock()
+            if now >= self.reset_at:
+                self.reset_at = now + self.window
+                self.used = 0
+            allowed = self.used < self.limit
+            if allowed:
+                self.used += 1
+            headers = {
+                "X-RateLimit-Limit": str(self.limit),
+                "X-RateLimit-Remaining": str(self.limit - self.used),
+                "X-RateLimit-Reset": str(int(self.reset_at)),
+            }
+            if not allowed:
+                headers["Retry-After"] = str(max(1, int(self.reset_at - now + 0.999)))
+            return allowed, headers
+
+    def snapshot(self) -> Dict:
+        """/rate_limit 用の現在値"""
+        with self._lock:
+            limit = self.limit if self.limit is not None else 5000
+            return {"limit": limit, "remaining": max(0, limit - self.used), "used": self.used,
+                    "reset": int(self.reset_at)}
+
+
+class FakeAPIServer:
+    """Devin API と GitHub API の代替サーバー"""
+
+    def __init__(self, sessions: int = 1000, prs: int = 1000, latency_ms: float = 0, jitter_ms: float = 0,
+                 slow_rate: float = 0.0, slow_ms: float = 0, error_rate: float = 0.0,
+                 devin_rate_limit: Optional[int] = None, github_rate_limit: Optional[int] = 5000,
+                 rate_limit_window: float = 3600, consumption_days: int = 365, seed: int = 42,
+                 host: str = "127.0.0.1", port: int = 0):
+        """
+        初期化
+
+        Args:
+            sessions: /sessions が返すセッション数
+            prs: 検索対象のPR数（約3割がDevin作成）
+            latency_ms: 応答までの遅延（ミリ秒）
+            jitter_ms: 遅延に加える一様乱数の幅（ミリ秒）
+            slow_rate: 遅い応答を返す割合（テールレイテンシの再現用）
+            slow_ms: 遅い応答の追加遅延（ミリ秒）
+            error_rate: 5xxエラーを返す割合
+            devin_rate_limit: Devin APIのウィンドウあたりのリクエスト数（Noneなら制限しない、超過時は429）
+            github_rate_limit: GitHub APIのウィンドウあたりのリクエスト数（超過時は403）
+            rate_limit_window: レート制限のウィンドウ（秒）
+            consumption_days: /enterprise/consumption が返す日数（今日から遡る）
+            seed: データと遅延・エラーの乱数シード
+            port: 待ち受けるポート（0なら空いているポート）
+        """
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.slow_rate = slow_rate
+        self.slow = slow_ms / 1000
+        self.error_rate = error_rate
+        self.rate_limits = {
+            "devin": RateLimitWindow(devin_rate_limit, rate_limit_window),
+            "github": RateLimitWindow(github_rate_limit, rate_limit_window),
+        }
+        self.host = host
+        self.port = port
+
+        generator = SyntheticDataGenerator(seed=seed)
+        self.sessions = generator.make_api_sessions(sessions)
+        self.sessions_by_id = {session["session_id"]: session for session in self.sessions}
+        rng = random.Random(seed)
+        self.prs = [generator.make_pr(rng, number)["basic_info"] for number in range(1, prs + 1)]
+        today = datetime.now(timezone.utc).date()
+        self.consumption = {
+            (today - timedelta(days=offset)).isoformat(): round(rng.lognormvariate(4, 1), 2)
+            for offset in range(consumption_days)
+        }
+
+        self._rng = random.Random(seed + 3)
+        self._lock = threading.Lock()
+        self._search_cache: Dict[str, List[Dict]] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.reset_stats()
+
+    @property
+    def url(self) -> str:
+        """サーバーのベースURL"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeAPIServer":
+        """別スレッドでサーバーを起動する"""
+        os.environ.setdefault(FAKE_TOKEN_ENV, "fake-token")
+        handler = type("BoundFakeAPIRequestHandler", (FakeAPIRequestHandler,), {"api": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-api-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """サーバーを停止する"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self) -> "FakeAPIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def client_config(self, config: Dict) -> Dict:
+        """
+        このサーバーに接続するよう書き換えた設定を返す（元の設定は変更しない）
+
+        トークンは FAKE_TOKEN_ENV 環境変数から読ませる。
+        """
+        config = copy.deepcopy(config)
+        config["devin_api"]["base_url"] = self.url
+        config["devin_api"]["token_env_var"] = FAKE_TOKEN_ENV
+        config["github"]["api_base_url"] = self.url
+        config["github"]["graphql_url"] = f"{self.url}/graphql"
+        config["github"]["token_env_var"] = FAKE_TOKEN_ENV
+        return config
+
+    def reset_stats(self):
+        """リクエストの記録を消去する"""
+        with self._lock:
+            self.stats = {"requests": 0, "by_path": {}, "by_status": {}, "injected_errors": 0,
+                          "rate_limited": 0, "not_modified": 0}
+
+    def get_stats(self) -> Dict:
+        """リクエストの記録を返す"""
+        with self._lock:
+            return copy.deepcopy(self.stats)
+
+    def record(self, path: str, status: int):
+        """リクエスト1件を記録する"""
+        group = "/sessions/{id}" if path.startswith("/sessions/") else path
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["by_path"][group] = self.stats["by_path"].get(group, 0) + 1
+            self.stats["by_status"][str(status)] = self.stats["by_status"].get(str(status), 0) + 1
+            if status in INJECTED_ERROR_STATUSES:
+                self.stats["injected_errors"] += 1
+            elif status in (403, 429):
+                self.stats["rate_limited"] += 1
+            elif status == 304:
+                self.stats["not_modified"] += 1
+
+    def delay(self) -> float:
+        """今回の応答の遅延（秒）"""
+        with self._lock:
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+            if self.slow_rate and self._rng.random() < self.slow_rate:
+                delay += self.slow
+            return delay
+
+    def should_fail(self) -> Optional[int]:
+        """エラーを注入する場合はステータスコードを返す"""
+        if not self.error_rate:
+            return None
+        with self._lock:
+            if self._rng.random() < self.error_rate:
+                return self._rng.choice(INJECTED_ERROR_STATUSES)
+        return None
+
+    # --- Devin API ---
+
+    def list_sessions(self, params: Dict[str, str]) -> Dict:
+        limit = min(int(params.get("limit", 100)), 1000)
+        offset = int(params.get("offset", 0))
+        return {"sessions": self.sessions[offset:offset + limit], "total": len(self.sessions)}
+
+    def get_session(self, session_id: str) -> Optional[Dict]:
+        return self.sessions_by_id.get(session_id)
+
+    def get_consumption(self, params: Dict[str, str]) -> Dict:
+        start = date.fromisoformat(params["start_date"])
+        end = date.fromisoformat(params["end_date"])
+        daily = [
+            {"date": day, "credits": credits}
+            for day, credits in sorted(self.consumption.items())
+            if start <= date.fromisoformat(day) <= end
+        ]
+        return {"daily_consumption": daily, "total_credits": round(sum(item["credits"] for item in daily), 2)}
+
+    # --- GitHub API ---
+
+    def search_prs(self, query: str) -> List[Dict]:
+        """検索クエリ（is:pr / org: / repo: / author: / updated:>= / updated:A..B / sort:updated-asc）に一致するPR"""
+        with self._lock:
+            cached = self._search_cache.get(query)
+        if cached is not None:
+            return cached
+
+        matches = self.prs
+        sort_key, reverse = "created_at", True
+        for token in query.split():
+            name, _, value = token.partition(":")
+            if name == "org":
+                matches = [pr for pr in matches if pr["repository"].split("/")[0] == value]
+            elif name == "repo":
+                matches = [pr for pr in matches if pr["repository"] == value]
+            elif name == "author":
+                login = f"{value[len('app/'):]}[bot]" if value.startswith("app/") else value
+                matches = [pr for pr in matches if pr["user"]["login"] == login]
+            elif name == "updated" and value.startswith(">="):
+                since = value[2:]
+                matches = [pr for pr in matches if pr["updated_at"] >= since]
+            elif name == "updated" and ".." in value:
+                since, _, until = value.partition("..")
+                matches = [pr for pr in matches if since <= pr["updated_at"] <= until]
+            elif name == "sort":
+                field, _, direction = value.partition("-")
+                sort_key, reverse = f"{field}_at", direction != "asc"
+        matches = sorted(matches, key=lambda pr: pr[sort_key] or "", reverse=reverse)
+
+        with self._lock:
+            self._search_cache[query] = matches
+        return matches
+
+    def search_issues(self, params: Dict[str, str]) -> Tuple[int, Dict]:
+        per_page = min(int(params.get("per_page", 30)), 100)
+        page = int(params.get("page", 1))
+        if page * per_page > SEARCH_RESULT_LIMIT:
+            return 422, {"message": "Only the first 1000 search results are available"}
+        matches = self.search_prs(params.get("q", ""))
+        items = [
+            {
+                "number": pr["number"],
+                "title": pr["title"],
+                "html_url": pr["html_url"],
+                "state": pr["state"],
+                "user": pr["user"],
+                "created_at": pr["created_at"],
+                "updated_at": pr["updated_at"],
+                "closed_at": pr["closed_at"],
+                "repository_url": f"https://api.github.com/repos/{pr['repository']}",
+                "pull_request": {"html_url": pr["html_url"], "merged_at": pr["merged_at"]},
+            }
+            for pr in matches[(page - 1) * per_page:page * per_page]
+        ]
+        return 200, {"total_count": len(matches), "incomplete_results": False, "items": items}
+
+    def graphql(self, request: Dict) -> Tuple[int, Dict]:
+        variables = request.get("variables") or {}
+        if "search(" not in request.get("query", ""):
+            return 200, {"errors": [{"message": "Only the search query is supported by the fake server"}]}
+
+        first = min(int(variables.get("first", 100)), 100)
+        offset = int(variables["after"]) if variables.get("after") else 0
+        # GitHubと同じく、issueCount は全件数を返し、取得できるのは先頭 SEARCH_RESULT_LIMIT 件まで
+        all_matches = self.search_prs(variables.get("query", ""))
+        matches = all_matches[:SEARCH_RESULT_LIMIT]
+        nodes = []
+        for pr in matches[offset:offset + first]:
+            login = pr["user"]["login"]
+            is_bot = login.endswith("[bot]")
+            state = "MERGED" if pr["merged_at"] else pr["state"].upper()
+            nodes.append({
+                "number": pr["number"],
+                "title": pr["title"],
+                "url": pr["html_url"],
+                "state": state,
+                "createdAt": pr["created_at"],
+                "updatedAt": pr["updated_at"],
+                "mergedAt": pr["merged_at"],
+                "closedAt": pr["closed_at"],
+                "author": {"__typename": "Bot" if is_bot else "User",
+                           "login": login[:-len("[bot]")] if is_bot else login},
+                "repository": {"nameWithOwner": pr["repository"]},
+            })
+        end = offset + len(nodes)
+        return 200, {"data": {"search": {
+            "issueCount": len(all_matches),
+            "pageInfo": {"hasNextPage": end < len(matches), "endCursor": str(end) if nodes else None},
+            "nodes": nodes,
+        }}}
+
+    def rate_limit_body(self) -> Dict:
+        core = self.rate_limits["github"].snapshot()
+        return {"resources": {"core": core}, "rate": core}
+
+
+class FakeAPIRequestHandler(BaseHTTPRequestHandler):
+    """FakeAPIServer のリクエストハンドラ"""
+
+    api: FakeAPIServer = None
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        self._handle(url.path, lambda: self._route_get(url.path, params))
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(url.path, 400, {"message": "Problems parsing JSON"})
+            return
+        if url.path != "/graphql":
+            self._send_json(url.path, 404, {"message": "Not Found"})
+            return
+        self._handle(url.path, lambda: self.api.graphql(request), api_name="github", conditional=False)
+
+    def _route_get(self, path: str, params: Dict[str, str]) -> Tuple[int, Dict]:
+        if path == "/sessions":
+            return 200, self.api.list_sessions(params)
+        if path.startswith("/sessions/"):
+            session = self.api.get_session(path[len("/sessions/"):])
+            return (200, session) if session else (404, {"detail": "Session not found"})
+        if path == "/enterprise/consumption":
+            if "start_date" not in params or "end_date" not in params:
+                return 400, {"detail": "start_date and end_date are required"}
+            return 200, self.api.get_consumption(params)
+        if path == "/rate_limit":
+            return 200, self.api.rate_limit_body()
+        if path == "/search/issues":
+            return self.api.search_issues(params)
+        return 404, {"message": "Not Found"}
+
+    def _handle(self, path: str, respond, api_name: Optional[str] = None, conditional: bool = True):
+        api_name = api_name or ("github" if path in ("/rate_limit", "/search/issues") else "devin")
+        time.sleep(self.api.delay())
+
+        if not self.headers.get("Authorization"):
+            self._send_json(path, 401, {"message": "Requires authentication"})
+            return
+
+        status, body = respond()
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+        if conditional and status == 200 and self.headers.get("If-None-Match") == etag:
+            # GitHubと同様に、304はレート制限の残り回数を消費しない
+            self._send(path, 304, b"", {"ETag": etag})
+            return
+
+        # /rate_limit の呼び出しはGitHubでも残り回数を消費しない
+        allowed, headers = (True, {}) if path == "/rate_limit" else self.api.rate_limits[api_name].consume()
+        if not allowed:
+            limited_status = 403 if api_name == "github" else 429
+            self._send_json(path, limited_status, {"message": "API rate limit exceeded"}, headers)
+            return
+
+        error_status = self.api.should_fail()
+        if error_status is not None:
+            self._send_json(path, error_status, {"message": "Injected error"}, headers)
+            return
+
+        if status == 200 and conditional:
+            headers["ETag"] = etag
+        self._send(path, status, payload, headers)
+
+    def _send_json(self, path: str, status: int, body: Dict, headers: Optional[Dict[str, str]] = None):
+        self._send(path, status, json.dumps(body, ensure_ascii=False).encode("utf-8"), headers)
+
+    def _send(self, path: str, status: int, payload: bytes, headers: Optional[Dict[str, str]] = None):
+        self.api.record(path, status)
+        self.send_response(status)
+        if payload:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
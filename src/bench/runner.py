@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+ベンチマーク実行
+
+合成データに対して各処理（PR読み込み・Devin PR抽出・分析・Usage History読み込みとマージ・
+レポート生成・CLI全体）の実行時間を計測し、結果をJSONで保存・比較します。
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.config_provider import get_config_provider
+from ..utils.file_utils import atomic_write_text
+from .synthetic_data import SyntheticDataGenerator
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+RESULTS_FORMAT_VERSION = 1
+
+
+def measure(func: Callable[[], object], rounds: int = 5, warmup: int = 1) -> Dict:
+    """
+    関数の実行時間を計測する（標準出力は捨てる）
+
+    Args:
+        func: 計測する関数
+        rounds: 計測回数
+        warmup: 計測前に実行する回数
+
+    Returns:
+        実行時間の統計（秒）
+    """
+    timings = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            func()
+        for _ in range(rounds):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+
+    return {
+        "rounds": rounds,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "max": max(timings),
+        "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+
+
+def git_commit() -> Optional[str]:
+    """現在のコミットの短いハッシュ（取得できなければNone）"""
+    result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+
+class BenchmarkSuite:
+    """合成データを用意して各処理のベンチマークを実行するクラス"""
+
+    def __init__(self, config=None, provider=None, data_dir=None, rounds: int = 5, warmup: int = 1,
+                 seed: int = 42):
+        """
+        初期化
+
+        Args:
+            data_dir: 合成データの保存先（省略時は data.temp_dir/bench）
+            rounds: 各ベンチマークの計測回数
+            warmup: 計測前に実行する回数
+            seed: 合成データの乱数シード
+        """
+        self.provider = provider or get_config_provider()
+        self.config = config or self.provider.get_config()
+        self.data_dir = Path(data_dir or Path(self.config["data"]["temp_dir"]) / "bench")
+        self.rounds = rounds
+        self.warmup = warmup
+        self.generator = SyntheticDataGenerator(seed=seed)
+
+    def prepare(self, size: int) -> Dict[str, Path]:
+        """PR件数 size の合成データを用意する（セッション数はPR件数の1/10、最低100件）"""
+        sessions = max(100, size // 10)
+        size_dir = self.data_dir / f"size-{size}"
+        print(f"📦 合成データを準備中: PR {size}件, セッション {sessions}件")
+        paths = {
+            "pr_dir": self.generator.write_pr_tree(size_dir / "prs", size),
+            "usage_csv": size_dir / "usage_history.csv",
+            "usage_json": size_dir / "usage_history.json",
+            "browser": size_dir / "usage_history_browser.json",
+        }
+        self.generator.write_usage_csv(paths["usage_csv"], sessions)
+        self.generator.write_usage_json(paths["usage_json"], sessions)
+        self.generator.write_browser_export(paths["browser"], sessions)
+        return paths
+
+    def cases(self, paths: Dict[str, Path]) -> List[Tuple[str, Callable[[], object]]]:
+        """ベンチマーク対象の処理（名前と関数）"""
+        from ..analyzers.devin_stats_analyzer import DevinStatsAnalyzer
+        from ..collectors.devin_pr_collector import DevinPRCollector
+        from ..collectors.usage_history_collector import UsageHistoryCollector
+        from ..commands.integrate_browser import convert_browser_to_usage_format, load_browser_data, merge_usage_data
+        from ..generators.devin_report_generator import DevinReportGenerator
+
+        config, provider = self.config, self.provider
+        pr_dir, usage_csv, usage_json = str(paths["pr_dir"]), str(paths["usage_csv"]), str(paths["usage_json"])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            devin_prs = DevinPRCollector(config, provider).collect_devin_prs(pr_dir)
+            usage_data = UsageHistoryCollector(config, provider).load_usage_data(usage_csv)
+            analysis = DevinStatsAnalyzer(config, provider).generate_comprehensive_analysis(devin_prs, usage_data)
+
+        def merge_browser():
+            existing = UsageHistoryCollector(config, provider).load_usage_data(usage_csv)
+            browser = convert_browser_to_usage_format(load_browser_data(str(paths["browser"])))
+            return merge_usage_data(existing, browser)
+
+        def render_reports():
+            generator = DevinReportGenerator(config, provider)
+            generator.generate_daily_report(analysis)
+            generator.generate_monthly_summary(analysis)
+
+        def cli_end_to_end():
+            with tempfile.TemporaryDirectory() as output_dir:
+                subprocess.run(
+                    [sys.executable, "-m", "src.cli", "analyze", "--pr-data-dir", pr_dir,
+                     "--usage-file", usage_csv, "--output-dir", output_dir, "--force"],
+                    cwd=REPO_ROOT, check=True, stdout=subprocess.DEVNULL,
+                )
+
+        return [
+            ("load_pr_data_from_directory", lambda: DevinPRCollector(config, provider).load_pr_data_from_directory(pr_dir)),
+            ("collect_devin_prs", lambda: DevinPRCollector(config, provider).collect_devin_prs(pr_dir)),
+            ("generate_comprehensive_analysis",
+             lambda: DevinStatsAnalyzer(config, provider).generate_comprehensive_analysis(devin_prs)),
+            ("generate_comprehensive_analysis_usage",
+             lambda: DevinStatsAnalyzer(config, provider).generate_comprehensive_analysis(devin_prs, usage_data)),
+            ("load_usage_csv", lambda: UsageHistoryCollector(config, provider).load_usage_data(usage_csv)),
+            ("load_usage_json", lambda: UsageHistoryCollector(config, provider).load_usage_data(usage_json)),
+            ("merge_browser_data", merge_browser),
+            ("render_reports", render_reports),
+            ("cli_end_to_end", cli_end_to_end),
+        ]
+
+    def run(self, sizes: Iterable[int], only: Optional[Iterable[str]] = None) -> Dict:
+        """
+        ベンチマークを実行する
+
+        Args:
+            sizes: PR件数のリスト
+            only: 実行するベンチマーク名（省略時はすべて）
+
+        Returns:
+            実行環境と、PR件数 → ベンチマーク名 → 実行時間の統計
+        """
+        only = set(only or [])
+        results = {
+            "format_version": RESULTS_FORMAT_VERSION,
+            "created_at": datetime.now().isoformat(),
+            "environment": {
+                "commit": git_commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "rounds": self.rounds,
+            "results": {},
+        }
+
+        for size in sizes:
+            paths = self.prepare(size)
+            size_results = results["results"][str(size)] = {}
+            for name, func in self.cases(paths):
+                if only and name not in only:
+                    continue
+                stats = measure(func, self.rounds, self.warmup)
+                size_results[name] = stats
+                print(f"  {name:<40} min {stats['min'] * 1000:9.1f}ms  median {stats['median'] * 1000:9.1f}ms")
+        return results
+
+
+def save_results(results: Dict, output_file):
+    """ベンチマーク結果をJSONで保存する"""
+    atomic_write_text(output_file, json.dumps(results, ensure_ascii=False, indent=2))
+
+
+def load_results(input_file) -> Optional[Dict]:
+    """保存したベンチマーク結果を読み込む（なければNone）"""
+    if not os.path.exists(input_file):
+        return None
+    with open(input_file, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(results: Dict, baseline: Dict, threshold: float = 0.2, min_delta: float = 0.005) -> List[Dict]:
+    """
+    ベースラインと比較する（ばらつきの影響を抑えるため最小値で比較する）
+
+    Args:
+        results: 今回の結果
+        baseline: ベースラインの結果
+        threshold: この割合を超えて遅くなったものを回帰とする
+        min_delta: 差がこの秒数以下なら割合によらず回帰としない（数ミリ秒の処理の揺らぎ対策）
+
+    Returns:
+        比較結果のリスト（regression が True のものが回帰）
+    """
+    comparisons = []
+    for size, size_results in results["results"].items():
+        baseline_results = baseline.get("results", {}).get(size, {})
+        for name, stats in size_results.items():
+            if name not in baseline_results:
+                continue
+            baseline_min = baseline_results[name]["min"]
+            ratio = stats["min"] / baseline_min if baseline_min > 0 else 1.0
+            comparisons.append({
+                "size": int(size),
+                "name": name,
+                "baseline": baseline_min,
+                "current": stats["min"],
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold and stats["min"] - baseline_min > min_delta,
+            })
+    return comparisons
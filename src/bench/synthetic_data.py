@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+ベンチマーク用の合成データ生成
+
+pr-data と同じ basic_info 形式のPRデータディレクトリ（1千〜100万件）と、
+Usage History（CSV / JSON）・ブラウザ収集データ・Devin APIのセッションを乱数シードから再現可能な形で生成します。
+"""
+
+import csv
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..utils.file_utils import atomic_open, atomic_write_text
+
+# 生成内容を変えたら上げる（既存の生成データを作り直す）
+SCHEMA_VERSION = 1
+
+DEVIN_LOGIN = "devin-ai-integration[bot]"
+HUMAN_LOGINS = ["alice", "bob", "carol", "dave", "erin", "frank", "grace", "heidi", "dependabot[bot]"]
+REPOSITORIES = ["team-mirai-volunteer/action-board", "team-mirai-volunteer/policy", "team-mirai-volunteer/pr-data"]
+TITLE_WORDS = ["Fix", "Add", "Update", "Refactor", "Improve", "Remove", "README", "CI", "型定義", "テスト",
+               "ドキュメント", "レビュー指摘", "依存関係", "ビルド", "パフォーマンス", "アクセシビリティ"]
+SESSION_TOPICS = ["PR作成", "GitHub Action修正", "レビュー対応", "merge conflict解消", "commit整理",
+                  "データ分析", "調査", "Slack message", "ドキュメント作成", "pull request review"]
+
+
+class SyntheticDataGenerator:
+    """合成データを生成するクラス"""
+
+    def __init__(self, seed: int = 42, start: Optional[datetime] = None, days: int = 365,
+                 devin_ratio: float = 0.3, merge_ratio: float = 0.8):
+        """
+        初期化
+
+        Args:
+            seed: 乱数シード（同じシードなら同じデータを生成する）
+            start: PR作成日時の開始（省略時は2025-01-01）
+            days: PR作成日時を分布させる日数
+            devin_ratio: Devin作成PRの割合
+            merge_ratio: マージされるPRの割合
+        """
+        self.seed = seed
+        self.start = start or datetime(2025, 1, 1, tzinfo=timezone.utc)
+        self.days = days
+        self.devin_ratio = devin_ratio
+        self.merge_ratio = merge_ratio
+
+    def _timestamp(self, value: datetime) -> str:
+        return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def make_pr(self, rng: random.Random, number: int) -> Dict:
+        """PRデータ1件を作成する"""
+        created = self.start + timedelta(seconds=rng.randrange(self.days * 86400))
+        login = DEVIN_LOGIN if rng.random() < self.devin_ratio else rng.choice(HUMAN_LOGINS)
+        repository = rng.choice(REPOSITORIES)
+
+        merged_at = closed_at = None
+        state = "open"
+        roll = rng.random()
+        if roll < self.merge_ratio:
+            merged = created + timedelta(minutes=rng.randrange(5, 7 * 24 * 60))
+            merged_at = closed_at = self._timestamp(merged)
+            state = "closed"
+        elif roll < self.merge_ratio + (1 - self.merge_ratio) / 2:
+            closed_at = self._timestamp(created + timedelta(minutes=rng.randrange(5, 14 * 24 * 60)))
+            state = "closed"
+        updated_at = closed_at or self._timestamp(created + timedelta(minutes=rng.randrange(0, 3 * 24 * 60)))
+
+        comments = [
+            {
+                "user": {"login": rng.choice(HUMAN_LOGINS)},
+                "created_at": self._timestamp(created + timedelta(minutes=rng.randrange(1, 3 * 24 * 60))),
+                "body": " ".join(rng.choice(TITLE_WORDS) for _ in range(rng.randrange(5, 40))),
+            }
+            for _ in range(rng.randrange(0, 6))
+        ]
+        commits = [
+            {"sha": f"{rng.getrandbits(160):040x}", "message": " ".join(rng.choice(TITLE_WORDS) for _ in range(6))}
+            for _ in range(rng.randrange(1, 8))
+        ]
+
+        return {
+            "basic_info": {
+                "number": number,
+                "title": " ".join(rng.choice(TITLE_WORDS) for _ in range(rng.randrange(3, 9))),
+                "html_url": f"https://github.com/{repository}/pull/{number}",
+                "state": state,
+                "user": {"login": login},
+                "created_at": self._timestamp(created),
+                "updated_at": updated_at,
+                "closed_at": closed_at,
+                "merged_at": merged_at,
+                "body": " ".join(rng.choice(TITLE_WORDS) for _ in range(rng.randrange(10, 120))),
+                "labels": [{"name": rng.choice(["bug", "enhancement", "documentation"])}] if rng.random() < 0.4 else [],
+                "repository": repository,
+            },
+            "comments": comments,
+            "review_comments": comments[: rng.randrange(0, len(comments) + 1)],
+            "commits": commits,
+        }
+
+    def write_pr_tree(self, output_dir, count: int) -> Path:
+        """
+        PRデータディレクトリを生成する（同じ条件の生成済みデータがあれば再利用する）
+
+        Args:
+            output_dir: 出力ディレクトリ
+            count: PR件数
+
+        Returns:
+            出力ディレクトリのパス
+        """
+        output_path = Path(output_dir)
+        # 生成条件の記録はPRデータとして読まれないよう、ディレクトリの外に置く
+        marker = output_path.parent / f".{output_path.name}.complete.json"
+        params = {"schema": SCHEMA_VERSION, "seed": self.seed, "count": count, "days": self.days,
+                  "devin_ratio": self.devin_ratio, "merge_ratio": self.merge_ratio,
+                  "start": self.start.isoformat()}
+        if marker.exists():
+            try:
+                with open(marker, encoding="utf-8") as f:
+                    if json.load(f) == params:
+                        return output_path
+            except (OSError, ValueError):
+                pass
+
+        output_path.mkdir(parents=True, exist_ok=True)
+        if marker.exists():
+            marker.unlink()
+        for stale in output_path.glob("*.json"):
+            stale.unlink()
+
+        rng = random.Random(self.seed)
+        for number in range(1, count + 1):
+            with open(output_path / f"{number}.json", "w", encoding="utf-8") as f:
+                json.dump(self.make_pr(rng, number), f, ensure_ascii=False)
+            if number % 100000 == 0:
+                print(f"  {number}/{count}件のPRデータを生成しました")
+
+        with open(output_path / "last_run_info.json", "w", encoding="utf-8") as f:
+            json.dump({"last_run": self._timestamp(datetime.now(timezone.utc)), "total": count}, f)
+        atomic_write_text(marker, json.dumps(params))
+        return output_path
+
+    def make_sessions(self, count: int, seed_offset: int = 0) -> List[Dict]:
+        """Usage Historyのセッションを作成する（created_at は "Jun 02, 2025" 形式）"""
+        rng = random.Random(self.seed + 1 + seed_offset)
+        sessions = []
+        for index in range(count):
+            created = self.start + timedelta(seconds=rng.randrange(self.days * 86400))
+            sessions.append({
+                "session_id": f"devin-{self.seed}-{seed_offset}-{index:08d}",
+                "session_name": f"{rng.choice(SESSION_TOPICS)} #{index}",
+                "created_at": created.strftime("%b %d, %Y"),
+                "acus_used": round(rng.lognormvariate(0, 1), 2),
+            })
+        return sessions
+
+    def make_api_sessions(self, count: int, end: Optional[datetime] = None, days: int = 90) -> List[Dict]:
+        """
+        Devin API（/sessions）形式のセッションを作成する（新しい順）
+
+        Args:
+            count: セッション数
+            end: 最も新しいセッションの作成日時の上限（省略時は現在時刻）
+            days: 作成日時を分布させる日数（end から遡る）
+        """
+        rng = random.Random(self.seed + 2)
+        end = end or datetime.now(timezone.utc)
+        sessions = []
+        for index in range(count):
+            created = end - timedelta(seconds=rng.randrange(days * 86400))
+            duration = rng.randrange(1, 240)
+            session = {
+                "session_id": f"devin-{self.seed}-{index:08d}",
+                "status": rng.choice(["finished", "finished", "finished", "stopped", "expired", "running"]),
+                "title": f"{rng.choice(SESSION_TOPICS)} #{index}",
+                "task_description": " ".join(rng.choice(SESSION_TOPICS) for _ in range(rng.randrange(1, 4))),
+                "created_at": self._timestamp(created),
+                "updated_at": self._timestamp(min(end, created + timedelta(minutes=duration))),
+                "duration_minutes": duration,
+            }
+            if rng.random() < 0.5:
+                session["credits_used"] = rng.randrange(1, 200)
+            sessions.append(session)
+        sessions.sort(key=lambda session: session["updated_at"], reverse=True)
+        return sessions
+
+    def write_usage_csv(self, output_file, count: int) -> Path:
+        """Usage HistoryのCSV（Session, Created At, ACUs Used）を生成する"""
+        with atomic_open(output_file) as f:
+            writer = csv.writer(f)
+            writer.writerow(["Session", "Created At", "ACUs Used"])
+            for session in self.make_sessions(count):
+                writer.writerow([session["session_name"], session["created_at"], session["acus_used"]])
+        return Path(output_file)
+
+    def write_usage_json(self, output_file, count: int) -> Path:
+        """Usage HistoryのJSON（セッションのリスト）を生成する"""
+        sessions = [
+            {key: session[key] for key in ("session_name", "created_at", "acus_used")}
+            for session in self.make_sessions(count)
+        ]
+        atomic_write_text(output_file, json.dumps(sessions, ensure_ascii=False))
+        return Path(output_file)
+
+    def write_browser_export(self, output_file, count: int, overlap: float = 0.5) -> Path:
+        """
+        ブラウザ収集データ（devin_session_collector.js の出力形式）を生成する
+
+        Args:
+            overlap: Usage Historyと同じセッションを含める割合（マージ処理の重複排除用）
+        """
+        overlapping = int(count * overlap)
+        sessions = self.make_sessions(overlapping) + self.make_sessions(count - overlapping, seed_offset=1)
+        data = {
+            "metadata": {
+                "last_updated": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
+                "total_records": len(sessions),
+                "description": "Synthetic browser export for benchmarks",
+                "format_version": "1.0",
+                "collection_method": "browser_api",
+            },
+            "data": [
+                {
+                    "session": session["session_name"],
+                    "session_id": session["session_id"],
+                    "created_at": session["created_at"],
+                    "acus_used": session["acus_used"],
+                    "acu_used_since_last_reset": session["acus_used"],
+                    "max_acu_limit": 10,
+                }
+                for session in sessions
+            ],
+        }
+        atomic_write_text(output_file, json.dumps(data, ensure_ascii=False))
+        return Path(output_file)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+devin-stat コマンドラインインターフェース
+
+各サブコマンドの実装（src/commands/）は実行時に必要なものだけをimportするため、
+変換処理などの軽いコマンドは requests・yaml などを読み込まずに起動します。
+"""
+
+import argparse
+import importlib
+import sys
+from typing import List, Optional
+
+# サブコマンド名 → (実装モジュール, 説明)
+COMMANDS = {
+    "analyze": ("src.commands.analyze", "PRデータからDevin統計を分析し、レポートを生成する"),
+    "daily-report": ("src.commands.daily_report", "日次レポートを生成する（GitHub Actions用）"),
+    "pipeline": ("src.commands.pipeline", "収集・分析・レポート生成をキャッシュ付きパイプラインで実行する"),
+    "watch": ("src.commands.watch", "PRデータとUsage Historyの変更を監視して集計を随時更新する"),
+    "serve": ("src.commands.serve", "統計をJSONで返すローカルHTTP APIを起動する"),
+    "bench": ("src.commands.bench", "合成データで各処理のベンチマークを実行し、ベースラインと比較する"),
+    "backfill": ("src.commands.backfill", "過去の日次レポートを一括再生成する"),
+    "sync-sessions": ("src.commands.sync_sessions", "Devinセッションを差分同期する"),
+    "integrate-browser": ("src.commands.integrate_browser", "ブラウザ収集データをUsage Historyに統合する"),
+    "convert-usage": ("src.commands.convert_usage", "テキスト形式のUsage HistoryをCSVに変換する"),
+}
+
+
+def build_parser(argv: List[str]) -> argparse.ArgumentParser:
+    """引数パーサーを作成する（実行するサブコマンドのモジュールだけをimportする）"""
+    parser = argparse.ArgumentParser(prog="devin-stat", description="Devin統計分析ツール")
+    subparsers = parser.add_subparsers(dest="command", metavar="<command>")
+
+    selected = argv[0] if argv else None
+    for name, (module_name, help_text) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text, description=help_text)
+        if name == selected:
+            module = importlib.import_module(module_name)
+            module.add_arguments(subparser)
+            subparser.add_argument(
+                "--profile",
+                help="各ステージをcProfile・tracemallocで計測し、結果を DIR"
+                     "（省略時は出力ディレクトリ/profile_<command>_YYYYmmdd_HHMMSS）に保存する",
+                nargs="?",
+                const="",
+                default=None,
+                metavar="DIR"
+            )
+            # USES_CONFIG = False のコマンドは、--profile 指定時以外は設定・ログ・メトリクスを読み込まずに実行する
+            subparser.set_defaults(handler=module.run, uses_config=getattr(module, "USES_CONFIG", True))
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """エントリーポイント"""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = build_parser(argv)
+    args = parser.parse_args(argv)
+    if not getattr(args, "handler", None):
+        parser.print_help()
+        return 1
+
+    profile_dir = args.profile
+    if not args.uses_config and profile_dir is None:
+        result = args.handler(args)
+        return result if isinstance(result, int) else 0
+
+    from .utils.metrics import finish_run, start_run
+
+    if profile_dir == "":
+        from .utils.config_provider import get_config_provider
+        from .utils.profiling import default_profile_dir
+
+        profile_dir = default_profile_dir(get_config_provider().get_config(), args.command,
+                                          getattr(args, "output_dir", None))
+
+    start_run(args.command, profile_dir)
+    success = False
+    try:
+        result = args.handler(args)
+        result = result if isinstance(result, int) else 0
+        success = result == 0
+        return result
+    finally:
+        finish_run(args.command, success)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
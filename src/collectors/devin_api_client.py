@@ -7,19 +7,28 @@ Devin APIを使用してクレジット使用量とセッション統計を取
 
 import requests
 import json
-from datetime import datetime, timedelta
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
-from ..utils.devin_api import make_devin_api_request, is_devin_api_available, load_config
+from ..utils.config_provider import get_config_provider
+from ..utils.devin_api import make_devin_api_request, get_devin_availability
+from ..utils.metrics import timed
+from .devin_consumption_cache import ConsumptionCache, iter_dates, split_into_chunks
+from .devin_session_store import DevinSessionStore, parse_session_timestamp, session_timestamp
 
 
 class DevinAPIClient:
     """Devin API クライアント"""
     
-    def __init__(self, config=None):
-        self.config = config or load_config()
+    def __init__(self, config=None, provider=None):
+        self.provider = provider or get_config_provider()
+        self.config = config or self.provider.get_config()
         self.devin_config = self.config["devin_api"]
         self.base_url = self.devin_config["base_url"]
+        self.endpoints = self.devin_config.get("endpoints") or self.devin_config.get("enterprise_endpoints", {})
+        self.availability = get_devin_availability(self.provider)
     
     def get_enterprise_consumption(self, start_date: str, end_date: str) -> Dict:
         """
@@ -32,41 +41,121 @@ class DevinAPIClient:
         Returns:
             消費データの辞書
         """
-        if not is_devin_api_available():
+        if not self.availability.is_available():
             print("Devin APIが利用できません（トークンが設定されていない可能性があります）")
             return {}
         
-        endpoint = self.devin_config["endpoints"]["consumption"]
+        endpoint = self.endpoints["consumption"]
         params = {
             "start_date": start_date,
             "end_date": end_date
         }
         
         try:
-            return make_devin_api_request(endpoint, params)
+            # 確定日の判定は取得時刻に基づくため、レスポンスキャッシュ（日付が変わる前の応答）は使わない
+            return self._request(endpoint, params, use_cache=False)
         except Exception as e:
             print(f"クレジット消費データ取得エラー: {e}")
             return {}
     
-    def list_sessions(self, limit: int = 100) -> List[Dict]:
+    def get_daily_consumption(self, start_date: str, end_date: str, chunk: Optional[str] = None,
+                              max_workers: Optional[int] = None,
+                              cache: Optional[ConsumptionCache] = None) -> Dict:
+        """
+        日別のクレジット消費量を期間分割・並列取得し、1つの系列にまとめる
+        
+        確定済みの日はキャッシュから返し、未取得の日だけを週/月単位で取得します。
+        
+        Args:
+            start_date: 開始日 (YYYY-MM-DD)
+            end_date: 終了日 (YYYY-MM-DD)
+            chunk: 分割単位 ("week" または "month")
+            max_workers: 並列取得数
+            cache: 日別消費キャッシュ
+        
+        Returns:
+            日別消費量と取得状況の辞書
+        """
+        consumption_config = self.devin_config.get("consumption", {})
+        chunk = chunk or consumption_config.get("chunk", "month")
+        max_workers = max_workers or consumption_config.get("max_workers", 4)
+        if cache is None:
+            temp_dir = self.config.get("data", {}).get("temp_dir", "./temp")
+            cache = ConsumptionCache(
+                consumption_config.get("cache_file") or os.path.join(temp_dir, "consumption_daily.json")
+            )
+        
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
+        missing = cache.missing_days(start, end)
+        chunks = split_into_chunks(missing, chunk)
+        
+        failed_chunks = []
+        if chunks:
+            # 日が確定したかは、リクエストを送る前の時刻で判定する（その日が終わった後の応答だけが確定値）
+            requested_on = datetime.now(timezone.utc).date()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        self.get_enterprise_consumption, chunk_start.isoformat(), chunk_end.isoformat()
+                    ): (chunk_start, chunk_end)
+                    for chunk_start, chunk_end in chunks
+                }
+                for future in as_completed(futures):
+                    chunk_start, chunk_end = futures[future]
+                    payload = future.result()
+                    if not payload:
+                        failed_chunks.append((chunk_start.isoformat(), chunk_end.isoformat()))
+                        continue
+                    
+                    daily = self._extract_daily_consumption(payload)
+                    if not daily:
+                        # 形式を解釈できない応答を0として確定させると、二度と取得されないため記録しない
+                        print(f"⚠️ クレジット消費データの形式を解釈できませんでした: {chunk_start}〜{chunk_end}")
+                        failed_chunks.append((chunk_start.isoformat(), chunk_end.isoformat()))
+                        continue
+                    
+                    values = {day.isoformat(): 0 for day in iter_dates(chunk_start, chunk_end)}
+                    for day_key, credits in daily.items():
+                        if day_key in values:
+                            values[day_key] = credits
+                    cache.update(values, today=requested_on)
+            cache.save()
+        
+        daily = cache.get_series(start, end)
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "daily": daily,
+            "total_credits": sum(daily.values()),
+            "fetched_days": len(missing),
+            "cached_days": (end - start).days + 1 - len(missing),
+            "requests": len(chunks),
+            "failed_chunks": sorted(failed_chunks)
+        }
+
+    def list_sessions(self, limit: int = 100, offset: int = 0) -> List[Dict]:
         """
         セッション一覧を取得
         
         Args:
             limit: 取得件数の上限
+            offset: 取得開始位置
         
         Returns:
             セッションのリスト
         """
-        if not is_devin_api_available():
+        if not self.availability.is_available():
             print("Devin APIが利用できません")
             return []
         
-        endpoint = self.devin_config["endpoints"]["sessions"]
+        endpoint = self.endpoints["sessions"]
         params = {"limit": limit}
+        if offset:
+            params["offset"] = offset
         
         try:
-            result = make_devin_api_request(endpoint, params)
+            result = self._request(endpoint, params)
             return result.get("sessions", [])
         except Exception as e:
             print(f"セッション取得エラー: {e}")
@@ -82,51 +171,137 @@ class DevinAPIClient:
         Returns:
             セッション詳細の辞書
         """
-        if not is_devin_api_available():
+        if not self.availability.is_available():
             return {}
         
-        endpoint = f"{self.devin_config['endpoints']['sessions']}/{session_id}"
+        endpoint = f"{self.endpoints['sessions']}/{session_id}"
         
         try:
-            return make_devin_api_request(endpoint)
+            return self._request(endpoint)
         except Exception as e:
             print(f"セッション詳細取得エラー: {e}")
             return {}
 
-    def analyze_pr_related_sessions(self, days_back: int = 30) -> Dict:
+    @timed("devin_api_sync")
+    def sync_sessions(self, store: DevinSessionStore, overlap_hours: Optional[float] = None,
+                      page_size: Optional[int] = None) -> Dict:
         """
-        PR関連セッションを分析
+        ウォーターマーク以降のセッションだけを取得してローカルストアに反映
         
         Args:
-            days_back: 過去何日分を分析するか
+            store: 同期先のセッションストア
+            overlap_hours: 遅延更新を拾うためにウォーターマークから遡る時間
+            page_size: 1リクエストあたりの取得件数
         
         Returns:
-            分析結果の辞書
+            同期結果の辞書（途中で失敗した場合は "error" を含み、ストアは変更しない）
         """
-        if not is_devin_api_available():
+        if overlap_hours is None:
+            overlap_hours = self.devin_config.get("sync_overlap_hours", 6)
+        if page_size is None:
+            page_size = self.devin_config.get("sync_page_size", 100)
+        
+        if not self.availability.is_available():
             return {
                 "api_available": False,
-                "total_pr_sessions": 0,
-                "daily_stats": {},
-                "estimated_credits": 0
+                "api_status": self.availability.get_status(),
+                "fetched": 0,
+                "inserted": 0,
+                "updated": 0,
+                "requests": 0
             }
         
-        sessions = self.list_sessions(limit=1000)
+        watermark = store.get_watermark()
+        if watermark is not None:
+            cutoff = watermark - timedelta(hours=overlap_hours)
+        else:
+            initial_days = self.devin_config.get("sync_initial_days", 90)
+            cutoff = datetime.now(timezone.utc) - timedelta(days=initial_days)
+        
+        fetched = []
+        requests_made = 0
+        offset = 0
+        while True:
+            # 途中のページで失敗した場合に一部だけ保存すると、ウォーターマークが進んで
+            # 失敗したページ以降のセッションが次回以降取得されなくなるため、ストアは更新しない
+            if not self.availability.is_available():
+                return self._sync_error("Devin APIが途中で利用できなくなりました", requests_made)
+            params = {"limit": page_size}
+            if offset:
+                params["offset"] = offset
+            requests_made += 1
+            try:
+                page = self._request(self.endpoints["sessions"], params).get("sessions", [])
+            except Exception as e:
+                return self._sync_error(f"セッション取得エラー: {e}", requests_made)
+            
+            reached_cutoff = False
+            for session in page:
+                timestamp = session_timestamp(session)
+                if timestamp is not None and timestamp < cutoff:
+                    reached_cutoff = True
+                    continue
+                fetched.append(session)
+            
+            if reached_cutoff or len(page) < page_size:
+                break
+            offset += page_size
+        
+        inserted, updated = store.upsert(fetched)
+        store.save()
+        
+        return {
+            "api_available": True,
+            "api_status": self.availability.get_status(),
+            "fetched": len(fetched),
+            "inserted": inserted,
+            "updated": updated,
+            "requests": requests_made,
+            "watermark": store.watermark
+        }
+
+    def _sync_error(self, message: str, requests_made: int) -> Dict:
+        """同期を中断した場合の結果（ストアとウォーターマークは変更しない）"""
+        print(f"⚠️ {message}（セッションストアは更新しません）")
+        return {
+            "api_available": True,
+            "api_status": self.availability.get_status(),
+            "error": message,
+            "fetched": 0,
+            "inserted": 0,
+            "updated": 0,
+            "requests": requests_made
+        }
+
+    @timed("devin_api")
+    def analyze_pr_related_sessions(self, days_back: int = 30,
+                                    store: Optional[DevinSessionStore] = None) -> Dict:
+        """
+        PR関連セッションを分析
+        
+        Args:
+            days_back: 過去何日分を分析するか
+            store: 指定するとAPIではなくローカルストアのセッションを分析する
+        
+        Returns:
+            分析結果の辞書
+        """
+        if store is not None:
+            sessions = store.get_sessions()
+        elif not self.availability.is_available():
+            return self.unavailable_session_stats(self.availability.get_status())
+        else:
+            sessions = self.list_sessions(limit=1000)
         
         pr_related_sessions = []
         daily_stats = {}
         
-        cutoff_date = datetime.now() - timedelta(days=days_back)
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
         
         for session in sessions:
-            created_at = session.get("created_at")
-            if created_at:
-                try:
-                    session_date = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    if session_date < cutoff_date:
-                        continue
-                except ValueError:
-                    continue
+            session_date = parse_session_timestamp(session.get("created_at"))
+            if session_date is None or session_date < cutoff_date:
+                continue
             
             if self._is_pr_related_session(session):
                 pr_related_sessions.append(session)
@@ -143,11 +318,74 @@ class DevinAPIClient:
         
         return {
             "api_available": True,
+            "api_status": self.availability.get_status(),
+            "data_source": "session_store" if store is not None else "api",
             "total_pr_sessions": len(pr_related_sessions),
             "daily_stats": daily_stats,
             "estimated_credits": sum(self._estimate_session_credits(s) for s in pr_related_sessions)
         }
 
+    @staticmethod
+    def unavailable_session_stats(api_status: Dict) -> Dict:
+        """
+        セッションを取得できなかった場合のPR関連セッション分析結果
+        
+        Args:
+            api_status: 取得できなかった理由を表す状態
+        
+        Returns:
+            analyze_pr_related_sessions と同じ形式の空の分析結果
+        """
+        return {
+            "api_available": False,
+            "api_status": api_status,
+            "total_pr_sessions": 0,
+            "daily_stats": {},
+            "estimated_credits": 0
+        }
+
+    def _extract_daily_consumption(self, payload: Dict) -> Dict[str, float]:
+        """消費データのレスポンスから {日付: クレジット} を取り出す"""
+        records = payload
+        for key in ("daily_consumption", "consumption_by_date", "daily", "data"):
+            if key in payload:
+                records = payload[key]
+                break
+        
+        daily = {}
+        if isinstance(records, list):
+            for record in records:
+                if not isinstance(record, dict) or not record.get("date"):
+                    continue
+                for value_key in ("credits", "acus", "consumption", "total_credits"):
+                    if value_key in record:
+                        daily[record["date"][:10]] = record[value_key]
+                        break
+        elif isinstance(records, dict):
+            for day_key, value in records.items():
+                if isinstance(value, dict):
+                    value = value.get("credits", value.get("acus", 0))
+                if isinstance(value, (int, float)) and len(day_key) >= 10:
+                    daily[day_key[:10]] = value
+        
+        return daily
+
+    def _request(self, endpoint: str, params: Optional[Dict] = None, use_cache: bool = True) -> Dict:
+        """APIリクエストを実行し、結果を可用性モニターに反映する"""
+        try:
+            result = make_devin_api_request(endpoint, params, provider=self.provider, use_cache=use_cache)
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            if status_code is None or status_code in (401, 403) or status_code >= 500:
+                self.availability.record_failure(e)
+            raise
+        except requests.exceptions.RequestException as e:
+            self.availability.record_failure(e)
+            raise
+        
+        self.availability.record_success()
+        return result
+
     def _is_pr_related_session(self, session: Dict) -> bool:
         """セッションがPR関連かどうかを判定"""
         pr_keywords = [
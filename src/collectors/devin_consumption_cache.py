@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Devinクレジット消費キャッシュ
+
+日別のクレジット消費量をローカルに保存します。
+確定済み（当日より前）の日は変化しないため、再取得しません。
+"""
+
+import json
+import os
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def iter_dates(start: date, end: date) -> Iterable[date]:
+    """開始日から終了日まで（両端を含む）の日付を順に返す"""
+    current = start
+    while current <= end:
+        yield current
+        current += timedelta(days=1)
+
+
+def split_into_chunks(days: List[date], chunk: str = "month") -> List[Tuple[date, date]]:
+    """
+    日付のリストを連続区間に分け、さらに週または月の境界で分割する
+
+    Args:
+        days: 昇順の日付リスト
+        chunk: "week" または "month"
+
+    Returns:
+        (開始日, 終了日) のリスト
+    """
+    chunks = []
+    chunk_start = None
+    previous = None
+
+    for day in days:
+        if chunk_start is None:
+            chunk_start = day
+        elif day != previous + timedelta(days=1) or _chunk_id(day, chunk) != _chunk_id(previous, chunk):
+            chunks.append((chunk_start, previous))
+            chunk_start = day
+        previous = day
+
+    if chunk_start is not None:
+        chunks.append((chunk_start, previous))
+
+    return chunks
+
+
+def _chunk_id(day: date, chunk: str):
+    if chunk == "week":
+        return day.isocalendar()[:2]
+    return (day.year, day.month)
+
+
+class ConsumptionCache:
+    """日別クレジット消費量のキャッシュ"""
+
+    def __init__(self, cache_path: str):
+        """初期化"""
+        self.cache_path = Path(cache_path)
+        self.days: Dict[str, Dict] = {}
+        self.load()
+
+    def load(self):
+        """キャッシュファイルを読み込む"""
+        if not self.cache_path.exists():
+            return
+
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                self.days = json.load(f).get("days", {})
+        except Exception as e:
+            print(f"⚠️ 消費キャッシュ読み込みエラー: {e}")
+            self.days = {}
+
+    def save(self):
+        """キャッシュファイルを一時ファイル経由で保存する"""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"days": self.days}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+
+    def missing_days(self, start: date, end: date) -> List[date]:
+        """未取得または未確定の日を返す"""
+        return [
+            day for day in iter_dates(start, end)
+            if not self.days.get(day.isoformat(), {}).get("final")
+        ]
+
+    def update(self, values: Dict[str, float], today: Optional[date] = None):
+        """
+        取得した日別消費量を記録する
+
+        Args:
+            values: 日付 → クレジット
+            today: リクエストを送った日（UTC）。この日より前の日だけを確定扱いにする
+        """
+        if today is None:
+            today = datetime.now(timezone.utc).date()
+
+        for day_key, credits in values.items():
+            self.days[day_key] = {
+                "credits": credits,
+                "final": date.fromisoformat(day_key) < today,
+            }
+
+    def get_series(self, start: date, end: date) -> Dict[str, float]:
+        """指定期間の日別消費量を返す（キャッシュにある日のみ）"""
+        series = {}
+        for day in iter_dates(start, end):
+            entry = self.days.get(day.isoformat())
+            if entry is not None:
+                series[day.isoformat()] = entry["credits"]
+        return series
@@ -11,20 +11,36 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from ..utils.github_api import load_config
+from ..utils.config_provider import get_config_provider
+from ..utils.metrics import increment, timed
+from .pr_data_sources import iter_pr_data_files
+from .pr_date_filter import HEAD_SCAN_BYTES, DateWindow, PRDateIndex, scan_pr_dates
 
 
 class DevinPRCollector:
     """Devin作成PRを収集するクラス"""
 
-    def __init__(self, config=None):
-        """初期化"""
-        self.config = config or load_config()
+    def __init__(self, config=None, provider=None, since=None, until=None):
+        """
+        初期化
+        
+        Args:
+            config: 設定辞書
+            provider: 設定プロバイダ
+            since: この日時以降に作成またはマージされたPRのみ対象にする
+            until: この日時より前に作成またはマージされたPRのみ対象にする
+        """
+        self.provider = provider or get_config_provider()
+        self.config = config or self.provider.get_config()
         self.data_config = self.config["data"]
         self.analysis_config = self.config["analysis"]
         
         self.pr_data_dir = Path(self.data_config["pr_data_dir"])
+        self.git_subdir = self.data_config.get("pr_data_git_subdir", "prs")
         self.devin_patterns = self.analysis_config["devin_patterns"]
+        self.date_window = DateWindow(since, until)
+        self.date_index_path = Path(self.data_config.get("temp_dir", "./temp")) / "pr_date_index.json"
+        self.last_load_stats = {}
 
     def is_devin_pr(self, pr_data: Dict) -> bool:
         """PRがDevin作成かどうかを判定する"""
@@ -40,8 +56,14 @@ class DevinPRCollector:
         
         return False
 
-    def load_pr_data_from_directory(self, input_dir: Optional[str] = None) -> List[Dict]:
-        """PRデータをディレクトリから読み込む"""
+    @timed("load_pr_data")
+    def load_pr_data_from_directory(self, input_dir: Optional[str] = None,
+                                    git_ref: Optional[str] = None,
+                                    since=None, until=None) -> List[Dict]:
+        """PRデータをディレクトリ・アーカイブ・gitリポジトリから読み込む
+
+        since/until を指定すると、期間外のファイルはJSONを解析する前に除外する。
+        """
         if input_dir:
             data_dir = Path(input_dir)
         else:
@@ -51,27 +73,85 @@ class DevinPRCollector:
             print(f"データディレクトリが存在しません: {data_dir}")
             return []
         
-        pr_data = []
-        json_files = list(data_dir.glob("*.json"))
+        window = DateWindow(since, until) if since or until else self.date_window
+        date_index = None if window.is_unbounded else PRDateIndex(self.date_index_path)
+        stats = {"files": 0, "parsed": 0, "pruned_mtime": 0, "pruned_index": 0, "pruned_header": 0}
+        bytes_read = 0
+        parse_errors = 0
         
-        print(f"{len(json_files)}件のPRデータファイルを確認中...")
+        pr_data = []
         
-        for json_file in json_files:
-            if json_file.name == "last_run_info.json":
+        for pr_file in iter_pr_data_files(data_dir, git_ref=git_ref, git_subdir=self.git_subdir):
+            if pr_file.base_name == "last_run_info.json":
                 continue
-                
+            
+            stats["files"] += 1
+            if date_index is not None:
+                pruned_by = self._prune_reason(pr_file, window, date_index)
+                if pruned_by:
+                    stats[pruned_by] += 1
+                    continue
+            
             try:
-                with open(json_file, encoding="utf-8") as f:
-                    pr = json.load(f)
-                    pr_data.append(pr)
+                content = pr_file.read()
+                bytes_read += len(content)
+                pr = json.loads(content)
             except Exception as e:
-                print(f"{json_file}の読み込み中にエラー: {e}")
+                print(f"{pr_file.name}の読み込み中にエラー: {e}")
+                parse_errors += 1
+                continue
+            
+            stats["parsed"] += 1
+            if date_index is not None:
+                basic_info = pr.get("basic_info", {}) if isinstance(pr, dict) else {}
+                date_index.put(pr_file.name, pr_file.size, pr_file.mtime,
+                               basic_info.get("created_at"), basic_info.get("merged_at"))
+                if not window.matches_pr(pr):
+                    continue
+            pr_data.append(pr)
+        
+        if date_index is not None:
+            date_index.save()
+            pruned = stats["pruned_mtime"] + stats["pruned_index"] + stats["pruned_header"]
+            print(f"{stats['files']}件のPRデータファイルを確認しました"
+                  f"（期間 {window.describe()}: 解析{stats['parsed']}件、解析前に除外{pruned}件）")
+        else:
+            print(f"{stats['files']}件のPRデータファイルを確認しました")
         
+        increment("files_read", stats["parsed"] + parse_errors, source="pr_data")
+        increment("bytes_read", bytes_read, source="pr_data")
+        increment("parse_errors", parse_errors, source="pr_data")
+        for reason in ("pruned_mtime", "pruned_index", "pruned_header"):
+            if stats[reason]:
+                increment("files_pruned", stats[reason], reason=reason[len("pruned_"):])
+        
+        self.last_load_stats = stats
         return pr_data
 
-    def collect_devin_prs(self, input_dir: Optional[str] = None) -> List[Dict]:
+    def _prune_reason(self, pr_file, window: DateWindow, date_index: PRDateIndex) -> Optional[str]:
+        """ファイルを解析せずに期間外と判定できれば、その判定方法を返す"""
+        if not window.may_contain_file(pr_file.mtime):
+            return "pruned_mtime"
+        
+        dates = date_index.get(pr_file.name, pr_file.size, pr_file.mtime)
+        if dates is not None:
+            return None if window.matches(*dates) else "pruned_index"
+        
+        if pr_file.size is not None and pr_file.size > HEAD_SCAN_BYTES:
+            dates = scan_pr_dates(pr_file.read_head(HEAD_SCAN_BYTES))
+            if dates is not None:
+                date_index.put(pr_file.name, pr_file.size, pr_file.mtime, *dates)
+                if not window.matches(*dates):
+                    return "pruned_header"
+        
+        return None
+
+    @timed("collect_devin_prs")
+    def collect_devin_prs(self, input_dir: Optional[str] = None,
+                          git_ref: Optional[str] = None,
+                          since=None, until=None) -> List[Dict]:
         """Devin作成PRを収集する"""
-        all_prs = self.load_pr_data_from_directory(input_dir)
+        all_prs = self.load_pr_data_from_directory(input_dir, git_ref, since, until)
         devin_prs = []
         
         for pr in all_prs:
@@ -79,6 +159,7 @@ class DevinPRCollector:
                 devin_prs.append(pr)
         
         print(f"全{len(all_prs)}件中、Devin作成PR: {len(devin_prs)}件")
+        increment("devin_prs", len(devin_prs))
         return devin_prs
 
     def save_devin_prs(self, devin_prs: List[Dict], output_file: str):
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Devinセッションローカルストア
+
+Devin APIから取得したセッションをローカルJSONに蓄積し、
+差分同期用のウォーターマーク（最新のcreated_at/updated_at）を管理します。
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+def parse_session_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """セッションのタイムスタンプをUTCのdatetimeに変換する"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def session_timestamp(session: Dict) -> Optional[datetime]:
+    """セッションの最終更新時刻（updated_at、なければcreated_at）を返す"""
+    return parse_session_timestamp(session.get("updated_at")) or parse_session_timestamp(session.get("created_at"))
+
+
+class DevinSessionStore:
+    """Devinセッションを保存するローカルストア"""
+
+    def __init__(self, store_path: str):
+        """初期化"""
+        self.store_path = Path(store_path)
+        self.sessions: Dict[str, Dict] = {}
+        self.watermark: Optional[str] = None
+        self.last_synced_at: Optional[str] = None
+        self.load()
+
+    def load(self):
+        """ストアファイルを読み込む"""
+        if not self.store_path.exists():
+            return
+
+        try:
+            with open(self.store_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"⚠️ セッションストア読み込みエラー: {e}")
+            return
+
+        self.sessions = data.get("sessions", {})
+        self.watermark = data.get("watermark")
+        self.last_synced_at = data.get("last_synced_at")
+
+    def save(self):
+        """ストアファイルを一時ファイル経由で保存する"""
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "watermark": self.watermark,
+            "last_synced_at": self.last_synced_at,
+            "total_sessions": len(self.sessions),
+            "sessions": self.sessions,
+        }
+
+        tmp_path = self.store_path.with_suffix(self.store_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.store_path)
+
+    def get_watermark(self) -> Optional[datetime]:
+        """ウォーターマークをdatetimeで返す"""
+        return parse_session_timestamp(self.watermark)
+
+    def upsert(self, sessions: List[Dict]) -> Tuple[int, int]:
+        """
+        セッションを追加・更新する
+
+        Returns:
+            (追加件数, 更新件数)
+        """
+        inserted = 0
+        updated = 0
+        latest = self.get_watermark()
+
+        for session in sessions:
+            session_id = session.get("session_id") or session.get("id")
+            if not session_id:
+                continue
+
+            existing = self.sessions.get(session_id)
+            if existing is None:
+                inserted += 1
+            elif existing != session:
+                updated += 1
+            self.sessions[session_id] = session
+
+            timestamp = session_timestamp(session)
+            if timestamp and (latest is None or timestamp > latest):
+                latest = timestamp
+
+        if latest is not None:
+            self.watermark = latest.isoformat()
+        self.last_synced_at = datetime.now(timezone.utc).isoformat()
+
+        return inserted, updated
+
+    def get_sessions(self, since: Optional[datetime] = None) -> List[Dict]:
+        """保存済みセッションを返す（sinceを指定するとcreated_at以降のみ）"""
+        if since is None:
+            return list(self.sessions.values())
+
+        result = []
+        for session in self.sessions.values():
+            created_at = parse_session_timestamp(session.get("created_at"))
+            if created_at and created_at >= since:
+                result.append(session)
+        return result
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+GitHub GraphQL PR収集モジュール
+
+pr-dataリポジトリをチェックアウトせずに、GitHub GraphQLの検索APIで
+Devin作成PRだけを直接取得します。
+"""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..utils.config_provider import get_config_provider
+from ..utils.github_api import make_github_graphql_request
+from .devin_pr_collector import DevinPRCollector
+
+SEARCH_QUERY = """
+query($query: String!, $first: Int!, $after: String) {
+  search(query: $query, type: ISSUE, first: $first, after: $after) {
+    issueCount
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest {
+        number
+        title
+        url
+        state
+        createdAt
+        updatedAt
+        mergedAt
+        closedAt
+        author { __typename login }
+        repository { nameWithOwner }
+      }
+    }
+  }
+}
+"""
+
+# GitHubの検索で1クエリあたり取得できる最大件数
+SEARCH_RESULT_LIMIT = 1000
+# 期間の指定がない検索を分割するときの開始日時（GitHubのサービス開始前）
+SEARCH_EPOCH = datetime(2008, 1, 1, tzinfo=timezone.utc)
+
+
+class GitHubGraphQLPRCollector:
+    """GraphQL検索APIでDevin作成PRを収集するクラス
+
+    出力は DevinPRCollector.collect_devin_prs と同じ basic_info 形式です。
+    GitHubの検索は1クエリあたり最大1000件のため、超える場合は updated: の期間で分割して取得します。
+    """
+
+    def __init__(self, config=None, provider=None, graphql_url: Optional[str] = None,
+                 store_file: Optional[str] = None):
+        """初期化"""
+        self.provider = provider or get_config_provider()
+        self.config = config or self.provider.get_config()
+        self.github_config = self.config["github"]
+        self.devin_patterns = self.config["analysis"]["devin_patterns"]
+
+        self.graphql_url = graphql_url or self.github_config.get("graphql_url")
+        self.search_scope = self.github_config.get("search_scope", "")
+        self.page_size = self.github_config.get("graphql_page_size", 100)
+        self.overlap_minutes = self.github_config.get("graphql_overlap_minutes", 10)
+        self.store_file = Path(
+            store_file or self.github_config.get("graphql_pr_store", "./data/devin_prs_graphql.json")
+        )
+        self._pattern_filter = DevinPRCollector(self.config, self.provider)
+
+    def build_author_qualifiers(self) -> List[str]:
+        """devin_patternsから検索用のauthor修飾子を作成する"""
+        configured = self.github_config.get("graphql_authors")
+        if configured:
+            return [f"author:{author}" for author in configured]
+
+        patterns = [pattern.lower() for pattern in self.devin_patterns]
+        qualifiers = []
+        for pattern in patterns:
+            if pattern.endswith("[bot]"):
+                qualifier = f"author:app/{pattern[:-len('[bot]')]}"
+            elif any(pattern != other and pattern in other for other in patterns):
+                # 部分一致パターンは検索できないため、より具体的なパターンに任せる
+                continue
+            else:
+                qualifier = f"author:{pattern}"
+            if qualifier not in qualifiers:
+                qualifiers.append(qualifier)
+        return qualifiers
+
+    def build_search_query(self, qualifier: str, since: Optional[datetime] = None,
+                           until: Optional[datetime] = None) -> str:
+        """
+        author修飾子1つ分の検索クエリ文字列を作成する
+
+        Args:
+            qualifier: author修飾子
+            since: この日時以降に更新されたPRのみ
+            until: この日時以前に更新されたPRのみ（since と合わせて updated:since..until）
+        """
+        query = f"{self.search_scope} is:pr".strip()
+        if until is not None:
+            query += f" updated:{_search_time(since or SEARCH_EPOCH)}..{_search_time(until)}"
+        elif since is not None:
+            query += f" updated:>={_search_time(since)}"
+        return f"{query} sort:updated-asc {qualifier}"
+
+    def build_search_queries(self, since: Optional[datetime] = None) -> List[str]:
+        """検索クエリ文字列のリストを作成する（authorごとに1クエリ）"""
+        return [self.build_search_query(qualifier, since) for qualifier in self.build_author_qualifiers()]
+
+    def fetch_prs(self, since: Optional[datetime] = None) -> List[Dict]:
+        """検索APIからPRを取得する（カーソルでページング）"""
+        records = []
+        for qualifier in self.build_author_qualifiers():
+            records.extend(self.fetch_author_prs(qualifier, since)[0])
+        return records
+
+    def fetch_author_prs(self, qualifier: str, since: Optional[datetime] = None) -> Tuple[List[Dict], bool]:
+        """
+        author修飾子1つ分のPRを取得する
+
+        検索結果が SEARCH_RESULT_LIMIT 件を超える場合は、各期間が上限に収まるまで updated: の期間を二分して取得する。
+
+        Args:
+            qualifier: author修飾子
+            since: この日時以降に更新されたPRのみ取得する
+
+        Returns:
+            (Devin作成PRのリスト, 上限で打ち切られた期間がなく、すべて取得できたか)
+        """
+        records = {}
+        complete = True
+        ranges = [(since, None)]
+        while ranges:
+            start, end = ranges.pop()
+            search_query = self.build_search_query(qualifier, start, end)
+            result = self._search(search_query, allow_split=True)
+            if result is None:
+                range_start = start or SEARCH_EPOCH
+                range_end = end or datetime.now(timezone.utc).replace(microsecond=0)
+                if range_end - range_start > timedelta(seconds=1):
+                    middle = (range_start + (range_end - range_start) / 2).replace(microsecond=0)
+                    # 範囲は両端を含むため、後半は1秒後から（古い期間から順に取得する）
+                    ranges.append((middle + timedelta(seconds=1), range_end))
+                    ranges.append((range_start, middle))
+                    continue
+                print(f"⚠️ これ以上分割できないため、{SEARCH_RESULT_LIMIT}件で打ち切ります: {search_query}")
+                complete = False
+                result = self._search(search_query, allow_split=False)
+            for record in result:
+                records[record["basic_info"]["html_url"]] = record
+
+        return [record for record in records.values() if self._pattern_filter.is_devin_pr(record)], complete
+
+    def _search(self, search_query: str, allow_split: bool) -> Optional[List[Dict]]:
+        """
+        検索クエリの結果をすべてのページから取得する
+
+        Returns:
+            PRのリスト（allow_split で結果が上限を超えている場合は None）
+        """
+        records = []
+        cursor = None
+        while True:
+            data = make_github_graphql_request(
+                SEARCH_QUERY,
+                {"query": search_query, "first": self.page_size, "after": cursor},
+                provider=self.provider,
+                url=self.graphql_url,
+            )
+            search = data.get("search", {})
+            issue_count = search.get("issueCount", 0)
+            if cursor is None and issue_count > SEARCH_RESULT_LIMIT:
+                print(f"⚠️ 検索結果が{SEARCH_RESULT_LIMIT}件を超えています（{issue_count}件）: {search_query}")
+                if allow_split:
+                    return None
+
+            for node in search.get("nodes", []):
+                if node and node.get("number") is not None:
+                    records.append(self._to_record(node))
+
+            page_info = search.get("pageInfo", {})
+            if not page_info.get("hasNextPage"):
+                return records
+            cursor = page_info.get("endCursor")
+
+    def collect_devin_prs(self, incremental: bool = True) -> List[Dict]:
+        """
+        Devin作成PRを収集する（前回以降に更新されたPRのみ取得し、ローカルに統合）
+
+        ウォーターマークはauthor修飾子（検索クエリ）ごとに持つため、1つの検索が打ち切られても
+        他の検索のウォーターマークで取得漏れの期間を飛ばすことはない。
+        """
+        store = self._load_store() if incremental else self._empty_store()
+        watermarks = store["watermarks"]
+
+        fetched_count = 0
+        for qualifier in self.build_author_qualifiers():
+            # 旧形式のストア（全体で1つのウォーターマーク）はそれを引き継ぐ
+            watermark = watermarks.get(qualifier, store.get("watermark"))
+            since = None
+            if watermark:
+                since = datetime.fromisoformat(watermark) - timedelta(minutes=self.overlap_minutes)
+
+            fetched, complete = self.fetch_author_prs(qualifier, since)
+            fetched_count += len(fetched)
+            for record in fetched:
+                basic_info = record["basic_info"]
+                store["prs"][basic_info["html_url"]] = record
+                if not complete:
+                    continue
+                updated_at = datetime.fromisoformat(basic_info["updated_at"].replace("Z", "+00:00"))
+                if watermark is None or updated_at > datetime.fromisoformat(watermark):
+                    watermark = updated_at.isoformat()
+            if not complete:
+                print(f"⚠️ {qualifier} は取得しきれなかったため、ウォーターマークを進めません")
+            watermarks[qualifier] = watermark
+        store.pop("watermark", None)
+
+        self._save_store(store)
+        devin_prs = list(store["prs"].values())
+        print(f"GraphQL検索: {fetched_count}件取得、Devin作成PR: {len(devin_prs)}件")
+        return devin_prs
+
+    def _to_record(self, node: Dict) -> Dict:
+        """GraphQLのPullRequestノードを basic_info 形式に変換する"""
+        author = node.get("author") or {}
+        login = author.get("login", "")
+        if author.get("__typename") == "Bot" and not login.endswith("[bot]"):
+            login = f"{login}[bot]"
+
+        state = (node.get("state") or "").lower()
+        if state == "merged":
+            state = "closed"
+
+        return {
+            "basic_info": {
+                "number": node.get("number"),
+                "title": node.get("title"),
+                "html_url": node.get("url"),
+                "state": state,
+                "user": {"login": login},
+                "created_at": node.get("createdAt"),
+                "updated_at": node.get("updatedAt"),
+                "merged_at": node.get("mergedAt"),
+                "closed_at": node.get("closedAt"),
+                "repository": (node.get("repository") or {}).get("nameWithOwner"),
+            }
+        }
+
+    @staticmethod
+    def _empty_store() -> Dict:
+        return {"watermarks": {}, "prs": {}}
+
+    def _load_store(self) -> Dict:
+        if not self.store_file.exists():
+            return self._empty_store()
+        try:
+            with open(self.store_file, encoding="utf-8") as f:
+                store = json.load(f)
+        except Exception as e:
+            print(f"⚠️ GraphQL PRストア読み込みエラー: {e}")
+            return self._empty_store()
+        store.setdefault("prs", {})
+        store.setdefault("watermarks", {})
+        return store
+
+    def _save_store(self, store: Dict):
+        self.store_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.store_file.with_suffix(self.store_file.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(store, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.store_file)
+
+
+def _search_time(value: datetime) -> str:
+    """検索の updated: 修飾子に使う日時文字列（UTC）"""
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+PRデータソース
+
+PRデータのJSONファイルを、ディレクトリ・アーカイブ（tar.gz / tar.zst / zip）・
+gitリポジトリ（git cat-file --batch）のいずれからも同じ形で読み出します。
+"""
+
+import os
+import subprocess
+import tarfile
+import threading
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+SKIP_FILE_NAMES = {"last_run_info.json"}
+
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+ZSTD_SUFFIXES = (".tar.zst", ".tzst", ".tar.zstd")
+
+
+class PRDataFile:
+    """PRデータファイル1件（読み込みは必要になるまで遅延）
+
+    アーカイブ由来のファイルは、次のファイルに進む前に読み込む必要があります。
+    """
+
+    __slots__ = ("name", "size", "mtime", "_reader", "_data")
+
+    def __init__(self, name: str, size: Optional[int], mtime: Optional[float],
+                 reader: Optional[Callable[[], bytes]] = None, data: Optional[bytes] = None):
+        self.name = name
+        self.size = size
+        self.mtime = mtime
+        self._reader = reader
+        self._data = data
+
+    @property
+    def base_name(self) -> str:
+        return os.path.basename(self.name)
+
+    def read(self) -> bytes:
+        """ファイル内容を読み込む"""
+        if self._data is None:
+            self._data = self._reader()
+        return self._data
+
+    def read_head(self, size: int) -> bytes:
+        """ファイル先頭だけを読み込む（ディレクトリの場合は全体を読まない）"""
+        if self._data is not None:
+            return self._data[:size]
+        if os.path.isfile(self.name):
+            with open(self.name, "rb") as f:
+                return f.read(size)
+        return self.read()[:size]
+
+
+def is_git_repository(path: Path) -> bool:
+    """bareリポジトリまたは .git を持つ作業ツリーか判定する"""
+    return ((path / "HEAD").is_file() and (path / "objects").is_dir()) or (path / ".git").exists()
+
+
+def iter_pr_data_files(source, git_ref: Optional[str] = None, git_subdir: str = "prs") -> Iterator[PRDataFile]:
+    """
+    PRデータソースからJSONファイルを順に返す
+
+    Args:
+        source: ディレクトリ、アーカイブファイル、またはgitリポジトリのパス
+        git_ref: gitリポジトリから読む場合の参照（ブランチ・タグ・コミット）
+        git_subdir: gitリポジトリ内のPRデータディレクトリ
+    """
+    path = Path(source)
+    name = path.name.lower()
+
+    if path.is_dir():
+        bare = (path / "HEAD").is_file() and (path / "objects").is_dir()
+        if bare or (git_ref and is_git_repository(path)):
+            yield from _iter_git(path, git_ref or "HEAD", git_subdir)
+        else:
+            yield from _iter_directory(path)
+    elif name.endswith(".zip"):
+        yield from _iter_zip(path)
+    elif name.endswith(ZSTD_SUFFIXES):
+        yield from _iter_zstd_tar(path)
+    elif name.endswith(TAR_SUFFIXES):
+        with tarfile.open(path, mode="r|*") as archive:
+            yield from _iter_tar(archive)
+    else:
+        raise ValueError(f"サポートされていないPRデータソース: {source}")
+
+
+def _is_pr_json(name: str) -> bool:
+    base_name = os.path.basename(name)
+    return base_name.endswith(".json") and base_name not in SKIP_FILE_NAMES
+
+
+def _iter_directory(path: Path) -> Iterator[PRDataFile]:
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            stat = entry.stat()
+            file_path = entry.path
+            yield PRDataFile(
+                file_path, stat.st_size, stat.st_mtime,
+                reader=lambda file_path=file_path: Path(file_path).read_bytes(),
+            )
+
+
+def _iter_zip(path: Path) -> Iterator[PRDataFile]:
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not _is_pr_json(info.filename):
+                continue
+            mtime = _zip_mtime(info)
+            yield PRDataFile(
+                info.filename, info.file_size, mtime,
+                reader=lambda info=info: archive.read(info),
+            )
+
+
+def _zip_mtime(info: zipfile.ZipInfo) -> Optional[float]:
+    try:
+        return datetime(*info.date_time).timestamp()
+    except ValueError:
+        return None
+
+
+def _iter_tar(archive: tarfile.TarFile) -> Iterator[PRDataFile]:
+    # ストリーミングモードでは次のメンバーに進む前に内容を読む必要がある
+    for member in archive:
+        if not member.isfile() or not _is_pr_json(member.name):
+            continue
+        extracted = archive.extractfile(member)
+        if extracted is None:
+            continue
+        yield PRDataFile(member.name, member.size, float(member.mtime), data=extracted.read())
+
+
+def _iter_zstd_tar(path: Path) -> Iterator[PRDataFile]:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "tar.zstアーカイブを読むには zstandard パッケージが必要です: pip install zstandard"
+        )
+
+    with open(path, "rb") as raw:
+        with zstandard.ZstdDecompressor().stream_reader(raw) as stream:
+            with tarfile.open(fileobj=stream, mode="r|") as archive:
+                yield from _iter_tar(archive)
+
+
+def _iter_git(path: Path, ref: str, subdir: str) -> Iterator[PRDataFile]:
+    git_dir = path if (path / "HEAD").is_file() and (path / "objects").is_dir() else path / ".git"
+    base_cmd = ["git", f"--git-dir={git_dir}"]
+    tree_path = subdir.strip("/") + "/" if subdir else ""
+
+    ls_tree_cmd = base_cmd + ["ls-tree", "-z", "--long", ref]
+    if tree_path:
+        ls_tree_cmd += ["--", tree_path]
+    ls_tree = subprocess.run(ls_tree_cmd, capture_output=True, check=True)
+
+    blobs = []
+    for record in ls_tree.stdout.split(b"\0"):
+        if not record:
+            continue
+        meta, file_path = record.split(b"\t", 1)
+        _, object_type, object_id, size = meta.split()
+        name = file_path.decode("utf-8")
+        if object_type == b"blob" and _is_pr_json(name):
+            blobs.append((object_id, name, int(size)))
+
+    if not blobs:
+        return
+
+    process = subprocess.Popen(
+        base_cmd + ["cat-file", "--batch"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+    )
+
+    def feed():
+        try:
+            for object_id, _, _ in blobs:
+                process.stdin.write(object_id + b"\n")
+        except (BrokenPipeError, ValueError):
+            pass
+        finally:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+
+    writer = threading.Thread(target=feed, daemon=True)
+    writer.start()
+
+    try:
+        for _, name, size in blobs:
+            header = process.stdout.readline().split()
+            if len(header) < 3 or header[1] != b"blob":
+                raise RuntimeError(f"git cat-file の出力が不正です: {name}")
+            data = process.stdout.read(int(header[2]))
+            process.stdout.read(1)
+            yield PRDataFile(f"{ref}:{name}", size, None, data=data)
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        writer.join()
+        process.wait()
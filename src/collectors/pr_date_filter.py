@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+PRデータの期間フィルタ
+
+分析期間（since/until）外のPRファイルを、JSONを全体解析する前に除外するための
+判定処理（mtime・日付インデックス・ファイル先頭のスキャン）を提供します。
+"""
+
+import json
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+HEAD_SCAN_BYTES = 4096
+
+_TOKEN_RE = re.compile(rb'"((?:[^"\\]|\\.)*)"(\s*:)?|[{}\[\]]|\bnull\b')
+
+
+def parse_pr_timestamp(value) -> Optional[datetime]:
+    """PRのタイムスタンプ文字列をUTCのdatetimeに変換する"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class DateWindow:
+    """分析期間（sinceを含み、untilを含まない）"""
+
+    def __init__(self, since=None, until=None):
+        self.since = parse_pr_timestamp(since)
+        self.until = parse_pr_timestamp(until)
+
+    @property
+    def is_unbounded(self) -> bool:
+        return self.since is None and self.until is None
+
+    def contains(self, timestamp: Optional[datetime]) -> bool:
+        if timestamp is None:
+            return False
+        if self.since is not None and timestamp < self.since:
+            return False
+        if self.until is not None and timestamp >= self.until:
+            return False
+        return True
+
+    def matches(self, created_at, merged_at) -> bool:
+        """作成日時またはマージ日時が期間内か判定する"""
+        if self.is_unbounded:
+            return True
+        return self.contains(parse_pr_timestamp(created_at)) or self.contains(parse_pr_timestamp(merged_at))
+
+    def matches_pr(self, pr: Dict) -> bool:
+        basic_info = pr.get("basic_info", {}) if pr else {}
+        return self.matches(basic_info.get("created_at"), basic_info.get("merged_at"))
+
+    def may_contain_file(self, mtime: Optional[float]) -> bool:
+        """ファイルの更新時刻から、期間内のイベントを含みうるか判定する
+
+        PRファイルはイベント発生後に書き込まれるため、since以前に最後に書き込まれたファイルは
+        期間内のイベントを含まない。
+        """
+        if self.since is None or mtime is None:
+            return True
+        return mtime >= self.since.timestamp()
+
+    def floor_to_days(self) -> "DateWindow":
+        """since・until をUTCの日の始まりに切り下げた期間を返す（同じ日の実行で同じ期間になる）"""
+        def floor(value: Optional[datetime]) -> Optional[datetime]:
+            return value.replace(hour=0, minute=0, second=0, microsecond=0) if value is not None else None
+
+        return DateWindow(floor(self.since), floor(self.until))
+
+    def describe(self) -> str:
+        """期間を表示用の文字列にする"""
+        if self.is_unbounded:
+            return "全期間"
+        start = self.since.date().isoformat() if self.since else ""
+        end = ""
+        if self.until is not None:
+            end = datetime.fromtimestamp(self.until.timestamp() - 1, timezone.utc).date().isoformat()
+        return f"{start}〜{end}"
+
+
+def scan_pr_dates(head: bytes) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """
+    ファイル先頭から basic_info 直下の created_at / merged_at を取り出す
+
+    Returns:
+        (created_at, merged_at)。先頭だけでは判定できない場合はNone
+    """
+    start = head.find(b'"basic_info"')
+    if start < 0:
+        return None
+
+    depth = 0
+    entered = False
+    pending_key = None
+    found = {}
+
+    for match in _TOKEN_RE.finditer(head, start + len(b'"basic_info"')):
+        token = match.group(0)
+        if token in (b"{", b"["):
+            depth += 1
+            entered = True
+            pending_key = None
+        elif token in (b"}", b"]"):
+            depth -= 1
+            pending_key = None
+            if entered and depth == 0:
+                break
+        elif not entered:
+            continue
+        elif token == b"null":
+            if pending_key is not None:
+                found[pending_key] = None
+            pending_key = None
+        elif match.group(2):
+            key = match.group(1)
+            pending_key = key if depth == 1 and key in (b"created_at", b"merged_at") else None
+        else:
+            if pending_key is not None:
+                found[pending_key] = match.group(1).decode("utf-8", "replace")
+            pending_key = None
+
+        if len(found) == 2:
+            break
+    else:
+        return None
+
+    if b"created_at" not in found:
+        return None
+    if b"merged_at" not in found and not (entered and depth == 0):
+        return None
+    return found[b"created_at"], found.get(b"merged_at")
+
+
+class PRDateIndex:
+    """ファイル名・サイズ・mtimeをキーにPRの日付をキャッシュするインデックス"""
+
+    def __init__(self, index_path):
+        self.index_path = Path(index_path)
+        self.entries: Dict[str, list] = {}
+        self.dirty = False
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except Exception:
+                self.entries = {}
+
+    def get(self, name: str, size, mtime) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        if mtime is None:
+            return None
+        entry = self.entries.get(name)
+        if entry and entry[0] == size and entry[1] == mtime:
+            return entry[2], entry[3]
+        return None
+
+    def put(self, name: str, size, mtime, created_at, merged_at):
+        if mtime is None:
+            return
+        entry = [size, mtime, created_at, merged_at]
+        if self.entries.get(name) != entry:
+            self.entries[name] = entry
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(self.index_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+        self.dirty = False
@@ -12,15 +12,17 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from ..utils.github_api import load_config
+from ..utils.config_provider import get_config_provider
+from ..utils.metrics import increment, timed
 
 
 class UsageHistoryCollector:
     """Usage History収集クラス"""
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, provider=None):
         """初期化"""
-        self.config = config or load_config()
+        self.provider = provider or get_config_provider()
+        self.config = config or self.provider.get_config()
         self.usage_config = self.config.get("devin_usage", {})
 
     def load_usage_history_csv(self, file_path: str) -> List[Dict]:
@@ -47,6 +49,7 @@ class UsageHistoryCollector:
             
         except Exception as e:
             print(f"❌ Usage History読み込みエラー: {e}")
+            increment("parse_errors", source="usage_history")
         
         return usage_data
 
@@ -76,6 +79,7 @@ class UsageHistoryCollector:
             
         except Exception as e:
             print(f"❌ Usage History読み込みエラー: {e}")
+            increment("parse_errors", source="usage_history")
         
         return usage_data
 
@@ -101,6 +105,7 @@ class UsageHistoryCollector:
             return date_obj.strftime("%Y-%m-%d")
         except ValueError:
             print(f"⚠️ 日付解析失敗: {date_str}")
+            increment("parse_errors", source="usage_date")
             return None
 
     def analyze_pr_related_sessions(self, usage_data: List[Dict], devin_prs: List[Dict]) -> Dict:
@@ -172,6 +177,7 @@ class UsageHistoryCollector:
             "daily_summary": daily_summary
         }
 
+    @timed("load_usage_data")
     def load_usage_data(self, file_path: Optional[str] = None) -> List[Dict]:
         """Usage Historyデータを読み込む（自動形式判定）"""
         if not file_path:
@@ -183,9 +189,14 @@ class UsageHistoryCollector:
             return []
         
         if file_path.endswith('.csv'):
-            return self.load_usage_history_csv(file_path)
+            usage_data = self.load_usage_history_csv(file_path)
         elif file_path.endswith('.json'):
-            return self.load_usage_history_json(file_path)
+            usage_data = self.load_usage_history_json(file_path)
         else:
             print(f"❌ サポートされていないファイル形式: {file_path}")
             return []
+        
+        increment("files_read", source="usage_history")
+        increment("bytes_read", os.path.getsize(file_path), source="usage_history")
+        increment("usage_sessions", len(usage_data))
+        return usage_data
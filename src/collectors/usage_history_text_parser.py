@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Usage Historyテキストのストリーミング解析
+
+Devinダッシュボードから貼り付けたUsage Historyのテキストを1行ずつ解析し、セッションが確定するたびに返します。
+レイアウトは先頭のレコードから判定します。
+
+- text: 各セッションの後に "View session" 行がある形式（セッション名・作成日・ACU・View session）
+- structured: セッション名・作成日・ACUが区切り行なしで続く形式
+
+解析結果はCSVまたはSQLiteに逐次書き込めます（入力全体をメモリに読み込まない）。
+"""
+
+import csv
+import itertools
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..utils.file_utils import atomic_open
+
+DATE_PATTERN = re.compile(r"^[A-Za-z]+ \d{1,2}, \d{4}$")
+ACU_PATTERN = re.compile(r"^\d+\.?\d*$")
+HEADER_LINES = frozenset(["session", "created at", "acus used"])
+VIEW_SESSION = "view session"
+
+CSV_FIELDNAMES = ["Session", "Created At", "ACUs Used"]
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+
+class EmptyUsageHistoryError(Exception):
+    """入力からセッションを1件も解析できなかった場合の例外"""
+
+
+class _TextLayout:
+    """"View session" 行で区切られたレイアウト"""
+
+    def __init__(self, stats: Dict):
+        self.stats = stats
+        self.current: Dict = {}
+        self.current_lines = 0
+        self.state = "waiting_for_session"
+
+    def feed(self, line: str, lowered: str) -> Optional[Dict]:
+        if VIEW_SESSION in lowered:
+            self.stats["ignored_lines"] += 1
+            record = self._close()
+            self.state = "waiting_for_session"
+            return record
+
+        self.current_lines += 1
+        if self.state == "waiting_for_session":
+            self.current = {"session_name": line}
+            self.state = "waiting_for_date"
+        elif self.state == "waiting_for_date":
+            if DATE_PATTERN.match(line):
+                self.current["created_at"] = line
+                self.state = "waiting_for_acu"
+            else:
+                self.current["session_name"] += " " + line
+        elif ACU_PATTERN.match(line):
+            self.current["acus_used"] = float(line)
+        elif DATE_PATTERN.match(line):
+            self.current["created_at"] = line
+        else:
+            self.current_lines -= 1
+            self.stats["skipped_lines"] += 1
+        return None
+
+    def finish(self) -> Optional[Dict]:
+        return self._close()
+
+    def _close(self) -> Optional[Dict]:
+        record, lines = self.current, self.current_lines
+        self.current, self.current_lines = {}, 0
+        # session_name は必ずあるため、作成日とACUが揃っていれば完成
+        if "acus_used" in record and "created_at" in record:
+            return record
+        if lines:
+            self.stats["skipped_lines"] += lines
+            self.stats["incomplete_records"] += 1
+        return None
+
+
+class _StructuredLayout:
+    """セッション名・作成日・ACUが区切りなしで続くレイアウト"""
+
+    def __init__(self, stats: Dict):
+        self.stats = stats
+        self.current: Optional[Dict] = None
+        self.current_lines = 0
+
+    def feed(self, line: str, lowered: str) -> Optional[Dict]:
+        if self.current is None:
+            self.current = {"session_name": line}
+            self.current_lines = 1
+        elif "created_at" not in self.current:
+            if DATE_PATTERN.match(line):
+                self.current["created_at"] = line
+            else:
+                self.current["session_name"] += " " + line
+            self.current_lines += 1
+        elif ACU_PATTERN.match(line):
+            record = self.current
+            record["acus_used"] = float(line)
+            self.current, self.current_lines = None, 0
+            return record
+        else:
+            self.stats["skipped_lines"] += 1
+        return None
+
+    def finish(self) -> Optional[Dict]:
+        if self.current is not None:
+            self.stats["skipped_lines"] += self.current_lines
+            self.stats["incomplete_records"] += 1
+            self.current, self.current_lines = None, 0
+        return None
+
+
+LAYOUTS = {"text": _TextLayout, "structured": _StructuredLayout}
+
+
+class UsageHistoryTextParser:
+    """Usage Historyテキストを1行ずつ解析するクラス"""
+
+    def __init__(self, layout: str = "auto", detect_records: int = 3, detect_max_lines: int = 1000):
+        """
+        初期化
+
+        Args:
+            layout: "auto"（先頭から判定）、"text"、"structured"
+            detect_records: 区切り行がないまま、この件数のレコードが揃えば structured と判定する
+            detect_max_lines: 判定のために先読みする最大行数
+        """
+        if layout not in ("auto", *LAYOUTS):
+            raise ValueError(f"不明なレイアウトです: {layout}")
+        self.layout = layout
+        self.detect_records = detect_records
+        self.detect_max_lines = detect_max_lines
+        self.stats = self._new_stats()
+
+    @staticmethod
+    def _new_stats() -> Dict:
+        return {"layout": None, "lines": 0, "records": 0, "ignored_lines": 0, "skipped_lines": 0,
+                "incomplete_records": 0}
+
+    def parse(self, lines: Iterable[str]) -> Iterator[Dict]:
+        """
+        行を順に解析し、確定したセッションを返す
+
+        Args:
+            lines: 入力の行（ファイルオブジェクトや標準入力をそのまま渡せる）
+
+        Yields:
+            session_name, created_at, acus_used を持つセッション
+        """
+        self.stats = stats = self._new_stats()
+        lines = iter(lines)
+
+        layout, buffered = self.layout, []
+        if layout == "auto":
+            layout, buffered = self._detect_layout(lines)
+        stats["layout"] = layout
+
+        state = LAYOUTS[layout](stats)
+        feed = state.feed
+        line_count = ignored = 0
+        try:
+            for raw_line in itertools.chain(buffered, lines):
+                line_count += 1
+                line = raw_line.strip()
+                if not line:
+                    ignored += 1
+                    continue
+                lowered = line.lower()
+                if lowered in HEADER_LINES:
+                    ignored += 1
+                    continue
+                record = feed(line, lowered)
+                if record is not None:
+                    stats["records"] += 1
+                    yield record
+        finally:
+            stats["lines"] += line_count
+            stats["ignored_lines"] += ignored
+
+        record = state.finish()
+        if record is not None:
+            stats["records"] += 1
+            yield record
+
+    def _detect_layout(self, lines: Iterator[str]) -> Tuple[str, List[str]]:
+        """先頭の行からレイアウトを判定する（先読みした行も返す）"""
+        probe = _StructuredLayout(self._new_stats())
+        buffered = []
+        records = 0
+        for raw_line in lines:
+            buffered.append(raw_line)
+            line = raw_line.strip()
+            lowered = line.lower()
+            if not line or lowered in HEADER_LINES:
+                continue
+            if VIEW_SESSION in lowered:
+                return "text", buffered
+            if probe.feed(line, lowered) is not None:
+                records += 1
+            if records >= self.detect_records or len(buffered) >= self.detect_max_lines:
+                break
+        return "structured", buffered
+
+    def describe(self) -> str:
+        """解析結果の要約"""
+        stats = self.stats
+        return (f"{stats['lines']}行を解析（レイアウト: {stats['layout']}）: "
+                f"セッション{stats['records']}件、空行・見出し・区切り{stats['ignored_lines']}行、"
+                f"スキップ{stats['skipped_lines']}行（不完全なレコード{stats['incomplete_records']}件）")
+
+
+class UsageCSVWriter:
+    """セッションをUsage History形式のCSVに1行ずつ書き込むクラス"""
+
+    def __init__(self, f):
+        self.writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+        self.writer.writeheader()
+        self.count = 0
+
+    def write(self, session: Dict):
+        """セッションを1件書き込む"""
+        self.writer.writerow({
+            "Session": session.get("session_name", ""),
+            "Created At": session.get("created_at", ""),
+            "ACUs Used": session.get("acus_used", 0),
+        })
+        self.count += 1
+
+
+class UsageSQLiteWriter:
+    """セッションをSQLiteのテーブルに1行ずつ書き込むクラス"""
+
+    def __init__(self, connection, table: str = "usage_history"):
+        if not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", table):
+            raise ValueError(f"テーブル名に使えない文字が含まれています: {table}")
+        self.connection = connection
+        self.table = table
+        self.count = 0
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (session_name TEXT NOT NULL, created_at TEXT NOT NULL, "
+            "acus_used REAL NOT NULL)"
+        )
+        connection.execute(f"DELETE FROM {table}")
+
+    def write(self, session: Dict):
+        """セッションを1件書き込む"""
+        self.connection.execute(
+            f"INSERT INTO {self.table} (session_name, created_at, acus_used) VALUES (?, ?, ?)",
+            (session["session_name"], session["created_at"], session["acus_used"]),
+        )
+        self.count += 1
+
+
+def output_format_for(output_file: str) -> str:
+    """出力ファイルの拡張子から形式（csv / sqlite）を判定する"""
+    return "sqlite" if Path(output_file).suffix.lower() in SQLITE_SUFFIXES else "csv"
+
+
+@contextmanager
+def open_usage_writer(output_file: str, output_format: Optional[str] = None, table: str = "usage_history"):
+    """
+    セッションの書き込み先を開く
+
+    CSVは一時ファイルに書き込んで完了時に置き換え、SQLiteは1トランザクションでテーブルを置き換えるため、
+    途中で失敗した場合（EmptyUsageHistoryError を含む）は既存の出力がそのまま残る。
+
+    Args:
+        output_file: 出力ファイルのパス
+        output_format: "csv" / "sqlite"（省略時は拡張子から判定）
+        table: SQLiteのテーブル名
+    """
+    output_format = output_format or output_format_for(output_file)
+    if output_format == "csv":
+        with atomic_open(output_file, "w", newline="") as f:
+            yield UsageCSVWriter(f)
+        return
+
+    import sqlite3
+
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(output_file)
+    try:
+        with connection:
+            yield UsageSQLiteWriter(connection, table)
+    finally:
+        connection.close()
@@ -0,0 +1,201 @@
+"""
+Devin統計分析コマンド（devin-stat analyze）
+
+既存のPRデータからDevin統計を分析し、レポートを生成します。
+"""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from ..collectors.devin_pr_collector import DevinPRCollector
+from ..collectors.devin_api_client import DevinAPIClient
+from ..collectors.github_graphql_pr_collector import GitHubGraphQLPRCollector
+from ..collectors.pr_date_filter import DateWindow
+from ..collectors.usage_history_collector import UsageHistoryCollector
+from ..analyzers.devin_stats_analyzer import DevinStatsAnalyzer
+from ..generators.dashboard_generator import DashboardGenerator
+from ..generators.devin_report_generator import DevinReportGenerator
+from ..generators.report_build_cache import ReportBuildCache
+from ..utils.background import BackgroundTask
+from ..utils.config_provider import get_config_provider
+
+
+def add_arguments(parser):
+    """コマンドライン引数を定義する"""
+    parser.add_argument(
+        "--pr-data-dir",
+        help="PRデータのパス（ディレクトリ、tar.gz/tar.zst/zipアーカイブ、またはgitリポジトリ）",
+        default=None
+    )
+    parser.add_argument(
+        "--pr-data-ref",
+        help="gitリポジトリから読む場合の参照（ブランチ・タグ・コミット）",
+        default=None
+    )
+    parser.add_argument(
+        "--pr-source",
+        help="PRデータの取得元（pr-data: チェックアウト済みディレクトリ, graphql: GitHub検索API）",
+        choices=["pr-data", "graphql"],
+        default="pr-data"
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="出力ディレクトリのパス",
+        default="./reports"
+    )
+    parser.add_argument(
+        "--save-raw-data",
+        help="生のDevin PRデータを保存する",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--console-only",
+        help="コンソール出力のみ（ファイル保存なし）",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--dashboard",
+        help="静的HTMLダッシュボード（月別JSONシャード）も生成する",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--force",
+        help="入力に変更がなくてもすべてのレポートを再生成する",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--since",
+        help="この日付以降に作成・マージされたPRのみ分析する（YYYY-MM-DD）"
+    )
+    parser.add_argument(
+        "--until",
+        help="この日付までに作成・マージされたPRのみ分析する（YYYY-MM-DD、当日を含む）"
+    )
+    parser.add_argument(
+        "--days",
+        help="直近N日間のみ分析する（--sinceの代わり）",
+        type=int
+    )
+    parser.add_argument(
+        "--usage-file",
+        help="Usage HistoryファイルのパスCSV/JSON形式）"
+    )
+
+
+def build_date_window(args) -> DateWindow:
+    """コマンドライン引数から分析期間を作成する"""
+    since = None
+    until = None
+    if args.days:
+        since = datetime.now(timezone.utc) - timedelta(days=args.days)
+    if args.since:
+        since = datetime.fromisoformat(args.since).replace(tzinfo=timezone.utc)
+    if args.until:
+        until = datetime.fromisoformat(args.until).replace(tzinfo=timezone.utc) + timedelta(days=1)
+    return DateWindow(since, until)
+
+
+def run(args):
+    """メイン関数"""
+    date_window = build_date_window(args)
+    provider = get_config_provider()
+    config = provider.get_config()
+    
+    print("=== Devin統計分析開始 ===")
+    
+    # API統計の取得はネットワーク待ちが中心のため、PRデータの解析・分析と並行して進め、
+    # レポート生成の直前に結果を受け取る
+    api_client = DevinAPIClient(config, provider)
+    api_task = BackgroundTask(
+        "Devin API統計取得", api_client.analyze_pr_related_sessions,
+        deadline=config["devin_api"].get("fetch_deadline", 60)
+    )
+    
+    print("\n1. Devin PRデータ収集中...")
+    collector = DevinPRCollector(config, provider)
+    if args.pr_source == "graphql":
+        devin_prs = GitHubGraphQLPRCollector(config, provider).collect_devin_prs()
+        devin_prs = [pr for pr in devin_prs if date_window.matches_pr(pr)]
+    else:
+        devin_prs = collector.collect_devin_prs(
+            args.pr_data_dir, args.pr_data_ref, date_window.since, date_window.until
+        )
+    
+    if not devin_prs:
+        print("❌ Devin作成PRが見つかりませんでした")
+        return
+    
+    summary = collector.get_devin_pr_summary(devin_prs)
+    print(f"\n📊 基本統計:")
+    print(f"  - 総PR数: {summary['total']}件")
+    print(f"  - マージ済み: {summary['merged']}件")
+    print(f"  - オープン: {summary['open']}件")
+    print(f"  - クローズ: {summary['closed']}件")
+    print(f"  - 成功率: {summary['success_rate']:.1f}%")
+    
+    if args.save_raw_data and not args.console_only:
+        raw_data_file = Path(args.output_dir) / "devin_prs_raw.json"
+        collector.save_devin_prs(devin_prs, str(raw_data_file))
+    
+    print("\n2. 詳細統計分析中...")
+    analyzer = DevinStatsAnalyzer(config, provider)
+    
+    usage_data = None
+    if args.usage_file:
+        print(f"3. Usage Historyデータ読み込み中: {args.usage_file}")
+        usage_collector = UsageHistoryCollector(config, provider)
+        usage_data = usage_collector.load_usage_data(args.usage_file)
+        if usage_data:
+            print(f"   ✅ {len(usage_data)}件のセッションデータを読み込みました")
+        else:
+            print("   ⚠️ Usage Historyデータの読み込みに失敗しました")
+    else:
+        print("3. Usage Historyファイルが指定されていません（推定値を使用）")
+    
+    analysis = analyzer.generate_comprehensive_analysis(devin_prs, usage_data, date_window)
+    
+    print("\n4. Devin API統計取得中...")
+    api_data = api_task.result()
+    if api_data is None:
+        api_data = DevinAPIClient.unavailable_session_stats(
+            {"state": "failed" if api_task.done() else "deadline_exceeded"}
+        )
+    
+    if api_data.get("api_available"):
+        print(f"  ✅ API接続成功: {api_data['total_pr_sessions']}セッション")
+    else:
+        api_status = api_data.get("api_status", {})
+        if api_status.get("state") == "deadline_exceeded":
+            print("  ⚠️ API応答待ちの期限を超えたため、API統計なしでレポートを生成します")
+        elif api_status.get("state") == "failed":
+            print("  ⚠️ API統計の取得に失敗しました")
+        elif api_status.get("state") == "open":
+            print(f"  ⚠️ API接続不可（サーキットオープン中、再試行まで{api_status['retry_in_seconds']:.0f}秒）")
+        else:
+            print("  ⚠️ API接続不可（DEVIN_API_TOKENが未設定）")
+    
+    print("\n5. レポート生成中...")
+    generator = DevinReportGenerator(config, provider)
+    
+    if args.console_only:
+        daily_report = generator.generate_daily_report(analysis, api_data)
+        print("\n" + "="*50)
+        print(daily_report)
+    else:
+        reports = generator.generate_all_reports(analysis, api_data, args.output_dir, use_cache=not args.force)
+        print(f"  ✅ 日次レポート: {reports['daily_report']}")
+        print(f"  ✅ 月次サマリー: {reports['monthly_summary']}")
+        
+        build_cache = None if args.force else ReportBuildCache(args.output_dir)
+        analysis_file = Path(args.output_dir) / "devin_analysis.json"
+        analyzer.save_analysis_results(analysis, str(analysis_file), build_cache)
+        if build_cache is not None:
+            build_cache.save()
+        print(f"  ✅ 分析結果: {analysis_file}")
+        
+        if args.dashboard:
+            dashboard_dir = Path(args.output_dir) / config.get("reporting", {}).get("dashboard", {}).get("dir", "dashboard")
+            DashboardGenerator(config, provider).generate_dashboard(analysis, str(dashboard_dir))
+            print(f"  ✅ ダッシュボード: {dashboard_dir / 'index.html'}")
+    
+    print("\n=== 分析完了 ===")
@@ -0,0 +1,95 @@
+"""
+日次レポート一括再生成コマンド（devin-stat backfill）
+
+PRデータを1回だけ読み込んで日別の累積値を作成し、
+指定期間の各日について「その日時点の」日次レポートをまとめて生成します。
+devin_patterns を修正した後などに、過去のレポートを作り直すために使います。
+"""
+
+import time
+from datetime import date
+
+from ..collectors.devin_pr_collector import DevinPRCollector
+from ..collectors.usage_history_collector import UsageHistoryCollector
+from ..analyzers.devin_backfill_analyzer import DailySnapshotIndex
+from ..generators.devin_report_generator import DevinReportGenerator
+from ..utils.config_provider import get_config_provider
+
+
+def add_arguments(parser):
+    """コマンドライン引数を定義する"""
+    parser.add_argument(
+        "--pr-data-dir",
+        help="PRデータのパス（ディレクトリ、tar.gz/tar.zst/zipアーカイブ、またはgitリポジトリ）",
+        default=None
+    )
+    parser.add_argument(
+        "--pr-data-ref",
+        help="gitリポジトリから読む場合の参照（ブランチ・タグ・コミット）",
+        default=None
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="出力ディレクトリのパス（省略時は data.reports_dir）",
+        default=None
+    )
+    parser.add_argument(
+        "--since",
+        help="この日以降のレポートを生成する（YYYY-MM-DD、省略時は最初のPR作成日）"
+    )
+    parser.add_argument(
+        "--until",
+        help="この日までのレポートを生成する（YYYY-MM-DD、省略時は今日）"
+    )
+    parser.add_argument(
+        "--usage-file",
+        help="Usage HistoryファイルのパスCSV/JSON形式、省略時は推定値）"
+    )
+    parser.add_argument(
+        "--workers",
+        help="レンダリングに使うプロセス数（省略時は reporting.backfill_workers）",
+        type=int,
+        default=None
+    )
+
+
+def run(args):
+    """メイン関数"""
+    provider = get_config_provider()
+    config = provider.get_config()
+
+    output_dir = args.output_dir or config["data"]["reports_dir"]
+    since = date.fromisoformat(args.since) if args.since else None
+    until = date.fromisoformat(args.until) if args.until else date.today()
+    workers = args.workers or config.get("reporting", {}).get("backfill_workers") or None
+
+    print("=== Devin日次レポート一括再生成 ===")
+
+    print("\n1. Devin PRデータ収集中...")
+    collector = DevinPRCollector(config, provider)
+    devin_prs = collector.collect_devin_prs(args.pr_data_dir, args.pr_data_ref)
+    if not devin_prs:
+        print("❌ Devin作成PRが見つかりませんでした")
+        return
+
+    usage_data = None
+    if args.usage_file:
+        usage_data = UsageHistoryCollector(config, provider).load_usage_data(args.usage_file)
+
+    print("\n2. 日別累積値を作成中...")
+    started = time.perf_counter()
+    index = DailySnapshotIndex(devin_prs, usage_data, config, provider)
+    days = index.days(since, until)
+    if not days:
+        print("⚠️ 対象期間にレポートを生成できる日がありません")
+        return
+    snapshots = [(day, index.snapshot(day)) for day in days]
+    print(f"  ✅ {days[0]}〜{days[-1]} の{len(days)}日分 ({time.perf_counter() - started:.2f}秒)")
+
+    print("\n3. 日次レポート生成中...")
+    started = time.perf_counter()
+    generator = DevinReportGenerator(config, provider)
+    written = generator.generate_backfill_reports(snapshots, output_dir, max_workers=workers)
+    print(f"  ✅ {len(written)}件のレポートを {output_dir} に生成しました ({time.perf_counter() - started:.2f}秒)")
+
+    print("\n=== 一括再生成完了 ===")
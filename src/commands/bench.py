@@ -0,0 +1,132 @@
+"""
+ベンチマークコマンド（devin-stat bench）
+
+合成データ（PRデータ・Usage History・ブラウザ収集データ）を生成して各処理の実行時間を計測し、
+結果をJSONで保存します。ベースラインと比較して遅くなった処理があれば終了コード1を返します。
+`--suite api` では Devin / GitHub APIの代替サーバーに対してAPIクライアントのスループットとレイテンシを計測します。
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+from ..bench.runner import BenchmarkSuite, compare_results, load_results, save_results
+from ..utils.config_provider import get_config_provider
+
+
+def add_arguments(parser):
+    """コマンドライン引数を定義する"""
+    parser.add_argument(
+        "--suite",
+        help="data: 合成データに対する各処理, api: 代替APIサーバーに対するAPIクライアント",
+        choices=["data", "api"],
+        default="data"
+    )
+    parser.add_argument(
+        "--sizes",
+        help="PR件数（カンマ区切り、1000〜1000000、省略時は bench.sizes）。--suite api ではセッション数・PR数（省略時は bench.api.sizes）"
+    )
+    parser.add_argument(
+        "--only",
+        help="実行するベンチマーク名（複数指定可）",
+        action="append"
+    )
+    parser.add_argument(
+        "--rounds",
+        help="各ベンチマークの計測回数（省略時は bench.rounds）",
+        type=int
+    )
+    parser.add_argument(
+        "--data-dir",
+        help="合成データの保存先（省略時は data.temp_dir/bench）"
+    )
+    parser.add_argument(
+        "--output",
+        help="結果の保存先（省略時は bench.results_dir/bench_YYYYmmdd_HHMMSS.json）"
+    )
+    parser.add_argument(
+        "--baseline",
+        help="比較するベースラインのJSON（省略時は bench.baseline_file）"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        help="結果をベースラインとして保存する",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--threshold",
+        help="ベースラインよりこの割合を超えて遅ければ回帰とする（省略時は bench.regression_threshold）",
+        type=float
+    )
+    parser.add_argument(
+        "--generate-only",
+        help="合成データの生成だけを行う",
+        action="store_true"
+    )
+
+
+def run(args):
+    """ベンチマークのメイン処理"""
+    provider = get_config_provider()
+    config = provider.get_config()
+    bench_config = config.get("bench", {})
+
+    rounds = args.rounds or bench_config.get("rounds", 5)
+    threshold = args.threshold if args.threshold is not None else bench_config.get("regression_threshold", 0.2)
+
+    if args.suite == "api":
+        from ..bench.api_bench import APIBenchmarkSuite
+
+        api_config = bench_config.get("api", {})
+        sizes = [int(size) for size in args.sizes.split(",")] if args.sizes else api_config.get("sizes", [1000])
+        baseline_file = args.baseline or api_config.get("baseline_file", "./benchmarks/api_baseline.json")
+        suite = APIBenchmarkSuite(config, provider, rounds=rounds, warmup=bench_config.get("warmup", 1))
+    else:
+        sizes = [int(size) for size in args.sizes.split(",")] if args.sizes else bench_config.get("sizes", [1000])
+        baseline_file = args.baseline or bench_config.get("baseline_file", "./benchmarks/baseline.json")
+        suite = BenchmarkSuite(
+            config, provider,
+            data_dir=args.data_dir,
+            rounds=rounds,
+            warmup=bench_config.get("warmup", 1),
+        )
+
+    if args.generate_only:
+        if args.suite != "data":
+            print("❌ --generate-only は --suite data でのみ使用できます")
+            return 1
+        for size in sizes:
+            paths = suite.prepare(size)
+            print(f"✅ PR {size}件: {paths['pr_dir']}")
+        return 0
+
+    print(f"=== ベンチマーク開始（{args.suite}: {', '.join(str(size) for size in sizes)}件） ===")
+    results = suite.run(sizes, args.only)
+
+    output_file = args.output or Path(bench_config.get("results_dir", "./benchmarks/results")) / \
+        f"bench_{args.suite}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    save_results(results, output_file)
+    print(f"✅ 結果を保存しました: {output_file}")
+
+    if args.save_baseline:
+        save_results(results, baseline_file)
+        print(f"✅ ベースラインを更新しました: {baseline_file}")
+        return 0
+
+    baseline = load_results(baseline_file)
+    if baseline is None:
+        print(f"⚠️ ベースラインがありません（--save-baseline で作成）: {baseline_file}")
+        return 0
+
+    comparisons = compare_results(results, baseline, threshold, bench_config.get("min_delta_ms", 5) / 1000)
+    regressions = [comparison for comparison in comparisons if comparison["regression"]]
+    print(f"\n📊 ベースライン比較（{baseline.get('environment', {}).get('commit') or '不明'}、しきい値 +{threshold:.0%}）")
+    for comparison in comparisons:
+        mark = "❌" if comparison["regression"] else "✅"
+        print(f"  {mark} {comparison['size']:>8}件 {comparison['name']:<40} "
+              f"{comparison['baseline'] * 1000:9.1f}ms → {comparison['current'] * 1000:9.1f}ms "
+              f"({comparison['ratio'] - 1:+.1%})")
+
+    if regressions:
+        print(f"❌ {len(regressions)}件の処理がベースラインより遅くなっています")
+        return 1
+    return 0
@@ -0,0 +1,86 @@
+"""
+Usage History変換コマンド（devin-stat convert-usage）
+
+テキスト形式のUsage Historyデータを1行ずつ解析し、CSVまたはSQLiteに逐次保存します。
+"""
+
+import sys
+
+from ..collectors.usage_history_text_parser import (
+    EmptyUsageHistoryError,
+    UsageHistoryTextParser,
+    open_usage_writer,
+    output_format_for,
+)
+
+# 設定ファイルを使わないため、起動時に設定・ログ・メトリクスを読み込まない（--profile 指定時を除く）
+USES_CONFIG = False
+
+
+def add_arguments(parser):
+    """コマンドライン引数を定義する"""
+    parser.add_argument(
+        "input_file",
+        help="Usage Historyのテキストファイル（- で標準入力）"
+    )
+    parser.add_argument(
+        "output_file",
+        help="出力ファイルのパス（.db / .sqlite / .sqlite3 ならSQLite）",
+        nargs="?",
+        default="./data/usage_history.csv"
+    )
+    parser.add_argument(
+        "--format",
+        help="出力形式（省略時は出力ファイルの拡張子から判定）",
+        choices=["csv", "sqlite"],
+        default=None
+    )
+    parser.add_argument(
+        "--table",
+        help="SQLiteに出力する場合のテーブル名",
+        default="usage_history"
+    )
+    parser.add_argument(
+        "--layout",
+        help="入力のレイアウト（auto: 先頭のレコードから判定, text: View session区切り, structured: 区切りなし）",
+        choices=["auto", "text", "structured"],
+        default="auto"
+    )
+
+
+def run(args):
+    """メイン処理"""
+    input_file = args.input_file
+    output_file = args.output_file
+
+    print("Usage Historyテキストを解析中...")
+
+    parser = UsageHistoryTextParser(layout=args.layout)
+    source = sys.stdin if input_file == '-' else open(input_file, 'r', encoding='utf-8')
+    try:
+        with open_usage_writer(output_file, args.format, args.table) as writer:
+            for session in parser.parse(source):
+                writer.write(session)
+                if writer.count <= 3:  # 最初の3件を表示
+                    print(f"  {writer.count}. {session.get('session_name', 'N/A')}")
+                    print(f"     日付: {session.get('created_at', 'N/A')}")
+                    print(f"     ACU: {session.get('acus_used', 'N/A')}")
+            if writer.count == 0:
+                raise EmptyUsageHistoryError()
+    except EmptyUsageHistoryError:
+        print(f"📊 {parser.describe()}")
+        print("❌ Usage Historyデータを解析できませんでした")
+        print("入力データの形式を確認してください")
+        sys.exit(1)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    if writer.count > 3:
+        print(f"  ... 他 {writer.count - 3} 件")
+    print(f"📊 {parser.describe()}")
+    print(f"✅ {writer.count}件のセッションを {output_file} に保存しました")
+
+    if (args.format or output_format_for(output_file)) == "csv":
+        print(f"\n次のコマンドで統計分析を実行できます:")
+        print(f"devin-stat analyze --usage-file {output_file}")
@@ -0,0 +1,113 @@
+"""
+日次レポート生成コマンド（devin-stat daily-report）
+
+GitHub Actionsから呼び出される日次レポート生成用コマンド
+"""
+
+import os
+import sys
+from datetime import datetime
+
+from ..collectors.devin_pr_collector import DevinPRCollector
+from ..collectors.devin_api_client import DevinAPIClient
+from ..collectors.devin_session_store import DevinSessionStore
+from ..analyzers.devin_stats_analyzer import DevinStatsAnalyzer
+from ..generators.devin_report_generator import DevinReportGenerator
+from ..generators.report_build_cache import ReportBuildCache, daily_report_inputs
+from ..utils.background import BackgroundTask
+from ..utils.config_provider import get_config_provider
+
+
+def fetch_session_stats(api_client: DevinAPIClient, session_store: DevinSessionStore):
+    """セッションを差分同期し、過去7日分のPR関連セッションを分析する"""
+    sync_result = api_client.sync_sessions(session_store)
+    api_data = api_client.analyze_pr_related_sessions(days_back=7, store=session_store)  # 過去7日分
+    return sync_result, api_data
+
+
+def add_arguments(parser):
+    """コマンドライン引数を定義する（オプションなし）"""
+
+
+def run(args):
+    """日次レポート生成メイン処理"""
+    print(f"=== Devin日次レポート生成 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ===")
+    
+    try:
+        provider = get_config_provider()
+        config = provider.get_config()
+        
+        reports_dir = config["data"]["reports_dir"]
+        os.makedirs(reports_dir, exist_ok=True)
+        
+        # セッション同期はネットワーク待ちが中心のため、PRデータの解析・分析と並行して進める
+        api_client = DevinAPIClient(config, provider)
+        session_store = DevinSessionStore(config["devin_api"]["session_store"])
+        session_task = BackgroundTask(
+            "Devinセッション同期", fetch_session_stats, api_client, session_store,
+            deadline=config["devin_api"].get("fetch_deadline", 60)
+        )
+        
+        print("1. Devin PRデータ収集...")
+        collector = DevinPRCollector(config, provider)
+        devin_prs = collector.collect_devin_prs()
+        
+        if not devin_prs:
+            print("⚠️ Devin作成PRが見つかりませんでした")
+            empty_analysis = {"error": "Devin作成PRが見つかりませんでした"}
+            generator = DevinReportGenerator(config, provider)
+            daily_report = generator.generate_daily_report(empty_analysis)
+            
+            report_file = os.path.join(reports_dir, f"daily_report_{datetime.now().strftime('%Y%m%d')}.md")
+            generator.save_report(daily_report, report_file)
+            print(f"空のレポートを生成: {report_file}")
+            return
+        
+        summary = collector.get_devin_pr_summary(devin_prs)
+        print(f"📊 基本統計: 総{summary['total']}件, マージ済み{summary['merged']}件")
+        
+        print("2. 統計分析実行...")
+        analyzer = DevinStatsAnalyzer(config, provider)
+        analysis = analyzer.generate_comprehensive_analysis(devin_prs)
+        
+        print("3. Devin API統計取得...")
+        session_stats = session_task.result()
+        if session_stats is not None:
+            sync_result, api_data = session_stats
+            if "error" in sync_result:
+                print(f"   ⚠️ セッション同期を中断しました: {sync_result['error']}")
+            elif sync_result["api_available"]:
+                print(f"   セッション同期: 新規{sync_result['inserted']}件, 更新{sync_result['updated']}件")
+        else:
+            api_data = DevinAPIClient.unavailable_session_stats(
+                {"state": "failed" if session_task.done() else "deadline_exceeded"}
+            )
+        
+        print("4. 日次レポート生成...")
+        generator = DevinReportGenerator(config, provider)
+        build_cache = ReportBuildCache(reports_dir)
+        
+        report_file = os.path.join(reports_dir, f"daily_report_{datetime.now().strftime('%Y%m%d')}.md")
+        generator.build_report(
+            build_cache, generator.write_daily_report, report_file,
+            daily_report_inputs(analysis), analysis, api_data
+        )
+        
+        analysis_file = os.path.join(reports_dir, f"analysis_{datetime.now().strftime('%Y%m%d')}.json")
+        analyzer.save_analysis_results(analysis, analysis_file, build_cache)
+        build_cache.save()
+        
+        print(f"✅ 日次レポート生成完了: {report_file}")
+        print(f"✅ 分析結果保存: {analysis_file}")
+        
+        if os.getenv("GITHUB_ACTIONS"):
+            print(f"::set-output name=report_file::{report_file}")
+            print(f"::set-output name=total_prs::{summary['total']}")
+            print(f"::set-output name=merged_prs::{summary['merged']}")
+            print(f"::set-output name=success_rate::{summary['success_rate']:.1f}")
+        
+    except Exception as e:
+        print(f"❌ エラーが発生しました: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
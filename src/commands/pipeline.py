@@ -0,0 +1,86 @@
+"""
+統計パイプライン実行コマンド（devin-stat pipeline）
+
+PR収集 → 分析 → レポート生成をパイプラインとして実行します。
+入力が変わっていないステージは前回の成果物を再利用し、独立したステージは並行して実行します。
+"""
+
+from ..pipeline.stats_pipeline import build_stats_pipeline
+from ..utils.config_provider import get_config_provider
+from .analyze import build_date_window
+
+
+def add_arguments(parser):
+    """コマンドライン引数を定義する"""
+    parser.add_argument(
+        "--pr-data-dir",
+        help="PRデータのパス（ディレクトリ、tar.gz/tar.zst/zipアーカイブ、またはgitリポジトリ）",
+        default=None
+    )
+    parser.add_argument(
+        "--pr-data-ref",
+        help="gitリポジトリから読む場合の参照（ブランチ・タグ・コミット）",
+        default=None
+    )
+    parser.add_argument(
+        "--usage-file",
+        help="Usage HistoryファイルのパスCSV/JSON形式）"
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="出力ディレクトリのパス（省略時は data.reports_dir）",
+        default=None
+    )
+    parser.add_argument(
+        "--since",
+        help="この日付以降に作成・マージされたPRのみ分析する（YYYY-MM-DD）"
+    )
+    parser.add_argument(
+        "--until",
+        help="この日付までに作成・マージされたPRのみ分析する（YYYY-MM-DD、当日を含む）"
+    )
+    parser.add_argument(
+        "--days",
+        help="直近N日間のみ分析する（--sinceの代わり）",
+        type=int
+    )
+    parser.add_argument(
+        "--target",
+        help="指定したステージ（と依存先）だけを実行する（複数指定可）",
+        action="append"
+    )
+    parser.add_argument(
+        "--force",
+        help="キャッシュを使わずにすべてのステージを実行する",
+        action="store_true"
+    )
+
+
+def run(args):
+    """メイン関数"""
+    provider = get_config_provider()
+    config = provider.get_config()
+    
+    print("=== Devin統計パイプライン開始 ===")
+    pipeline = build_stats_pipeline(
+        config, provider,
+        pr_data_dir=args.pr_data_dir,
+        pr_data_ref=args.pr_data_ref,
+        usage_file=args.usage_file,
+        output_dir=args.output_dir,
+        date_window=build_date_window(args),
+    )
+    result = pipeline.run(targets=args.target, force=args.force)
+    
+    print("\n📊 ステージ実行結果:")
+    for name, elapsed in result["timings"].items():
+        status = "キャッシュ" if name in result["cached"] else "実行"
+        print(f"  - {name}: {status} ({elapsed:.2f}秒)")
+    
+    reports = result["artifacts"].get("reports")
+    if reports:
+        print(f"  ✅ 日次レポート: {reports['daily_report']}")
+        print(f"  ✅ 月次サマリー: {reports['monthly_summary']}")
+        print(f"  ✅ 分析結果: {reports['analysis']}")
+    
+    print("\n=== パイプライン完了 ===")
@@ -0,0 +1,73 @@
+"""
+ローカルHTTP API（devin-stat serve）
+
+Devin PRとUsage Historyをメモリ上にインデックスして、期間指定の統計をJSONで返します。
+他のツールから `analyze --console-only` の出力を解析する代わりに使います。
+
+例:
+    curl "http://127.0.0.1:8765/counts?by=month&since=2025-06-01"
+    curl "http://127.0.0.1:8765/success-rate?since=2025-06-01&until=2025-06-30"
+    curl "http://127.0.0.1:8765/acus-per-merged-pr"
+    curl "http://127.0.0.1:8765/top-sessions?limit=5&pr_related_only=1"
+    curl -X POST "http://127.0.0.1:8765/reload"
+"""
+
+from ..server.query_server import StatsQueryService, create_server
+from ..utils.config_provider import get_config_provider
+
+
+def add_arguments(parser):
+    """コマンドライン引数を定義する"""
+    parser.add_argument(
+        "--host",
+        help="待ち受けるアドレス（省略時は server.host）",
+        default=None
+    )
+    parser.add_argument(
+        "--port",
+        help="待ち受けるポート（省略時は server.port）",
+        type=int,
+        default=None
+    )
+    parser.add_argument(
+        "--pr-data-dir",
+        help="PRデータのパス（ディレクトリ、tar.gz/tar.zst/zipアーカイブ、またはgitリポジトリ）",
+        default=None
+    )
+    parser.add_argument(
+        "--usage-file",
+        help="Usage HistoryファイルのパスCSV/JSON形式、省略時は devin_usage.usage_history_file）"
+    )
+    parser.add_argument(
+        "--verbose",
+        help="リクエストごとのログを出力する",
+        action="store_true"
+    )
+
+
+def run(args):
+    """HTTPサーバーを起動する"""
+    provider = get_config_provider()
+    config = provider.get_config()
+    server_config = config.get("server", {})
+
+    service = StatsQueryService(
+        config, provider,
+        pr_data_dir=args.pr_data_dir,
+        usage_file=args.usage_file,
+        cache_size=server_config.get("cache_size", 256),
+        reload_check_interval=server_config.get("reload_check_interval", 30),
+    )
+    service.load()
+
+    host = args.host or server_config.get("host", "127.0.0.1")
+    port = args.port if args.port is not None else server_config.get("port", 8765)
+    server = create_server(service, host, port, args.verbose)
+    print(f"🌐 http://{server.server_address[0]}:{server.server_address[1]}/ で待ち受けています（Ctrl+Cで終了）")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nサーバーを終了します")
+    finally:
+        server.server_close()
+    return 0
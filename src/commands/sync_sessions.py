@@ -0,0 +1,63 @@
+"""
+Devinセッション同期コマンド（devin-stat sync-sessions）
+
+前回同期時のウォーターマーク以降のセッションだけをDevin APIから取得し、
+ローカルのセッションストアに反映します。
+"""
+
+from ..collectors.devin_api_client import DevinAPIClient
+from ..collectors.devin_session_store import DevinSessionStore
+from ..utils.config_provider import get_config_provider
+
+
+def add_arguments(parser):
+    """コマンドライン引数を定義する"""
+    parser.add_argument(
+        "--store",
+        help="セッションストアのパス（省略時は devin_api.session_store）",
+        default=None
+    )
+    parser.add_argument(
+        "--overlap-hours",
+        help="ウォーターマークから遡って再取得する時間",
+        type=float,
+        default=None
+    )
+    parser.add_argument(
+        "--days",
+        help="同期後にPR関連セッションを集計する日数",
+        type=int,
+        default=7
+    )
+
+
+def run(args):
+    """メイン関数"""
+    provider = get_config_provider()
+    config = provider.get_config()
+    
+    store_path = args.store or config["devin_api"]["session_store"]
+    store = DevinSessionStore(store_path)
+    print(f"=== Devinセッション同期開始 ({store_path}) ===")
+    print(f"  現在のウォーターマーク: {store.watermark or 'なし（初回同期）'}")
+    
+    api_client = DevinAPIClient(config, provider)
+    result = api_client.sync_sessions(store, overlap_hours=args.overlap_hours)
+    
+    if not result["api_available"]:
+        print("  ⚠️ API接続不可のため同期をスキップしました")
+        return
+    if "error" in result:
+        print(f"  ❌ 同期を中断しました（APIリクエスト{result['requests']}回）: {result['error']}")
+        print(f"  ウォーターマークは変更していません: {store.watermark or 'なし'}")
+        return
+    
+    print(f"  ✅ APIリクエスト: {result['requests']}回")
+    print(f"  ✅ 取得: {result['fetched']}件 (新規{result['inserted']}件, 更新{result['updated']}件)")
+    print(f"  ✅ 新しいウォーターマーク: {result['watermark']}")
+    print(f"  ✅ 保存済みセッション: {len(store.sessions)}件")
+    
+    api_data = api_client.analyze_pr_related_sessions(days_back=args.days, store=store)
+    print(f"\n📊 過去{args.days}日のPR関連セッション: {api_data['total_pr_sessions']}件")
+    
+    print("\n=== 同期完了 ===")
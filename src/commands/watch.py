@@ -0,0 +1,143 @@
+"""
+監視モード（devin-stat watch）
+
+PRデータディレクトリとUsage Historyファイルを監視し、変更されたファイルだけを解析して
+集計値を差分更新します。更新のたびに分析結果（devin_analysis.jsonと同じ形式）を書き出し、
+ファイルごとの寄与を定期的にチェックポイントとして保存します。
+"""
+
+import os
+import signal
+import sys
+import time
+from typing import Iterable, List
+
+from ..analyzers.devin_live_analyzer import LiveStatsAggregator, is_pr_data_file
+from ..analyzers.devin_stats_analyzer import DevinStatsAnalyzer
+from ..utils.config_provider import get_config_provider
+from ..utils.file_watcher import FileWatcher
+
+
+def add_arguments(parser):
+    """コマンドライン引数を定義する"""
+    parser.add_argument(
+        "--pr-data-dir",
+        help="監視するPRデータディレクトリ（省略時は data.pr_data_dir）",
+        default=None
+    )
+    parser.add_argument(
+        "--usage-file",
+        help="監視するUsage Historyファイル（複数指定可、省略時は devin_usage.usage_history_file）",
+        action="append",
+        default=None
+    )
+    parser.add_argument(
+        "--output",
+        help="分析結果の出力先（省略時は watch.output_file）",
+        default=None
+    )
+    parser.add_argument(
+        "--backend",
+        help="監視方式（省略時は watch.backend）",
+        choices=["auto", "inotify", "polling"],
+        default=None
+    )
+    parser.add_argument(
+        "--once",
+        help="変更を反映して分析結果とチェックポイントを書き出したら終了する",
+        action="store_true"
+    )
+
+
+def apply_changes(aggregator: LiveStatsAggregator, changes: Iterable[str], pr_dir: str,
+                  usage_files: List[str]) -> bool:
+    """
+    監視で検出した変更を集計に反映する
+
+    Returns:
+        集計値が変わったか
+    """
+    changed = False
+    usage_dirs = {os.path.dirname(path) for path in usage_files}
+    for path in sorted(changes):
+        if path == pr_dir:
+            aggregator.sync_directory(pr_dir)
+            changed = True
+        elif path in usage_files:
+            changed = aggregator.update_usage_file(path) or changed
+        elif path in usage_dirs:
+            for usage_file in usage_files:
+                if os.path.dirname(usage_file) == path:
+                    changed = aggregator.update_usage_file(usage_file) or changed
+        elif os.path.dirname(path) == pr_dir and is_pr_data_file(path):
+            changed = aggregator.update_pr_file(path) or changed
+    return changed
+
+
+def run(args):
+    """監視モードのメイン処理"""
+    provider = get_config_provider()
+    config = provider.get_config()
+    watch_config = config.get("watch", {})
+
+    pr_dir = os.path.abspath(args.pr_data_dir or config["data"]["pr_data_dir"])
+    if not os.path.isdir(pr_dir):
+        print(f"❌ 監視できるのはPRデータのディレクトリのみです: {pr_dir}")
+        return 1
+
+    usage_files = args.usage_file or [config.get("devin_usage", {}).get("usage_history_file", "./data/usage_history.csv")]
+    usage_files = [os.path.abspath(path) for path in usage_files]
+    output_file = args.output or watch_config.get("output_file", "./reports/live_stats.json")
+    checkpoint_file = watch_config.get("checkpoint_file", os.path.join(config["data"]["temp_dir"], "watch_state.json"))
+    checkpoint_interval = watch_config.get("checkpoint_interval", 60)
+
+    print("=== Devin統計 監視モード ===")
+    aggregator = LiveStatsAggregator(config, provider)
+    analyzer = DevinStatsAnalyzer(config, provider)
+
+    started = time.perf_counter()
+    restored = aggregator.load_checkpoint(checkpoint_file)
+    aggregator.forget_usage_files(usage_files)
+    parsed = aggregator.sync_directory(pr_dir)
+    for usage_file in usage_files:
+        aggregator.update_usage_file(usage_file)
+    print(f"✅ 初期集計完了: Devin PR {aggregator.devin_pr_count()}件"
+          f"（{'チェックポイントから復元、' if restored else ''}解析{parsed}件、{time.perf_counter() - started:.2f}秒）")
+
+    analyzer.save_analysis_results(aggregator.to_analysis(), output_file)
+    aggregator.save_checkpoint(checkpoint_file)
+    if args.once:
+        return 0
+
+    watcher = FileWatcher(
+        [pr_dir] + sorted({os.path.dirname(path) for path in usage_files} - {pr_dir}),
+        debounce=watch_config.get("debounce_seconds", 2),
+        max_batch=watch_config.get("max_batch_seconds", 30),
+        poll_interval=watch_config.get("poll_interval", 5),
+        backend=args.backend or watch_config.get("backend", "auto"),
+    )
+    print(f"👀 {watcher.backend}で監視を開始しました: {pr_dir}")
+
+    # SIGTERM（systemdやコンテナの停止）でもチェックポイントを保存してから終了する
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    last_checkpoint = time.monotonic()
+    try:
+        while True:
+            changes = watcher.wait(timeout=checkpoint_interval)
+            if changes:
+                started = time.perf_counter()
+                if apply_changes(aggregator, changes, pr_dir, usage_files):
+                    analyzer.save_analysis_results(aggregator.to_analysis(), output_file)
+                print(f"🔄 {len(changes)}件の変更を反映しました: Devin PR {aggregator.devin_pr_count()}件"
+                      f"（{time.perf_counter() - started:.2f}秒）")
+
+            if aggregator.dirty and time.monotonic() - last_checkpoint >= checkpoint_interval:
+                aggregator.save_checkpoint(checkpoint_file)
+                last_checkpoint = time.monotonic()
+    except KeyboardInterrupt:
+        print("\n監視を終了します")
+    finally:
+        watcher.close()
+        if aggregator.dirty:
+            aggregator.save_checkpoint(checkpoint_file)
+    return 0
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+チャート描画モジュール
+
+分析結果の時系列（日別PR数・日別ACU・月別成功率）をPNG/SVGのグラフとして描画します。
+描画はプロセスプールで並列に行い、画像は入力系列のハッシュをファイル名にして
+キャッシュするため、データが変わったグラフだけが再描画されます。
+どのレポートからも参照されなくなった古い画像は prune_charts で削除します。
+"""
+
+import hashlib
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from ..utils.config_provider import get_config_provider
+from ..utils.file_utils import atomic_open
+
+CHART_STYLE_VERSION = 1
+
+DAILY_CHARTS = ("daily_prs", "daily_acus")
+MONTHLY_CHARTS = ("monthly_success_rate",)
+REPORT_SUFFIXES = (".md", ".html")
+
+
+def downsample(points: List[tuple], max_points: int) -> List[tuple]:
+    """
+    系列を最大max_points点に間引く（連続する点をまとめて平均する）
+
+    Args:
+        points: (ラベル, 値) のリスト（ラベル順）
+        max_points: 最大点数（0以下なら間引かない）
+
+    Returns:
+        各区間の先頭ラベルと平均値のリスト
+    """
+    if max_points <= 0 or len(points) <= max_points:
+        return list(points)
+
+    bucket_size = -(-len(points) // max_points)
+    sampled = []
+    for start in range(0, len(points), bucket_size):
+        bucket = points[start:start + bucket_size]
+        sampled.append((bucket[0][0], sum(value for _, value in bucket) / len(bucket)))
+    return sampled
+
+
+def _date_range(first: str, last: str) -> List[str]:
+    """ISO形式の開始日から終了日までの日付を返す（PRのない日も0件として描画するため）"""
+    start = date.fromisoformat(first)
+    return [(start + timedelta(days=i)).isoformat() for i in range((date.fromisoformat(last) - start).days + 1)]
+
+
+def chart_key(spec: Dict, image_format: str) -> str:
+    """グラフ定義と出力形式からキャッシュキーを計算する"""
+    payload = json.dumps(
+        {"spec": spec, "format": image_format, "style": CHART_STYLE_VERSION},
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ChartRenderer:
+    """分析結果からグラフを描画・キャッシュするクラス"""
+
+    def __init__(self, config=None, provider=None):
+        """初期化"""
+        self.provider = provider or get_config_provider()
+        self.config = config or self.provider.get_config()
+        chart_config = self.config.get("reporting", {}).get("charts", {})
+
+        self.enabled = chart_config.get("enabled", False)
+        self.image_format = chart_config.get("format", "png")
+        self.max_points = chart_config.get("max_points", 365)
+        self.max_workers = chart_config.get("max_workers") or None
+        self.charts_dir = chart_config.get("dir", "charts")
+        self.font_family = chart_config.get("font_family", "")
+
+    def build_specs(self, analysis: Dict) -> Dict[str, Dict]:
+        """分析結果からグラフ定義（間引き済みの系列）を作成する"""
+        if "error" in analysis:
+            return {}
+
+        specs = {}
+        daily_stats = analysis.get("daily_stats", {})
+        created = daily_stats.get("daily_created", {})
+        merged = daily_stats.get("daily_merged", {})
+        if created or merged:
+            days = _date_range(min(set(created) | set(merged)), max(set(created) | set(merged)))
+            specs["daily_prs"] = {
+                "kind": "line",
+                "title": "日別PR作成数・マージ数",
+                "ylabel": "件数",
+                "series": {
+                    "作成": downsample([(day, created.get(day, 0)) for day in days], self.max_points),
+                    "マージ": downsample([(day, merged.get(day, 0)) for day in days], self.max_points),
+                },
+            }
+
+        acu_analysis = analysis.get("acu_analysis", {})
+        daily_usage = acu_analysis.get("full_daily_usage") or acu_analysis.get("daily_usage") or {}
+        if daily_usage:
+            specs["daily_acus"] = {
+                "kind": "bar",
+                "title": "日別ACU使用量",
+                "ylabel": "ACU",
+                "series": {
+                    "ACU": downsample(
+                        [(day, daily_usage[day].get("acus", 0)) for day in sorted(daily_usage)],
+                        self.max_points,
+                    ),
+                },
+            }
+
+        monthly_stats = analysis.get("monthly_stats", {})
+        monthly_created = monthly_stats.get("monthly_created", {})
+        if monthly_created:
+            monthly_merged = monthly_stats.get("monthly_merged", {})
+            specs["monthly_success_rate"] = {
+                "kind": "line",
+                "title": "月別成功率",
+                "ylabel": "%",
+                "series": {
+                    "成功率": [
+                        (month, monthly_merged.get(month, 0) / count * 100 if count else 0)
+                        for month, count in sorted(monthly_created.items())
+                    ],
+                },
+            }
+
+        return specs
+
+    def render_charts(self, analysis: Dict, output_dir: str) -> Dict[str, str]:
+        """
+        グラフを描画する（キャッシュにない画像だけをプロセスプールで描画）
+
+        Args:
+            analysis: 包括的分析結果
+            output_dir: レポートの出力ディレクトリ（画像はその下の charts_dir に保存）
+
+        Returns:
+            グラフ名 → output_dir からの相対パス
+        """
+        specs = self.build_specs(analysis)
+        if not specs:
+            return {}
+        if self.font_family:
+            for spec in specs.values():
+                spec["font_family"] = self.font_family
+
+        charts_path = Path(output_dir) / self.charts_dir
+        charts_path.mkdir(parents=True, exist_ok=True)
+
+        charts = {}
+        pending = []
+        for name, spec in specs.items():
+            file_name = f"{name}-{chart_key(spec, self.image_format)[:16]}.{self.image_format}"
+            charts[name] = f"{self.charts_dir}/{file_name}"
+            if not (charts_path / file_name).exists():
+                pending.append((spec, str(charts_path / file_name), self.image_format))
+
+        if pending:
+            if len(pending) == 1 or self.max_workers == 1:
+                for job in pending:
+                    _render_chart(*job)
+            else:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    list(executor.map(_render_chart, *zip(*pending)))
+            print(f"📊 グラフを{len(pending)}件描画しました（キャッシュ済み{len(specs) - len(pending)}件）")
+
+        return charts
+
+    def prune_charts(self, output_dir: str, keep: Iterable[str] = ()) -> List[str]:
+        """
+        output_dir 直下のどのレポートからも参照されていないグラフ画像を削除する
+
+        過去の日付のレポートが参照している画像は残すため、リンク切れにはならない。
+
+        Args:
+            output_dir: レポートの出力ディレクトリ
+            keep: 参照がなくても残す画像（render_charts の戻り値の相対パス）
+
+        Returns:
+            削除した画像のパス
+        """
+        charts_path = Path(output_dir) / self.charts_dir
+        if not charts_path.is_dir():
+            return []
+
+        reference = re.compile(re.escape(f"{self.charts_dir}/") + r"([^)\s\"'<>]+)")
+        referenced = {Path(path).name for path in keep}
+        for report_path in Path(output_dir).iterdir():
+            if report_path.suffix in REPORT_SUFFIXES and report_path.is_file():
+                referenced.update(reference.findall(report_path.read_text(encoding="utf-8", errors="replace")))
+
+        # render_charts が作成した「グラフ名-ハッシュ.拡張子」の画像だけを対象にする
+        chart_file = re.compile(
+            r"^(?:" + "|".join(DAILY_CHARTS + MONTHLY_CHARTS) + r")-[0-9a-f]{16}\.[a-z]+$"
+        )
+        removed = []
+        for image_path in charts_path.iterdir():
+            if chart_file.match(image_path.name) and image_path.name not in referenced:
+                image_path.unlink()
+                removed.append(str(image_path))
+        if removed:
+            print(f"🧹 参照されなくなったグラフを{len(removed)}件削除しました")
+        return removed
+
+
+def _render_chart(spec: Dict, output_file: str, image_format: str):
+    """ワーカープロセスでグラフを1枚描画する"""
+    try:
+        import matplotlib
+    except ImportError:
+        raise ImportError("グラフを描画するには matplotlib パッケージが必要です: pip install matplotlib")
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib.ticker import MaxNLocator
+
+    if spec.get("font_family"):
+        plt.rcParams["font.family"] = spec["font_family"]
+
+    figure, axis = plt.subplots(figsize=(10, 4))
+    try:
+        for label, points in spec["series"].items():
+            labels = [point[0] for point in points]
+            values = [point[1] for point in points]
+            if spec["kind"] == "bar":
+                axis.bar(labels, values, label=label)
+            else:
+                axis.plot(labels, values, label=label, marker="o" if len(points) <= 60 else None)
+
+        axis.set_title(spec["title"])
+        axis.set_ylabel(spec["ylabel"])
+        axis.legend()
+        axis.grid(alpha=0.3)
+        axis.xaxis.set_major_locator(MaxNLocator(12))
+        figure.autofmt_xdate()
+        figure.tight_layout()
+
+        with atomic_open(output_file, "wb") as f:
+            figure.savefig(f, format=image_format)
+    finally:
+        plt.close(figure)
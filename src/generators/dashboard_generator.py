@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+静的HTMLダッシュボード生成モジュール
+
+包括的分析結果を月ごとに集計済みのJSONシャードに分割し、
+選択した期間のシャードだけを読み込む静的HTMLダッシュボードを出力します。
+シャードは内容のハッシュで管理し、データが変わった月だけを書き換えます。
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+from ..utils.config_provider import get_config_provider
+from ..utils.file_utils import atomic_write_text
+
+INDEX_FILE = "index.json"
+SHARD_DIR = "data"
+
+
+def _month_of(day: str) -> str:
+    return day[:7]
+
+
+def _shard_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+
+class DashboardGenerator:
+    """月別JSONシャードと静的HTMLダッシュボードを生成するクラス"""
+
+    def __init__(self, config=None, provider=None):
+        """初期化"""
+        self.provider = provider or get_config_provider()
+        self.config = config or self.provider.get_config()
+        dashboard_config = self.config.get("reporting", {}).get("dashboard", {})
+        self.default_months = dashboard_config.get("default_months", 3)
+
+    def build_shards(self, analysis: Dict) -> Dict[str, Dict]:
+        """分析結果を月ごとのシャード（日別の作成数・マージ数・ACU使用量）に分割する"""
+        shards = {}
+
+        def shard_for(month: str) -> Dict:
+            if month not in shards:
+                shards[month] = {
+                    "month": month,
+                    "created": 0,
+                    "merged": 0,
+                    "acus": 0,
+                    "sessions": 0,
+                    "days": {},
+                }
+            return shards[month]
+
+        def day_entry(day: str) -> Dict:
+            days = shard_for(_month_of(day))["days"]
+            if day not in days:
+                days[day] = {"created": 0, "merged": 0, "acus": 0, "sessions": 0}
+            return days[day]
+
+        daily_stats = analysis.get("daily_stats", {})
+        for day, count in daily_stats.get("daily_created", {}).items():
+            day_entry(day)["created"] = count
+            shard_for(_month_of(day))["created"] += count
+        for day, count in daily_stats.get("daily_merged", {}).items():
+            day_entry(day)["merged"] = count
+            shard_for(_month_of(day))["merged"] += count
+
+        acu_analysis = analysis.get("acu_analysis", {})
+        daily_usage = acu_analysis.get("full_daily_usage") or acu_analysis.get("daily_usage") or {}
+        for day, stats in daily_usage.items():
+            entry = day_entry(day)
+            entry["acus"] = round(stats.get("acus", 0), 2)
+            entry["sessions"] = stats.get("sessions", 0)
+            shard = shard_for(_month_of(day))
+            shard["acus"] += stats.get("acus", 0)
+            shard["sessions"] += stats.get("sessions", 0)
+
+        for shard in shards.values():
+            shard["acus"] = round(shard["acus"], 2)
+            shard["days"] = dict(sorted(shard["days"].items()))
+
+        return dict(sorted(shards.items()))
+
+    def generate_dashboard(self, analysis: Dict, output_dir: str) -> Dict:
+        """
+        ダッシュボードを生成する（内容が変わったシャードのみ書き込む）
+
+        Args:
+            analysis: 包括的分析結果
+            output_dir: ダッシュボードの出力ディレクトリ
+
+        Returns:
+            生成結果（書き込んだ月・変更のなかった月・削除した月）
+        """
+        if "error" in analysis:
+            print(f"⚠️ ダッシュボードを生成できません: {analysis['error']}")
+            return {"written": [], "unchanged": [], "removed": []}
+
+        dashboard_path = Path(output_dir)
+        shard_path = dashboard_path / SHARD_DIR
+        shard_path.mkdir(parents=True, exist_ok=True)
+
+        previous = self._load_index(shard_path / INDEX_FILE)
+        previous_hashes = {entry["month"]: entry["hash"] for entry in previous.get("months", [])}
+
+        months = []
+        written = []
+        unchanged = []
+        for month, shard in self.build_shards(analysis).items():
+            content = json.dumps(shard, ensure_ascii=False, separators=(",", ":"))
+            digest = _shard_hash(content)
+            shard_file = shard_path / f"{month}.json"
+            if previous_hashes.get(month) == digest and shard_file.exists():
+                unchanged.append(month)
+            else:
+                atomic_write_text(shard_file, content)
+                written.append(month)
+            months.append({
+                "month": month,
+                "hash": digest,
+                "created": shard["created"],
+                "merged": shard["merged"],
+            })
+
+        current = {entry["month"] for entry in months}
+        removed = sorted(month for month in previous_hashes if month not in current)
+        for month in removed:
+            (shard_path / f"{month}.json").unlink(missing_ok=True)
+
+        summary = analysis.get("summary", {})
+        success_patterns = analysis.get("success_patterns", {})
+        index = {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "default_months": self.default_months,
+            "summary": {
+                "total_prs": summary.get("total_prs", 0),
+                "merged_prs": success_patterns.get("merged_prs", 0),
+                "success_rate": round(success_patterns.get("success_rate", 0), 1),
+                "period_analyzed": summary.get("period_analyzed", "全期間"),
+            },
+            "months": months,
+        }
+        previous.pop("generated_at", None)
+        if written or removed or {k: v for k, v in index.items() if k != "generated_at"} != previous:
+            atomic_write_text(shard_path / INDEX_FILE, json.dumps(index, ensure_ascii=False, indent=1))
+
+        html_file = dashboard_path / "index.html"
+        if not html_file.exists() or html_file.read_text(encoding="utf-8") != DASHBOARD_HTML:
+            atomic_write_text(html_file, DASHBOARD_HTML)
+
+        print(f"ダッシュボードを {html_file} に生成しました"
+              f"（更新{len(written)}か月, 変更なし{len(unchanged)}か月, 削除{len(removed)}か月）")
+        return {"written": written, "unchanged": unchanged, "removed": removed}
+
+    def _load_index(self, index_file: Path) -> Dict:
+        if not index_file.exists():
+            return {}
+        try:
+            with open(index_file, encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ ダッシュボードインデックス読み込みエラー: {e}")
+            return {}
+
+
+DASHBOARD_HTML = """<!DOCTYPE html>
+<html lang="ja">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Devin統計ダッシュボード</title>
+<style>
+  body { font-family: system-ui, sans-serif; margin: 2rem; color: #222; }
+  .cards { display: flex; gap: 1rem; margin: 1rem 0; flex-wrap: wrap; }
+  .card { border: 1px solid #ddd; border-radius: 6px; padding: 0.75rem 1rem; min-width: 9rem; }
+  .card b { display: block; font-size: 1.5rem; }
+  table { border-collapse: collapse; margin-top: 1rem; }
+  th, td { border-bottom: 1px solid #eee; padding: 0.25rem 0.75rem; text-align: right; }
+  th:first-child, td:first-child { text-align: left; }
+  .bar { display: inline-block; height: 0.6rem; background: #4a7bd0; vertical-align: middle; }
+  .bar.merged { background: #e8893a; }
+</style>
+</head>
+<body>
+<h1>Devin統計ダッシュボード</h1>
+<p id="meta"></p>
+<div class="cards" id="summary"></div>
+<label>期間: <select id="from"></select> 〜 <select id="to"></select></label>
+<div class="cards" id="range"></div>
+<table>
+  <thead><tr><th>日付</th><th>作成</th><th>マージ</th><th>セッション</th><th>ACU</th><th></th></tr></thead>
+  <tbody id="days"></tbody>
+</table>
+<script>
+const shardCache = {};
+
+function loadShard(entry) {
+  // ハッシュをクエリに付けることで、内容が変わらないシャードはブラウザキャッシュを使う
+  if (!shardCache[entry.month]) {
+    shardCache[entry.month] = fetch(`data/${entry.month}.json?v=${entry.hash}`).then(r => r.json());
+  }
+  return shardCache[entry.month];
+}
+
+function card(label, value) {
+  return `<div class="card">${label}<b>${value}</b></div>`;
+}
+
+async function render(index) {
+  const from = document.getElementById("from").value;
+  const to = document.getElementById("to").value;
+  const selected = index.months.filter(entry => entry.month >= from && entry.month <= to);
+  const shards = await Promise.all(selected.map(loadShard));
+
+  const days = shards.flatMap(shard => Object.entries(shard.days)).reverse();
+  const total = key => shards.reduce((sum, shard) => sum + shard[key], 0);
+  const created = total("created");
+  const merged = total("merged");
+  document.getElementById("range").innerHTML =
+    card("作成", `${created}件`) + card("マージ", `${merged}件`) +
+    card("ACU", total("acus").toFixed(2)) + card("セッション", `${total("sessions")}件`);
+
+  const peak = Math.max(1, ...days.map(([, d]) => Math.max(d.created, d.merged)));
+  document.getElementById("days").innerHTML = days.map(([day, d]) =>
+    `<tr><td>${day}</td><td>${d.created}</td><td>${d.merged}</td><td>${d.sessions}</td>` +
+    `<td>${d.acus.toFixed(2)}</td><td><span class="bar" style="width:${d.created / peak * 8}rem"></span><br>` +
+    `<span class="bar merged" style="width:${d.merged / peak * 8}rem"></span></td></tr>`
+  ).join("");
+}
+
+fetch("data/index.json").then(r => r.json()).then(index => {
+  const s = index.summary;
+  document.getElementById("meta").textContent = `生成日時: ${index.generated_at}（${s.period_analyzed}）`;
+  document.getElementById("summary").innerHTML =
+    card("総Devin PR数", `${s.total_prs}件`) + card("マージ済み", `${s.merged_prs}件`) +
+    card("成功率", `${s.success_rate}%`);
+
+  const months = index.months.map(entry => entry.month);
+  if (!months.length) return;
+  for (const id of ["from", "to"]) {
+    const select = document.getElementById(id);
+    select.innerHTML = months.map(m => `<option>${m}</option>`).join("");
+    select.addEventListener("change", () => render(index));
+  }
+  document.getElementById("from").value = months[Math.max(0, months.length - index.default_months)];
+  document.getElementById("to").value = months[months.length - 1];
+  render(index);
+});
+</script>
+</body>
+</html>
+"""
@@ -5,35 +5,71 @@ Devinレポート生成モジュール
 Devin統計分析結果からマークダウンレポートを生成します。
 """
 
+import heapq
+import io
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO
 
-from ..utils.github_api import load_config
+from ..utils.config_provider import get_config_provider
+from ..utils.file_utils import atomic_open, atomic_write_text
+from ..utils.metrics import increment, timed
+from .chart_renderer import DAILY_CHARTS, MONTHLY_CHARTS, ChartRenderer
+from .report_build_cache import (
+    ReportBuildCache,
+    daily_report_inputs,
+    fingerprint,
+    monthly_summary_inputs,
+)
+
+
+REPORT_FOOTER = """
+---
+
+*このレポートは自動生成されました。*
+*最新の情報については、GitHub Actionsワークフローをご確認ください。*
+"""
+
+CHART_TITLES = {
+    "daily_prs": "日別PR作成数・マージ数",
+    "daily_acus": "日別ACU使用量",
+    "monthly_success_rate": "月別成功率",
+}
 
 
 class DevinReportGenerator:
     """Devinレポート生成クラス"""
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, provider=None):
         """初期化"""
-        self.config = config or load_config()
+        self.provider = provider or get_config_provider()
+        self.config = config or self.provider.get_config()
 
-    def generate_daily_report(self, analysis: Dict, api_data: Optional[Dict] = None) -> str:
+    def generate_daily_report(self, analysis: Dict, api_data: Optional[Dict] = None,
+                              generated_at: Optional[datetime] = None, charts: Optional[Dict] = None) -> str:
         """日次レポートを生成する"""
+        buffer = io.StringIO()
+        self.write_daily_report(buffer, analysis, api_data, generated_at, charts)
+        return buffer.getvalue()
+
+    def write_daily_report(self, out: TextIO, analysis: Dict, api_data: Optional[Dict] = None,
+                           generated_at: Optional[datetime] = None, charts: Optional[Dict] = None):
+        """日次レポートをストリームに書き出す（generated_at省略時は現在時刻、chartsは埋め込むグラフの相対パス）"""
         if "error" in analysis:
-            return f"# Devin日次レポート\n\nエラー: {analysis['error']}\n"
+            out.write(f"# Devin日次レポート\n\nエラー: {analysis['error']}\n")
+            return
         
         summary = analysis.get("summary", {})
         daily_stats = analysis.get("daily_stats", {})
         success_patterns = analysis.get("success_patterns", {})
         acu_analysis = analysis.get("acu_analysis", {})
+        generated_at = generated_at or datetime.now()
         
-        report = f"""# Devin日次統計レポート
+        out.write(f"""# Devin日次統計レポート
 
-生成日時: {datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}
+生成日時: {generated_at.strftime('%Y年%m月%d日 %H:%M:%S')}
 
 
 - **総Devin PR数**: {summary.get('total_prs', 0)}件
@@ -42,108 +78,76 @@ class DevinReportGenerator:
 - **成功率**: {success_patterns.get('success_rate', 0):.1f}%
 
 
-"""
+""")
         
-        daily_created = daily_stats.get("daily_created", {})
-        if daily_created:
-            sorted_dates = sorted(daily_created.keys(), reverse=True)[:30]
-            for date in sorted_dates:
-                count = daily_created[date]
-                report += f"- {date}: {count}件作成\n"
-        else:
-            report += "- データなし\n"
-        
-        report += "\n### PRマージ数\n"
-        daily_merged = daily_stats.get("daily_merged", {})
-        if daily_merged:
-            sorted_dates = sorted(daily_merged.keys(), reverse=True)[:30]
-            for date in sorted_dates:
-                count = daily_merged[date]
-                report += f"- {date}: {count}件マージ\n"
-        else:
-            report += "- データなし\n"
+        self._write_counts(out, daily_stats.get("daily_created", {}), "件作成", limit=30)
         
-
+        out.write("\n### PRマージ数\n")
+        self._write_counts(out, daily_stats.get("daily_merged", {}), "件マージ", limit=30)
         
         data_source = acu_analysis.get('data_source', 'estimated')
         if data_source == 'actual_usage_history':
-            report += f"""
+            out.write(f"""
 
 - **実際のACU使用量**: {acu_analysis.get('total_acus', 0):.2f} ACU
 - **PR作成あたり平均**: {acu_analysis.get('acus_per_pr', 0):.2f} ACU
 - **PR関連セッション**: {acu_analysis.get('pr_sessions', 0)}件
 - **コスト効率**: {acu_analysis.get('cost_efficiency', 0):.1f} (成功率)
 
-"""
+""")
         else:
-            report += f"""
+            out.write(f"""
 
 - **推定ACU使用量**: {acu_analysis.get('total_estimated_acus', 0):,} ACU
 - **PR作成あたり平均**: {acu_analysis.get('acus_per_pr', 0)} ACU
 - **コスト効率**: {acu_analysis.get('cost_efficiency', 0):.1f} (成功率)
 
-"""
+""")
         
         if data_source == 'actual_usage_history':
-            report += """## 📊 Usage History統計
+            out.write("""## 📊 Usage History統計
 
 - **データソース**: ✅ 実際のUsage History
-"""
-            from ..collectors.usage_history_collector import UsageHistoryCollector
-            collector = UsageHistoryCollector()
-            
-            usage_data_path = 'data/usage_history.csv'
-            if os.path.exists(usage_data_path):
-                complete_usage_data = collector.load_usage_data(usage_data_path)
-                complete_summary = collector.generate_usage_summary(complete_usage_data)
-                complete_daily = complete_summary.get('daily_summary', {})
-                
+""")
+            complete_daily = acu_analysis.get('full_daily_usage')
+            if complete_daily is not None:
                 if complete_daily:
-                    report += "### 日別ACU使用量（全セッション）\n"
-                    sorted_dates = sorted(complete_daily.keys(), reverse=True)
-                    for date in sorted_dates:
-                        stats = complete_daily[date]
-                        sessions = stats.get("sessions", 0)
-                        acus = stats.get("acus", 0)
-                        report += f"- {date}: {sessions}セッション, {acus:.2f} ACU\n"
+                    out.write("### 日別ACU使用量（全セッション）\n")
+                    self._write_usage(out, complete_daily)
             else:
                 daily_usage = acu_analysis.get('daily_usage', {})
                 if daily_usage:
-                    report += "### 日別ACU使用量（PR関連のみ）\n"
-                    sorted_dates = sorted(daily_usage.keys(), reverse=True)[:7]
-                    for date in sorted_dates:
-                        stats = daily_usage[date]
-                        sessions = stats.get("sessions", 0)
-                        acus = stats.get("acus", 0)
-                        report += f"- {date}: {sessions}セッション, {acus:.2f} ACU\n"
+                    out.write("### 日別ACU使用量（PR関連のみ）\n")
+                    self._write_usage(out, daily_usage, limit=7)
         else:
-            report += """## 📊 Usage History統計
+            out.write("""## 📊 Usage History統計
 
 - **データソース**: ❌ 手動データ未提供
 - **推定値**: 上記のACU使用量は推定値です
 - **データ提供方法**: `python scripts/convert_usage_history.py` でテキストデータをCSVに変換
 
-"""
-        
-        report += f"""
----
-
-*このレポートは自動生成されました。*
-*最新の情報については、GitHub Actionsワークフローをご確認ください。*
-"""
+""")
         
-        return report
+        self._write_charts(out, charts, DAILY_CHARTS)
+        out.write(REPORT_FOOTER)
 
-    def generate_monthly_summary(self, analysis: Dict) -> str:
+    def generate_monthly_summary(self, analysis: Dict, charts: Optional[Dict] = None) -> str:
         """月次サマリーレポートを生成する"""
+        buffer = io.StringIO()
+        self.write_monthly_summary(buffer, analysis, charts)
+        return buffer.getvalue()
+
+    def write_monthly_summary(self, out: TextIO, analysis: Dict, charts: Optional[Dict] = None):
+        """月次サマリーレポートをストリームに書き出す"""
         if "error" in analysis:
-            return f"# Devin月次サマリー\n\nエラー: {analysis['error']}\n"
+            out.write(f"# Devin月次サマリー\n\nエラー: {analysis['error']}\n")
+            return
         
         summary = analysis.get("summary", {})
         monthly_stats = analysis.get("monthly_stats", {})
         success_patterns = analysis.get("success_patterns", {})
         
-        report = f"""# Devin月次サマリーレポート
+        out.write(f"""# Devin月次サマリーレポート
 
 生成日時: {datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}
 
@@ -153,52 +157,173 @@ class DevinReportGenerator:
 - **成功率**: {success_patterns.get('success_rate', 0):.1f}%
 
 
-"""
+""")
         
-        monthly_created = monthly_stats.get("monthly_created", {})
-        if monthly_created:
-            sorted_months = sorted(monthly_created.keys(), reverse=True)
-            for month in sorted_months:
-                count = monthly_created[month]
-                report += f"- {month}: {count}件作成\n"
-        else:
-            report += "- データなし\n"
-        
-        report += "\n### PRマージ数\n"
-        monthly_merged = monthly_stats.get("monthly_merged", {})
-        if monthly_merged:
-            sorted_months = sorted(monthly_merged.keys(), reverse=True)
-            for month in sorted_months:
-                count = monthly_merged[month]
-                report += f"- {month}: {count}件マージ\n"
-        else:
-            report += "- データなし\n"
+        self._write_counts(out, monthly_stats.get("monthly_created", {}), "件作成")
         
-        return report
+        out.write("\n### PRマージ数\n")
+        self._write_counts(out, monthly_stats.get("monthly_merged", {}), "件マージ")
+        
+        if charts:
+            out.write("\n")
+            self._write_charts(out, charts, MONTHLY_CHARTS)
+
+    def _write_charts(self, out: TextIO, charts: Optional[Dict], names: tuple):
+        """グラフ画像への参照を書き出す"""
+        available = [name for name in names if charts and name in charts]
+        if not available:
+            return
+        
+        out.write("## 📈 トレンド\n\n")
+        for name in available:
+            out.write(f"![{CHART_TITLES[name]}]({charts[name]})\n\n")
+
+    def _write_counts(self, out: TextIO, counts: Dict[str, int], suffix: str, limit: Optional[int] = None):
+        """日付・月ごとの件数を新しい順に書き出す"""
+        if not counts:
+            out.write("- データなし\n")
+            return
+        
+        out.writelines(f"- {key}: {counts[key]}{suffix}\n" for key in _latest_keys(counts, limit))
+
+    def _write_usage(self, out: TextIO, daily_usage: Dict[str, Dict], limit: Optional[int] = None):
+        """日別のセッション数・ACU使用量を新しい順に書き出す"""
+        for date in _latest_keys(daily_usage, limit):
+            stats = daily_usage[date]
+            out.write(f"- {date}: {stats.get('sessions', 0)}セッション, {stats.get('acus', 0):.2f} ACU\n")
+
+    def write_report_file(self, render, output_file: str, *args):
+        """レンダリング結果を一時ファイル経由で出力ファイルへ直接書き出す"""
+        with atomic_open(output_file) as f:
+            render(f, *args)
+        
+        print(f"レポートを {output_file} に保存しました")
+
+    def build_report(self, build_cache: Optional[ReportBuildCache], render, output_file: str,
+                     inputs: Dict, *args) -> bool:
+        """入力が前回から変わっている場合のみレポートを生成する（生成したらTrue）"""
+        digest = fingerprint(inputs) if build_cache is not None else None
+        if build_cache is not None and build_cache.is_up_to_date(output_file, digest):
+            print(f"変更なし: {output_file} の再生成をスキップしました")
+            increment("reports_skipped")
+            return False
+        
+        self.write_report_file(render, output_file, *args)
+        increment("reports_written")
+        if build_cache is not None:
+            build_cache.record(output_file, digest)
+        return True
 
     def save_report(self, report_content: str, output_file: str):
         """レポートをファイルに保存する"""
-        output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(report_content)
+        atomic_write_text(output_file, report_content)
         
         print(f"レポートを {output_file} に保存しました")
 
-    def generate_all_reports(self, analysis: Dict, api_data: Optional[Dict] = None, output_dir: str = "./reports"):
-        """すべてのレポートを生成する"""
+    def render_charts(self, analysis: Dict, output_dir: str) -> Dict[str, str]:
+        """reporting.charts.enabled の場合にグラフを描画し、相対パスを返す"""
+        renderer = ChartRenderer(self.config, self.provider)
+        if not renderer.enabled:
+            return {}
+        
+        try:
+            return renderer.render_charts(analysis, output_dir)
+        except ImportError as e:
+            print(f"⚠️ グラフを描画できません: {e}")
+            return {}
+
+    @timed("generate_reports")
+    def generate_all_reports(self, analysis: Dict, api_data: Optional[Dict] = None, output_dir: str = "./reports",
+                             use_cache: bool = True):
+        """すべてのレポートを生成する（独立したレポートは並行してレンダリング）
+
+        use_cacheがTrueの場合、依存する集計値が前回と同じレポートは再生成しない。
+        """
         os.makedirs(output_dir, exist_ok=True)
+        build_cache = ReportBuildCache(output_dir) if use_cache else None
+        
+        now = datetime.now()
+        daily_file = os.path.join(output_dir, f"devin_daily_report_{now.strftime('%Y%m%d')}.md")
+        monthly_file = os.path.join(output_dir, f"devin_monthly_summary_{now.strftime('%Y%m')}.md")
         
-        daily_report = self.generate_daily_report(analysis, api_data)
-        daily_file = os.path.join(output_dir, f"devin_daily_report_{datetime.now().strftime('%Y%m%d')}.md")
-        self.save_report(daily_report, daily_file)
+        charts = self.render_charts(analysis, output_dir)
+        daily_inputs = daily_report_inputs(analysis)
+        monthly_inputs = monthly_summary_inputs(analysis)
+        if charts:
+            daily_inputs = {**daily_inputs, "charts": charts}
+            monthly_inputs = {**monthly_inputs, "charts": charts}
         
-        monthly_summary = self.generate_monthly_summary(analysis)
-        monthly_file = os.path.join(output_dir, f"devin_monthly_summary_{datetime.now().strftime('%Y%m')}.md")
-        self.save_report(monthly_summary, monthly_file)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                "daily_report": executor.submit(
+                    self.build_report, build_cache, self.write_daily_report, daily_file,
+                    daily_inputs, analysis, api_data, None, charts
+                ),
+                "monthly_summary": executor.submit(
+                    self.build_report, build_cache, self.write_monthly_summary, monthly_file,
+                    monthly_inputs, analysis, charts
+                ),
+            }
+            skipped = [name for name, future in futures.items() if not future.result()]
+        
+        if build_cache is not None:
+            build_cache.save()
+        if charts:
+            # レポートを書き終えてから、どのレポートからも参照されなくなった古いグラフを削除する
+            ChartRenderer(self.config, self.provider).prune_charts(output_dir, charts.values())
         
         return {
             "daily_report": daily_file,
-            "monthly_summary": monthly_file
+            "monthly_summary": monthly_file,
+            "skipped": skipped
         }
+
+    def generate_backfill_reports(self, snapshots: List[tuple], output_dir: str,
+                                  max_workers: Optional[int] = None, batch_size: int = 50) -> List[str]:
+        """
+        日次レポートをまとめて生成する（プロセスプールで並列レンダリング）
+
+        Args:
+            snapshots: (対象日, その日時点の分析結果) のリスト
+            output_dir: 出力ディレクトリ
+            max_workers: ワーカープロセス数（省略時はCPU数）
+            batch_size: 1ワーカーに渡すレポート数
+
+        Returns:
+            生成したレポートファイルのリスト
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        
+        jobs = []
+        for day, analysis in snapshots:
+            output_file = os.path.join(output_dir, f"daily_report_{day.strftime('%Y%m%d')}.md")
+            generated_at = datetime.combine(day, datetime.max.time()).replace(microsecond=0)
+            jobs.append((output_file, analysis, generated_at))
+        batches = [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+        
+        written = []
+        if max_workers == 1 or len(batches) <= 1:
+            for batch in batches:
+                written.extend(_write_daily_report_batch(self.config, batch))
+            return written
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for files in executor.map(_write_daily_report_batch, [self.config] * len(batches), batches):
+                written.extend(files)
+        return written
+
+
+def _write_daily_report_batch(config: Dict, jobs: List[tuple]) -> List[str]:
+    """ワーカープロセスで日次レポートを書き出す"""
+    generator = DevinReportGenerator(config)
+    for output_file, analysis, generated_at in jobs:
+        with atomic_open(output_file) as f:
+            generator.write_daily_report(f, analysis, None, generated_at)
+    return [output_file for output_file, _, _ in jobs]
+
+
+def _latest_keys(values: Dict, limit: Optional[int] = None) -> List[str]:
+    """キーを新しい順に返す（limit指定時は上位のみを部分ソートで取得）"""
+    if limit is None:
+        return sorted(values.keys(), reverse=True)
+    return heapq.nlargest(limit, values.keys())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+レポートビルドキャッシュ
+
+各レポートが依存する集計値のハッシュをマニフェストに記録し、
+入力が変わっていないレポートの再生成をスキップします。
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Dict
+
+from ..utils.file_utils import atomic_write_text
+
+MANIFEST_NAME = ".report_manifest.json"
+
+
+def fingerprint(inputs) -> str:
+    """入力データのハッシュを計算する"""
+    serialized = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def daily_report_inputs(analysis: Dict) -> Dict:
+    """日次レポートが依存する集計値"""
+    if "error" in analysis:
+        return {"error": analysis["error"]}
+    return {
+        "total_prs": analysis.get("summary", {}).get("total_prs"),
+        "daily_stats": analysis.get("daily_stats"),
+        "success_patterns": analysis.get("success_patterns"),
+        "acu_analysis": analysis.get("acu_analysis"),
+    }
+
+
+def monthly_summary_inputs(analysis: Dict) -> Dict:
+    """月次サマリーが依存する集計値"""
+    if "error" in analysis:
+        return {"error": analysis["error"]}
+    return {
+        "total_prs": analysis.get("summary", {}).get("total_prs"),
+        "monthly_stats": analysis.get("monthly_stats"),
+        "success_patterns": analysis.get("success_patterns"),
+    }
+
+
+def analysis_inputs(analysis: Dict) -> Dict:
+    """分析結果JSONの内容（実行時刻を除く）"""
+    inputs = dict(analysis)
+    if "summary" in inputs:
+        inputs["summary"] = {k: v for k, v in inputs["summary"].items() if k != "analysis_date"}
+    return inputs
+
+
+class ReportBuildCache:
+    """出力ディレクトリごとのレポートハッシュのマニフェスト"""
+
+    def __init__(self, output_dir):
+        """初期化"""
+        self.output_dir = Path(output_dir)
+        self.manifest_path = self.output_dir / MANIFEST_NAME
+        self._lock = threading.Lock()
+        self.entries: Dict[str, str] = {}
+
+        if self.manifest_path.exists():
+            try:
+                with open(self.manifest_path, encoding="utf-8") as f:
+                    self.entries = json.load(f).get("reports", {})
+            except Exception as e:
+                print(f"⚠️ レポートマニフェスト読み込みエラー: {e}")
+
+    def _key(self, output_file) -> str:
+        path = Path(output_file)
+        try:
+            return str(path.resolve().relative_to(self.output_dir.resolve()))
+        except ValueError:
+            return str(path)
+
+    def is_up_to_date(self, output_file, digest: str) -> bool:
+        """出力ファイルが存在し、前回と同じ入力から生成されていればTrue"""
+        with self._lock:
+            return Path(output_file).exists() and self.entries.get(self._key(output_file)) == digest
+
+    def record(self, output_file, digest: str):
+        """生成したレポートのハッシュを記録する"""
+        with self._lock:
+            self.entries[self._key(output_file)] = digest
+
+    def save(self):
+        """マニフェストをアトミックに保存する"""
+        with self._lock:
+            content = json.dumps({"reports": self.entries}, ensure_ascii=False, indent=2, sort_keys=True)
+        atomic_write_text(self.manifest_path, content + "\n")
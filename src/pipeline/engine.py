@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+パイプライン実行エンジン
+
+各ステージが入力（ファイル・ディレクトリの状態、設定の一部など）と依存ステージを宣言し、
+出力（成果物）を入力のフィンガープリントごとにディスクへメモ化します。
+入力が変わっていないステージは実行せず、依存関係のないステージは並行して実行します。
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..utils.file_utils import atomic_write_text
+
+
+def fingerprint_of(value) -> str:
+    """JSONに変換できる値のハッシュを計算する"""
+    serialized = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def path_state(path, git_ref: Optional[str] = None, git_subdir: str = "prs"):
+    """
+    ファイル・ディレクトリ・gitリポジトリの状態を、内容を読まずに表す値を返す
+
+    ディレクトリは直下のファイル名・サイズ・mtime、ファイルはサイズとmtime、
+    gitリポジトリは参照先のツリーIDを使う。
+    """
+    if not path:
+        return None
+    target = Path(path)
+    if not target.exists():
+        return {"missing": str(target)}
+
+    if target.is_dir():
+        bare = (target / "HEAD").is_file() and (target / "objects").is_dir()
+        if bare or (git_ref and (target / ".git").exists()):
+            git_dir = target if bare else target / ".git"
+            spec = f"{git_ref or 'HEAD'}:{git_subdir.strip('/')}" if git_subdir else f"{git_ref or 'HEAD'}^{{tree}}"
+            result = subprocess.run(
+                ["git", f"--git-dir={git_dir}", "rev-parse", spec],
+                capture_output=True, text=True,
+            )
+            return {"git_tree": result.stdout.strip() or result.stderr.strip()}
+
+        digest = hashlib.sha256()
+        count = 0
+        with os.scandir(target) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.is_file():
+                    stat = entry.stat()
+                    digest.update(f"{entry.name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+                    count += 1
+        return {"directory": str(target.resolve()), "files": count, "state": digest.hexdigest()}
+
+    stat = target.stat()
+    return {"file": str(target.resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def config_subset(config: Dict, *keys: str) -> Dict:
+    """ドット区切りのキーで設定の一部を取り出す"""
+    subset = {}
+    for key in keys:
+        value = config
+        for part in key.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        subset[key] = value
+    return subset
+
+
+class Stage:
+    """パイプラインのステージ"""
+
+    def __init__(self, name: str, func: Callable[[Dict[str, Any]], Any], depends_on: Iterable[str] = (),
+                 inputs: Optional[Callable[[], Any]] = None, cacheable: bool = True, version: int = 1):
+        """
+        初期化
+
+        Args:
+            name: ステージ名
+            func: 依存ステージの成果物（ステージ名 → 成果物）を受け取り、成果物を返す関数
+            depends_on: 依存するステージ名
+            inputs: 外部入力の状態を返す関数（フィンガープリントに使う）
+            cacheable: Falseなら毎回実行する（ネットワーク取得や書き出しなど）
+            version: 処理内容を変えたときに上げるとキャッシュが無効になる
+        """
+        self.name = name
+        self.func = func
+        self.depends_on = list(depends_on)
+        self.inputs = inputs
+        self.cacheable = cacheable
+        self.version = version
+
+
+class Pipeline:
+    """ステージのDAGを実行するクラス"""
+
+    def __init__(self, cache_dir, max_workers: int = 4, keep_artifacts: int = 3):
+        """
+        初期化
+
+        Args:
+            cache_dir: 成果物を保存するディレクトリ
+            max_workers: 同時に実行するステージ数
+            keep_artifacts: ステージごとに残す成果物の数
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_workers = max_workers
+        self.keep_artifacts = keep_artifacts
+        self.stages: Dict[str, Stage] = {}
+
+    def add_stage(self, name: str, func: Callable[[Dict[str, Any]], Any], depends_on: Iterable[str] = (),
+                  inputs: Optional[Callable[[], Any]] = None, cacheable: bool = True, version: int = 1) -> Stage:
+        """ステージを追加する"""
+        unknown = [dependency for dependency in depends_on if dependency not in self.stages]
+        if unknown:
+            raise ValueError(f"ステージ {name} の依存先が未定義です: {', '.join(unknown)}")
+        stage = Stage(name, func, depends_on, inputs, cacheable, version)
+        self.stages[name] = stage
+        return stage
+
+    def run(self, targets: Optional[Iterable[str]] = None, force: bool = False) -> Dict:
+        """
+        ステージを依存順に実行する
+
+        Args:
+            targets: 実行するステージ（依存先も含めて実行、省略時はすべて）
+            force: Trueならキャッシュを使わずにすべて実行する
+
+        Returns:
+            artifacts（ステージ名 → 成果物）、executed、cached、timings（秒）
+        """
+        required = self._required_stages(targets)
+        artifacts: Dict[str, Any] = {}
+        fingerprints: Dict[str, str] = {}
+        result = {"artifacts": artifacts, "executed": [], "cached": [], "timings": {}}
+
+        pending = dict.fromkeys(name for name in self.stages if name in required)
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                for name in list(pending):
+                    stage = self.stages[name]
+                    if all(dependency in artifacts for dependency in stage.depends_on):
+                        del pending[name]
+                        upstream = {dependency: artifacts[dependency] for dependency in stage.depends_on}
+                        upstream_fingerprints = {dependency: fingerprints[dependency] for dependency in stage.depends_on}
+                        future = executor.submit(self._run_stage, stage, upstream, upstream_fingerprints, force)
+                        running[future] = name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    artifact, fingerprint, from_cache, elapsed = future.result()
+                    artifacts[name] = artifact
+                    fingerprints[name] = fingerprint
+                    result["cached" if from_cache else "executed"].append(name)
+                    result["timings"][name] = elapsed
+
+        return result
+
+    def _required_stages(self, targets: Optional[Iterable[str]]) -> set:
+        if targets is None:
+            return set(self.stages)
+
+        required = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in self.stages:
+                raise ValueError(f"未定義のステージです: {name}")
+            if name not in required:
+                required.add(name)
+                stack.extend(self.stages[name].depends_on)
+        return required
+
+    def _run_stage(self, stage: Stage, upstream: Dict[str, Any], upstream_fingerprints: Dict[str, str],
+                   force: bool):
+        """ステージを1つ実行する（キャッシュがあれば読み込む）"""
+        started = time.perf_counter()
+
+        fingerprint = None
+        if stage.cacheable:
+            fingerprint = fingerprint_of({
+                "stage": stage.name,
+                "version": stage.version,
+                "inputs": stage.inputs() if stage.inputs else None,
+                "upstream": upstream_fingerprints,
+            })
+            artifact_file = self.cache_dir / stage.name / f"{fingerprint}.json"
+            if not force and artifact_file.exists():
+                try:
+                    with open(artifact_file, encoding="utf-8") as f:
+                        cached = json.load(f)
+                    os.utime(artifact_file)
+                    print(f"✅ {stage.name}: 入力に変更がないためキャッシュを使用しました")
+                    return cached["artifact"], cached["content_hash"], True, time.perf_counter() - started
+                except Exception as e:
+                    print(f"⚠️ {stage.name}: キャッシュ読み込みエラー: {e}")
+
+        print(f"▶ {stage.name} を実行中...")
+        artifact = stage.func(upstream)
+
+        # 下流のフィンガープリントには成果物の内容のハッシュを使うため、
+        # 入力が変わっても成果物が同じなら下流のステージは再実行されない
+        content_hash = fingerprint_of({"stage": stage.name, "artifact": artifact})
+        if stage.cacheable:
+            self._store(stage.name, fingerprint, content_hash, artifact)
+
+        return artifact, content_hash, False, time.perf_counter() - started
+
+    def _store(self, name: str, fingerprint: str, content_hash: str, artifact):
+        """成果物を保存し、古い成果物を削除する"""
+        stage_dir = self.cache_dir / name
+        try:
+            content = json.dumps({"content_hash": content_hash, "artifact": artifact}, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            print(f"⚠️ {name}: 成果物をJSONに変換できないためキャッシュしません: {e}")
+            return
+
+        atomic_write_text(stage_dir / f"{fingerprint}.json", content)
+
+        artifacts: List[Path] = sorted(stage_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old_artifact in artifacts[self.keep_artifacts:]:
+            try:
+                old_artifact.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Devin統計パイプライン
+
+PR収集 → 分析 → レポート生成をステージとして定義します。
+PRデータの読み込み・Usage Historyの読み込み・Devinセッションの同期は互いに独立しているため並行して実行され、
+入力が変わっていないステージは前回の成果物を再利用します。
+"""
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from ..analyzers.devin_stats_analyzer import DevinStatsAnalyzer
+from ..collectors.devin_api_client import DevinAPIClient
+from ..collectors.devin_pr_collector import DevinPRCollector
+from ..collectors.devin_session_store import DevinSessionStore
+from ..collectors.pr_date_filter import DateWindow
+from ..collectors.usage_history_collector import UsageHistoryCollector
+from ..generators.devin_report_generator import DevinReportGenerator
+from ..generators.report_build_cache import ReportBuildCache
+from ..utils.config_provider import get_config_provider
+from .engine import Pipeline, config_subset, path_state
+
+
+def build_stats_pipeline(config=None, provider=None, pr_data_dir: Optional[str] = None,
+                         pr_data_ref: Optional[str] = None, usage_file: Optional[str] = None,
+                         output_dir: Optional[str] = None, date_window: Optional[DateWindow] = None,
+                         days_back: int = 7) -> Pipeline:
+    """
+    統計パイプラインを作成する
+
+    Args:
+        pr_data_dir: PRデータのパス（省略時は data.pr_data_dir）
+        pr_data_ref: gitリポジトリから読む場合の参照
+        usage_file: Usage Historyファイルのパス（省略時は使用しない）
+        output_dir: レポートの出力ディレクトリ（省略時は data.reports_dir）
+        date_window: 分析期間（日単位に切り下げて使う）
+        days_back: PR関連セッションを集計する日数
+    """
+    provider = provider or get_config_provider()
+    config = config or provider.get_config()
+    pipeline_config = config.get("pipeline", {})
+
+    pr_source = pr_data_dir or config["data"]["pr_data_dir"]
+    git_subdir = config["data"].get("pr_data_git_subdir", "prs")
+    output_dir = output_dir or config["data"]["reports_dir"]
+    # --days の期間は実行時刻から計算されるため、日単位にそろえて同じ日の実行ではステージの出力を再利用する
+    date_window = (date_window or DateWindow()).floor_to_days()
+    window = [
+        date_window.since.date().isoformat() if date_window.since else None,
+        date_window.until.date().isoformat() if date_window.until else None,
+    ]
+    store_path = config["devin_api"]["session_store"]
+
+    pipeline = Pipeline(
+        Path(config["data"]["temp_dir"]) / "pipeline",
+        max_workers=pipeline_config.get("max_workers", 4),
+        keep_artifacts=pipeline_config.get("keep_artifacts", 3),
+    )
+
+    def collect_prs(upstream):
+        collector = DevinPRCollector(config, provider)
+        return collector.collect_devin_prs(pr_data_dir, pr_data_ref, date_window.since, date_window.until)
+
+    def load_usage(upstream):
+        if not usage_file:
+            return []
+        return UsageHistoryCollector(config, provider).load_usage_data(usage_file)
+
+    def sync_sessions(upstream):
+        api_client = DevinAPIClient(config, provider)
+        return api_client.sync_sessions(DevinSessionStore(store_path))
+
+    def analyze_sessions(upstream):
+        api_client = DevinAPIClient(config, provider)
+        return api_client.analyze_pr_related_sessions(days_back=days_back, store=DevinSessionStore(store_path))
+
+    def analyze(upstream):
+        analyzer = DevinStatsAnalyzer(config, provider)
+        return analyzer.generate_comprehensive_analysis(
+            upstream["devin_prs"], upstream["usage_data"] or None, date_window
+        )
+
+    def write_reports(upstream):
+        analysis = upstream["analysis"]
+        generator = DevinReportGenerator(config, provider)
+        reports = generator.generate_all_reports(analysis, upstream["api_data"], output_dir)
+
+        build_cache = ReportBuildCache(output_dir)
+        analysis_file = os.path.join(output_dir, "devin_analysis.json")
+        DevinStatsAnalyzer(config, provider).save_analysis_results(analysis, analysis_file, build_cache)
+        build_cache.save()
+        return {**reports, "analysis": analysis_file}
+
+    pipeline.add_stage(
+        "devin_prs", collect_prs,
+        inputs=lambda: {
+            "source": path_state(pr_source, pr_data_ref, git_subdir),
+            "config": config_subset(config, "analysis.devin_patterns", "data.pr_data_git_subdir"),
+            "window": window,
+        },
+    )
+    pipeline.add_stage(
+        "usage_data", load_usage,
+        inputs=lambda: {"usage_file": path_state(usage_file)},
+    )
+    pipeline.add_stage("session_sync", sync_sessions, cacheable=False)
+    pipeline.add_stage(
+        "api_data", analyze_sessions, depends_on=["session_sync"],
+        inputs=lambda: {
+            "store": path_state(store_path),
+            "days_back": days_back,
+            "today": datetime.now(timezone.utc).date().isoformat(),
+        },
+    )
+    pipeline.add_stage(
+        "analysis", analyze, depends_on=["devin_prs", "usage_data"],
+        inputs=lambda: {"config": config_subset(config, "analysis"), "window": window},
+    )
+    pipeline.add_stage("reports", write_reports, depends_on=["analysis", "api_data"], cacheable=False)
+
+    return pipeline
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Devin統計のローカルHTTP API
+
+Devin作成PRとUsage Historyのセッションをメモリ上のインデックス（StatsQueryIndex）に保持し、
+期間指定の統計をJSONで返します。同じクエリの結果はLRUキャッシュから返し、
+データを再読み込みしたときにキャッシュを破棄します。
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from ..analyzers.devin_query_index import GROUP_KEY_LENGTH, StatsQueryIndex
+from ..collectors.devin_pr_collector import DevinPRCollector
+from ..collectors.usage_history_collector import UsageHistoryCollector
+from ..pipeline.engine import path_state
+from ..utils.config_provider import get_config_provider
+
+MAX_TOP_SESSIONS = 1000
+
+
+class QueryError(Exception):
+    """クエリパラメータが不正な場合に送出される例外"""
+
+
+class QueryResultCache:
+    """件数上限付きのLRUキャッシュ（スレッドセーフ）"""
+
+    def __init__(self, max_entries: int = 256):
+        """
+        初期化
+
+        Args:
+            max_entries: 保持する結果の上限数（0ならキャッシュしない）
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """キャッシュを参照する（見つかれば (True, 結果)）"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Tuple, value: Any):
+        """結果を保存し、上限を超えたら最も古く参照された結果を削除する"""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """すべての結果を破棄する"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """キャッシュの統計"""
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self.max_entries,
+                    "hits": self.hits, "misses": self.misses}
+
+
+def _date_param(params: Dict[str, str], name: str) -> Optional[str]:
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise QueryError(f"{name} は YYYY-MM-DD 形式で指定してください: {value}")
+
+
+def _int_param(params: Dict[str, str], name: str, default: int, minimum: int, maximum: int) -> int:
+    value = params.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise QueryError(f"{name} は整数で指定してください: {value}")
+    if not minimum <= number <= maximum:
+        raise QueryError(f"{name} は {minimum}〜{maximum} で指定してください: {value}")
+    return number
+
+
+def _period_args(params: Dict[str, str]) -> Dict:
+    return {"since": _date_param(params, "since"), "until": _date_param(params, "until")}
+
+
+def _counts_args(params: Dict[str, str]) -> Dict:
+    by = params.get("by", "day")
+    if by not in GROUP_KEY_LENGTH:
+        raise QueryError(f"by は {' / '.join(GROUP_KEY_LENGTH)} のいずれかを指定してください: {by}")
+    return {"by": by, **_period_args(params)}
+
+
+def _top_sessions_args(params: Dict[str, str]) -> Dict:
+    return {
+        **_period_args(params),
+        "limit": _int_param(params, "limit", 10, 1, MAX_TOP_SESSIONS),
+        "pr_related_only": params.get("pr_related_only", "").lower() in ("1", "true", "yes"),
+    }
+
+
+# パス → (クエリパラメータを検証してインデックスのメソッドの引数にする関数, StatsQueryIndex のメソッド)
+# キャッシュキーは検証後の引数から作るため、クエリが使わないパラメータ（?_=123 など）では別の結果にならない
+QUERIES = {
+    "/counts": (_counts_args, StatsQueryIndex.counts),
+    "/success-rate": (_period_args, StatsQueryIndex.success_rate),
+    "/acus-per-merged-pr": (_period_args, StatsQueryIndex.acus_per_merged_pr),
+    "/top-sessions": (_top_sessions_args, StatsQueryIndex.top_sessions),
+}
+
+
+class StatsQueryService:
+    """インデックスの読み込み・再読み込みとクエリ結果のキャッシュを管理するクラス"""
+
+    def __init__(self, config=None, provider=None, pr_data_dir: Optional[str] = None,
+                 usage_file: Optional[str] = None, cache_size: int = 256, reload_check_interval: float = 30):
+        """
+        初期化
+
+        Args:
+            pr_data_dir: PRデータのパス（省略時は data.pr_data_dir）
+            usage_file: Usage Historyファイルのパス（省略時は devin_usage.usage_history_file）
+            cache_size: クエリ結果のキャッシュ件数
+            reload_check_interval: データの変更を確認する間隔（秒、0なら自動で再読み込みしない）
+        """
+        self.provider = provider or get_config_provider()
+        self.config = config or self.provider.get_config()
+        self.pr_data_dir = pr_data_dir or self.config["data"]["pr_data_dir"]
+        self.usage_file = usage_file or self.config.get("devin_usage", {}).get("usage_history_file")
+        self.reload_check_interval = reload_check_interval
+        self.cache = QueryResultCache(cache_size)
+
+        self.index: Optional[StatsQueryIndex] = None
+        self.generation = 0
+        self.loaded_at: Optional[str] = None
+        self._source_state = None
+        self._last_check = 0.0
+        self._reload_lock = threading.Lock()
+
+    def _current_source_state(self):
+        git_subdir = self.config["data"].get("pr_data_git_subdir", "prs")
+        return [path_state(self.pr_data_dir, git_subdir=git_subdir), path_state(self.usage_file)]
+
+    def load(self):
+        """PRデータとUsage Historyを読み込んでインデックスを作り直す"""
+        with self._reload_lock:
+            started = time.perf_counter()
+            source_state = self._current_source_state()
+
+            devin_prs = DevinPRCollector(self.config, self.provider).collect_devin_prs(self.pr_data_dir)
+            usage_data = None
+            if self.usage_file:
+                usage_data = UsageHistoryCollector(self.config, self.provider).load_usage_data(self.usage_file)
+
+            # インデックスを作り終えてから差し替えるため、読み込み中も前の結果で応答できる
+            self.index = StatsQueryIndex(devin_prs, usage_data, self.config, self.provider)
+            self.generation += 1
+            self.loaded_at = datetime.now().isoformat()
+            self._source_state = source_state
+            self._last_check = time.monotonic()
+            self.cache.clear()
+            print(f"✅ インデックス作成完了: Devin PR {self.index.total_prs}件, "
+                  f"セッション {self.index.session_count}件（{time.perf_counter() - started:.2f}秒）")
+
+    def reload_if_changed(self) -> bool:
+        """確認間隔を過ぎていれば入力の変更を確認し、変わっていれば再読み込みする"""
+        if not self.reload_check_interval or time.monotonic() - self._last_check < self.reload_check_interval:
+            return False
+        self._last_check = time.monotonic()
+        if self._current_source_state() == self._source_state:
+            return False
+        print("🔄 データの変更を検出したため再読み込みします")
+        self.load()
+        return True
+
+    def health(self) -> Dict:
+        """サーバーの状態"""
+        index = self.index
+        return {
+            "status": "ok",
+            "generation": self.generation,
+            "loaded_at": self.loaded_at,
+            "devin_prs": index.total_prs if index else 0,
+            "sessions": index.session_count if index else 0,
+            "cache": self.cache.stats(),
+        }
+
+    def query(self, path: str, params: Dict[str, str]) -> Tuple[Dict, bool]:
+        """
+        クエリを実行する（同じクエリはキャッシュから返す）
+
+        Returns:
+            (結果, キャッシュから返したか)
+        """
+        self.reload_if_changed()
+
+        parse_args, query = QUERIES[path]
+        args = parse_args(params)
+        index, generation = self.index, self.generation
+        # 世代をキーに含め、再読み込み中に計算された古い結果が新しい世代で返らないようにする
+        key = (generation, path, tuple(sorted(args.items())))
+        found, result = self.cache.get(key)
+        if found:
+            return result, True
+
+        result = query(index, **args)
+        self.cache.put(key, result)
+        return result, False
+
+
+class QueryRequestHandler(BaseHTTPRequestHandler):
+    """StatsQueryService にクエリを渡すリクエストハンドラ"""
+
+    service: StatsQueryService = None
+    verbose = False
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        if url.path == "/health":
+            self._send_json(200, self.service.health())
+            return
+        if url.path not in QUERIES:
+            self._send_json(404, {"error": f"不明なパスです: {url.path}", "paths": ["/health", *QUERIES]})
+            return
+
+        try:
+            result, cached = self.service.query(url.path, params)
+        except QueryError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+        self._send_json(200, result, {"X-Cache": "hit" if cached else "miss"})
+
+    def do_POST(self):
+        if urlsplit(self.path).path != "/reload":
+            self._send_json(404, {"error": f"不明なパスです: {self.path}"})
+            return
+        self.service.load()
+        self._send_json(200, self.service.health())
+
+    def _send_json(self, status: int, body: Dict, headers: Optional[Dict[str, str]] = None):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            super().log_message(format, *args)
+
+
+def create_server(service: StatsQueryService, host: str = "127.0.0.1", port: int = 8765,
+                  verbose: bool = False) -> ThreadingHTTPServer:
+    """
+    HTTPサーバーを作成する
+
+    Args:
+        service: クエリを処理するサービス
+        host: 待ち受けるアドレス
+        port: 待ち受けるポート（0なら空いているポート）
+        verbose: リクエストごとのログを出力する
+    """
+    handler = type("BoundQueryRequestHandler", (QueryRequestHandler,), {"service": service, "verbose": verbose})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+バックグラウンド実行ヘルパー
+
+ネットワーク待ちの処理（Devin APIのセッション取得など）をデーモンスレッドで先に開始し、
+PRデータの解析・分析と並行して進めます。結果は必要になった時点で受け取り、
+開始からの期限を過ぎた場合は待たずに代替値を使います。
+"""
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class BackgroundTask:
+    """デーモンスレッドで関数を実行し、期限付きで結果を受け取るクラス"""
+
+    def __init__(self, name: str, func: Callable[..., Any], *args, deadline: Optional[float] = None, **kwargs):
+        """
+        初期化（すぐに実行を開始する）
+
+        Args:
+            name: 処理名（メッセージ用）
+            func: 実行する関数
+            deadline: 開始から結果を待つ上限秒数（Noneなら完了まで待つ）
+        """
+        self.name = name
+        self.deadline = deadline
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+
+        self._done = threading.Event()
+        self._result = None
+        self._error: Optional[BaseException] = None
+
+        # 期限切れで結果を待たずに終了できるよう、デーモンスレッドで実行する
+        self._thread = threading.Thread(
+            target=self._run, args=(func, args, kwargs), name=f"background-{name}", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, func: Callable[..., Any], args, kwargs):
+        try:
+            self._result = func(*args, **kwargs)
+        except BaseException as e:
+            self._error = e
+        finally:
+            self.finished_at = time.monotonic()
+            self._done.set()
+
+    def done(self) -> bool:
+        """実行が完了しているか"""
+        return self._done.is_set()
+
+    def remaining(self) -> Optional[float]:
+        """期限までの残り秒数（期限なしならNone）"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.started_at + self.deadline - time.monotonic())
+
+    def result(self, default: Any = None) -> Any:
+        """
+        結果を受け取る（期限まで待つ）
+
+        Args:
+            default: 期限切れ・例外発生時に返す値
+
+        Returns:
+            関数の戻り値、または default
+        """
+        if not self._done.wait(self.remaining()):
+            print(f"⚠️ {self.name}: {self.deadline:.0f}秒の期限内に完了しなかったため、結果を待たずに続行します")
+            return default
+
+        if self._error is not None:
+            print(f"❌ {self.name}でエラーが発生しました: {self._error}")
+            return default
+
+        return self._result
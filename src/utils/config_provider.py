@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+設定・認証情報プロバイダ
+
+settings.yamlの読み込みとトークン・ヘッダーの解決をプロセス単位でキャッシュします。
+"""
+
+import os
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+import yaml
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "settings.yaml"
+
+_UNRESOLVED = object()
+
+
+class ConfigProvider:
+    """設定と認証情報をキャッシュして提供するクラス"""
+
+    def __init__(self, config_path=None, reload_on_change: bool = False, config: Optional[Dict] = None):
+        """
+        初期化
+
+        Args:
+            config_path: 設定ファイルのパス（省略時は config/settings.yaml）
+            reload_on_change: ファイルのmtimeが変わったら再読み込みするか
+            config: 設定辞書を直接与える場合（ファイルは読まない）
+        """
+        self.config_path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
+        self.reload_on_change = reload_on_change
+        self._lock = threading.RLock()
+        self._config = config
+        self._mtime = None
+        self._static = config is not None
+        self._tokens = {}
+        self._headers = {}
+
+    @classmethod
+    def from_dict(cls, config: Dict) -> "ConfigProvider":
+        """設定辞書からプロバイダを作成する"""
+        return cls(config=config)
+
+    def get_config(self) -> Dict:
+        """設定を取得する（初回のみYAMLを解析）"""
+        with self._lock:
+            if self._config is None:
+                self._load()
+            elif self.reload_on_change and not self._static:
+                if self._current_mtime() != self._mtime:
+                    self._load()
+            return self._config
+
+    def reload(self) -> Dict:
+        """設定を強制的に再読み込みする"""
+        with self._lock:
+            if not self._static:
+                self._load()
+            self.clear_credentials()
+            return self._config
+
+    def clear_credentials(self):
+        """キャッシュ済みのトークンとヘッダーを破棄する"""
+        with self._lock:
+            self._tokens.clear()
+            self._headers.clear()
+
+    def get_github_token(self) -> Optional[str]:
+        """GitHubトークンを取得する（環境変数 → gh CLI の順）"""
+        with self._lock:
+            token = self._tokens.get("github", _UNRESOLVED)
+            if token is _UNRESOLVED:
+                token = self._resolve_github_token()
+                self._tokens["github"] = token
+            return token
+
+    def get_github_headers(self) -> Dict[str, str]:
+        """GitHub APIリクエスト用のヘッダーを取得する"""
+        with self._lock:
+            if "github" not in self._headers:
+                token = self.get_github_token()
+                headers = {"Accept": "application/vnd.github.v3+json"}
+                if token:
+                    headers["Authorization"] = f"token {token}"
+                self._headers["github"] = headers
+            return dict(self._headers["github"])
+
+    def get_devin_token(self) -> Optional[str]:
+        """Devinトークンを取得する"""
+        with self._lock:
+            token = self._tokens.get("devin", _UNRESOLVED)
+            if token is _UNRESOLVED:
+                token_env_var = self.get_config()["devin_api"]["token_env_var"]
+                token = os.environ.get(token_env_var)
+                self._tokens["devin"] = token
+            return token
+
+    def get_devin_headers(self) -> Dict[str, str]:
+        """Devin APIリクエスト用のヘッダーを取得する"""
+        with self._lock:
+            if "devin" not in self._headers:
+                token = self.get_devin_token()
+                headers = {"Content-Type": "application/json"}
+                if token:
+                    headers["Authorization"] = f"Bearer {token}"
+                self._headers["devin"] = headers
+            return dict(self._headers["devin"])
+
+    def _load(self):
+        """設定ファイルを読み込む"""
+        mtime = self._current_mtime()
+        with open(self.config_path, "r", encoding="utf-8") as f:
+            self._config = yaml.safe_load(f)
+        self._mtime = mtime
+        self._tokens.clear()
+        self._headers.clear()
+
+    def _current_mtime(self) -> Optional[float]:
+        try:
+            return self.config_path.stat().st_mtime
+        except OSError:
+            return None
+
+    def _resolve_github_token(self) -> Optional[str]:
+        token_env_var = self.get_config()["github"]["token_env_var"]
+
+        token = os.environ.get(token_env_var)
+        if not token:
+            try:
+                result = subprocess.run(
+                    ["gh", "auth", "token"], capture_output=True, text=True
+                )
+                if result.returncode == 0:
+                    token = result.stdout.strip()
+            except Exception as e:
+                print(f"gh CLIからトークンを取得できませんでした: {e}")
+
+        return token
+
+
+_default_provider = None
+_default_lock = threading.Lock()
+
+
+def get_config_provider() -> ConfigProvider:
+    """プロセス共通の設定プロバイダを取得する"""
+    global _default_provider
+    with _default_lock:
+        if _default_provider is None:
+            _default_provider = ConfigProvider(reload_on_change=True)
+        return _default_provider
+
+
+def set_config_provider(provider: Optional[ConfigProvider]):
+    """プロセス共通の設定プロバイダを差し替える（Noneで初期化し直す）"""
+    global _default_provider
+    with _default_lock:
+        _default_provider = provider
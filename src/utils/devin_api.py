@@ -5,28 +5,52 @@ Devin API関連のユーティリティ関数
 Devin APIを呼び出すための共通機能を提供します。
 """
 
-import os
+import threading
+import time
+
 import requests
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 import backoff
 
-from .github_api import load_config
+from .config_provider import get_config_provider
+from .http_cache import cached_get, get_response_cache
+from .metrics import increment
+from .rate_limiter import get_rate_limiter, is_rate_limited_response
 
 
 def get_devin_token():
     """環境変数からDevinトークンを取得する"""
-    config = load_config()
-    token_env_var = config["devin_api"]["token_env_var"]
-    return os.environ.get(token_env_var)
+    return get_config_provider().get_devin_token()
 
 
 def get_devin_headers():
     """Devin APIリクエスト用のヘッダーを取得する"""
-    token = get_devin_token()
-    headers = {"Content-Type": "application/json"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    return headers
+    return get_config_provider().get_devin_headers()
+
+
+def _send_devin_request(endpoint, params=None, headers=None, provider=None, use_cache=False):
+    """Devin APIリクエストを1回だけ実行する（再試行なし）"""
+    provider = provider or get_config_provider()
+    devin_config = provider.get_config()["devin_api"]
+    
+    if headers is None:
+        headers = provider.get_devin_headers()
+    
+    url = f"{devin_config['base_url']}{endpoint}"
+    
+    scheduler = get_rate_limiter("devin", provider)
+    
+    def send(request_headers):
+        scheduler.acquire()
+        increment("api_calls", api="devin")
+        response = requests.get(
+            url, headers=request_headers, params=params, timeout=devin_config.get("timeout", 30)
+        )
+        scheduler.update_from_response(response)
+        return response
+    
+    cache = get_response_cache(provider) if use_cache else None
+    return cached_get(send, url, params, headers, cache)
 
 
 @backoff.on_exception(
@@ -35,30 +59,177 @@ def get_devin_headers():
     max_tries=3,
     max_time=30,
     giveup=lambda e: isinstance(e, requests.exceptions.HTTPError)
-    and e.response.status_code in [401, 403, 404],
+    and e.response.status_code in [401, 403, 404]
+    and not is_rate_limited_response(e.response),
+    on_backoff=lambda details: increment("api_retries", api="devin"),
 )
-def make_devin_api_request(endpoint, params=None, headers=None):
-    """Devin APIリクエストを実行し、再試行ロジックを適用する"""
-    config = load_config()
-    base_url = config["devin_api"]["base_url"]
-    
-    if headers is None:
-        headers = get_devin_headers()
-    
-    url = f"{base_url}{endpoint}"
-    response = requests.get(url, headers=headers, params=params)
-    response.raise_for_status()
-    return response.json()
+def make_devin_api_request(endpoint, params=None, headers=None, provider=None, use_cache=True):
+    """Devin APIリクエストを実行し、再試行ロジックを適用する（use_cache=False ならレスポンスキャッシュを使わない）"""
+    return _send_devin_request(endpoint, params, headers, provider, use_cache=use_cache)
+
+
+class DevinAPIAvailability:
+    """Devin APIの可用性を管理するサーキットブレーカー
+
+    closed: 正常（成功結果をTTLの間キャッシュ）
+    open: 連続失敗により遮断中（reset_timeoutの間は即座にFalse）
+    half_open: 遮断解除前の試験的プローブ中
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
 
+    def __init__(self, provider=None, cache_ttl: float = 300, failure_threshold: int = 3,
+                 reset_timeout: float = 120, probe=None, clock=time.monotonic):
+        self.provider = provider or get_config_provider()
+        self.cache_ttl = cache_ttl
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._probe = probe or self._default_probe
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._probe_done: Optional[threading.Event] = None
+        
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.last_checked = None
+        self.last_available = None
+        self.opened_at = None
+        self.last_error = None
+        self.probe_count = 0
 
-def is_devin_api_available():
+    @classmethod
+    def from_config(cls, provider=None) -> "DevinAPIAvailability":
+        """設定ファイルの devin_api.availability から作成する"""
+        provider = provider or get_config_provider()
+        settings = provider.get_config()["devin_api"].get("availability", {})
+        return cls(
+            provider=provider,
+            cache_ttl=settings.get("cache_ttl", 300),
+            failure_threshold=settings.get("failure_threshold", 3),
+            reset_timeout=settings.get("reset_timeout", 120),
+        )
+
+    def is_available(self) -> bool:
+        """APIが利用可能か判定する（必要な場合のみプローブする）
+
+        プローブ（ネットワーク呼び出しとレート制限の待機を含む）はロックの外で1つだけ実行し、
+        その間の他の呼び出しは直前の状態を返す。状態が未確定の場合のみプローブの完了を待つ。
+        """
+        if not self.provider.get_devin_token():
+            self.last_error = "token_not_set"
+            return False
+        
+        with self._lock:
+            now = self._clock()
+            
+            if self.state == self.OPEN:
+                if now - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+            
+            if (self.state == self.CLOSED and self.last_available
+                    and now - self.last_checked < self.cache_ttl):
+                return True
+            
+            probe_done = self._probe_done
+            if probe_done is None:
+                self._probe_done = threading.Event()
+                self.probe_count += 1
+            elif self.state == self.HALF_OPEN:
+                return False
+            elif self.last_available is not None:
+                return self.last_available
+        
+        if probe_done is not None:
+            probe_done.wait()
+            with self._lock:
+                return bool(self.last_available)
+        
+        available = False
+        error = None
+        try:
+            self._probe()
+            available = True
+        except Exception as e:
+            error = e
+        finally:
+            with self._lock:
+                if available:
+                    self._on_success(self._clock())
+                else:
+                    self._on_failure(error, self._clock())
+                probe_done, self._probe_done = self._probe_done, None
+            probe_done.set()
+        return available
+
+    def record_success(self):
+        """実リクエストの成功を記録する"""
+        with self._lock:
+            self._on_success(self._clock())
+
+    def record_failure(self, error: Optional[Exception] = None):
+        """実リクエストの失敗を記録する"""
+        with self._lock:
+            self._on_failure(error, self._clock())
+
+    def get_status(self) -> Dict:
+        """現在の状態を辞書で返す"""
+        with self._lock:
+            now = self._clock()
+            retry_in = None
+            if self.state == self.OPEN:
+                retry_in = max(0.0, self.reset_timeout - (now - self.opened_at))
+            
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "last_available": self.last_available,
+                "seconds_since_check": (now - self.last_checked) if self.last_checked is not None else None,
+                "retry_in_seconds": retry_in,
+                "probe_count": self.probe_count,
+                "last_error": self.last_error,
+            }
+
+    def _on_success(self, now):
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.last_checked = now
+        self.last_available = True
+        self.opened_at = None
+        self.last_error = None
+
+    def _on_failure(self, error, now):
+        self.consecutive_failures += 1
+        self.last_checked = now
+        self.last_available = False
+        self.last_error = str(error) if error else None
+        
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = now
+
+    def _default_probe(self):
+        _send_devin_request("/sessions", params={"limit": 1}, provider=self.provider)
+
+
+_availability_monitors = {}
+_availability_lock = threading.Lock()
+
+
+def get_devin_availability(provider=None) -> DevinAPIAvailability:
+    """設定プロバイダごとに共有される可用性モニターを取得する"""
+    provider = provider or get_config_provider()
+    with _availability_lock:
+        monitor = _availability_monitors.get(id(provider))
+        if monitor is None or monitor.provider is not provider:
+            monitor = DevinAPIAvailability.from_config(provider)
+            _availability_monitors[id(provider)] = monitor
+        return monitor
+
+
+def is_devin_api_available(provider=None):
     """Devin APIが利用可能かチェックする"""
-    token = get_devin_token()
-    if not token:
-        return False
-    
-    try:
-        make_devin_api_request("/sessions", params={"limit": 1})
-        return True
-    except Exception:
-        return False
+    return get_devin_availability(provider).is_available()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+ファイル操作ユーティリティ
+
+一時ファイルとリネームによるアトミックな書き込みを提供します。
+"""
+
+import os
+import secrets
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+TEMP_FILE_ATTEMPTS = 100
+
+
+def _create_temp_file(output_path: Path):
+    """出力先と同じディレクトリに一時ファイルを作成する（(fd, パス) を返す）
+
+    tempfile.mkstemp は 0600 で作成するため、通常の open() と同じく 0666 を指定して
+    カーネルにumaskを適用させる（プロセスのumaskは変更しない）。
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    for _ in range(TEMP_FILE_ATTEMPTS):
+        tmp_name = str(output_path.parent / f".{output_path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp_name, flags, 0o666), tmp_name
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"一時ファイルを作成できませんでした: {output_path}")
+
+
+@contextmanager
+def atomic_open(output_file, mode: str = "w", encoding: str = "utf-8", newline: Optional[str] = None):
+    """同じディレクトリの一時ファイルに書き込み、完了時にリネームで置き換える
+
+    途中で例外が発生した場合は一時ファイルを削除し、既存ファイルはそのまま残る。
+    csvモジュールで書き込む場合は newline="" を指定する。
+    """
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = _create_temp_file(output_path)
+    try:
+        text_mode = "b" not in mode
+        with os.fdopen(fd, mode, encoding=encoding if text_mode else None,
+                       newline=newline if text_mode else None) as f:
+            yield f
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_text(output_file, content: str, encoding: str = "utf-8"):
+    """文字列をアトミックに書き込む"""
+    with atomic_open(output_file, "w", encoding=encoding) as f:
+        f.write(content)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+ファイル変更監視
+
+ディレクトリ直下のファイル変更を inotify（inotify_simple がある場合）で監視し、
+使えない環境ではファイルのサイズ・mtimeを定期的に比較するポーリングで代替します。
+変更はデバウンスしてまとめて返すため、`git pull` で数百ファイルが更新されても1回の更新で済みます。
+"""
+
+import os
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+
+def _snapshot(directory: str) -> Dict[str, Tuple[int, int]]:
+    """ディレクトリ直下のファイル → (サイズ, mtime_ns)"""
+    snapshot = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    snapshot[entry.path] = (stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        pass
+    return snapshot
+
+
+class FileWatcher:
+    """ディレクトリ直下のファイル変更を監視するクラス"""
+
+    def __init__(self, directories: Iterable[str], debounce: float = 2.0, max_batch: float = 30.0,
+                 poll_interval: float = 5.0, backend: str = "auto"):
+        """
+        初期化
+
+        Args:
+            directories: 監視するディレクトリ
+            debounce: 最後の変更からこの秒数だけ変更がなければまとめて返す
+            max_batch: 変更が続いても、最初の変更からこの秒数でいったん返す
+            poll_interval: ポーリング時の確認間隔（秒）
+            backend: auto / inotify / polling
+        """
+        self.directories = [os.path.abspath(directory) for directory in directories]
+        self.debounce = debounce
+        self.max_batch = max_batch
+        self.poll_interval = poll_interval
+
+        self._inotify = None
+        self._flags = None
+        self._watch_dirs: Dict[int, str] = {}
+        self._snapshots: Dict[str, Dict[str, Tuple[int, int]]] = {}
+
+        INotify = None
+        if backend != "polling":
+            try:
+                from inotify_simple import INotify, flags
+            except ImportError:
+                if backend == "inotify":
+                    raise ImportError("inotifyで監視するには inotify_simple パッケージが必要です: pip install inotify_simple")
+
+        if INotify is not None:
+            try:
+                self._inotify = INotify()
+                self._flags = flags
+                mask = flags.CLOSE_WRITE | flags.MOVED_TO | flags.MOVED_FROM | flags.CREATE | flags.DELETE
+                for directory in self.directories:
+                    self._watch_dirs[self._inotify.add_watch(directory, mask)] = directory
+            except OSError as e:
+                if backend == "inotify":
+                    raise
+                print(f"⚠️ inotifyを使用できないため、ポーリングで監視します: {e}")
+                self._close_inotify()
+
+        if self._inotify is None:
+            self._snapshots = {directory: _snapshot(directory) for directory in self.directories}
+
+    @property
+    def backend(self) -> str:
+        """実際に使用している監視方式"""
+        return "inotify" if self._inotify is not None else "polling"
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """
+        変更を待ち、デバウンスした変更をまとめて返す
+
+        Args:
+            timeout: 最初の変更を待つ上限秒数（Noneなら変更があるまで待つ）
+
+        Returns:
+            変更されたファイルのパス（イベントが溢れた場合はディレクトリのパスを含む。
+            タイムアウトした場合は空）
+        """
+        changes = self._read(timeout)
+        if not changes:
+            return changes
+
+        first_change = time.monotonic()
+        while True:
+            remaining = self.max_batch - (time.monotonic() - first_change)
+            if remaining <= 0:
+                break
+            more = self._read(min(self.debounce, remaining))
+            if not more:
+                break
+            changes |= more
+        return changes
+
+    def close(self):
+        """監視を終了する"""
+        self._close_inotify()
+
+    def _close_inotify(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+            self._watch_dirs = {}
+
+    def _read(self, timeout: Optional[float]) -> Set[str]:
+        if self._inotify is not None:
+            return self._read_inotify(timeout)
+        return self._read_polling(timeout)
+
+    def _read_inotify(self, timeout: Optional[float]) -> Set[str]:
+        events = self._inotify.read(timeout=None if timeout is None else int(timeout * 1000))
+        changes = set()
+        for event in events:
+            if event.mask & self._flags.Q_OVERFLOW:
+                # イベントキューが溢れた場合は、どのファイルが変わったか分からないため全体を確認させる
+                changes.update(self.directories)
+            elif event.name and event.wd in self._watch_dirs:
+                changes.add(os.path.join(self._watch_dirs[event.wd], event.name))
+        return changes
+
+    def _read_polling(self, timeout: Optional[float]) -> Set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait_seconds = self.poll_interval
+            if deadline is not None:
+                wait_seconds = min(wait_seconds, max(0.0, deadline - time.monotonic()))
+            time.sleep(wait_seconds)
+
+            changes = set()
+            for directory in self.directories:
+                current = _snapshot(directory)
+                previous = self._snapshots.get(directory, {})
+                changes.update(path for path in current.keys() | previous.keys()
+                               if current.get(path) != previous.get(path))
+                self._snapshots[directory] = current
+
+            if changes or (deadline is not None and time.monotonic() >= deadline):
+                return changes
@@ -6,51 +6,39 @@ GitHubのAPIを呼び出すための共通機能を提供します。
 """
 
 import datetime
-import os
 import time
-import yaml
-from pathlib import Path
 
 import backoff
 import requests
 
+from .config_provider import get_config_provider
+from .http_cache import cached_get, get_response_cache
+from .metrics import increment
+from .rate_limiter import get_rate_limiter, is_rate_limited_response
+
 
 def load_config():
-    """設定ファイルを読み込む"""
-    config_path = Path(__file__).parent.parent.parent / "config" / "settings.yaml"
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """設定ファイルを読み込む（プロセス内でキャッシュされる）"""
+    return get_config_provider().get_config()
 
 
 def get_github_token():
     """環境変数からGitHubトークンを取得する"""
-    config = load_config()
-    token_env_var = config["github"]["token_env_var"]
-
-    token = os.environ.get(token_env_var)
-    if not token:
-        try:
-            import subprocess
-
-            result = subprocess.run(
-                ["gh", "auth", "token"], capture_output=True, text=True
-            )
-            if result.returncode == 0:
-                token = result.stdout.strip()
-        except Exception as e:
-            print(f"gh CLIからトークンを取得できませんでした: {e}")
-
-    return token
+    return get_config_provider().get_github_token()
 
 
 def get_headers():
     """APIリクエスト用のヘッダーを取得する"""
-    token = get_github_token()
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    if token:
-        headers["Authorization"] = f"token {token}"
+    return get_config_provider().get_github_headers()
+
 
-    return headers
+def _is_permanent_error(e):
+    """再試行しても解決しないHTTPエラーか判定する（レート制限による403は再試行する）"""
+    return (
+        isinstance(e, requests.exceptions.HTTPError)
+        and e.response.status_code in [401, 403, 404]
+        and not is_rate_limited_response(e.response)
+    )
 
 
 @backoff.on_exception(
@@ -58,18 +46,68 @@ def get_headers():
     (requests.exceptions.RequestException, requests.exceptions.HTTPError),
     max_tries=5,
     max_time=30,
-    giveup=lambda e: isinstance(e, requests.exceptions.HTTPError)
-    and e.response.status_code
-    in [401, 403, 404],
+    giveup=_is_permanent_error,
+    on_backoff=lambda details: increment("api_retries", api="github"),
 )
-def make_github_api_request(url, params=None, headers=None):
+def make_github_api_request(url, params=None, headers=None, provider=None):
     """GitHubのAPIリクエストを実行し、再試行ロジックを適用する"""
+    provider = provider or get_config_provider()
     if headers is None:
-        headers = get_headers()
+        headers = provider.get_github_headers()
+    timeout = provider.get_config().get("api", {}).get("timeout", 30)
+    scheduler = get_rate_limiter("github", provider)
+
+    def send(request_headers):
+        scheduler.acquire()
+        increment("api_calls", api="github")
+        response = requests.get(url, headers=request_headers, params=params, timeout=timeout)
+        scheduler.update_from_response(response)
+        return response
+
+    return cached_get(send, url, params, headers, get_response_cache(provider))
+
+
+class GitHubGraphQLError(Exception):
+    """GraphQL APIがエラーを返した場合の例外"""
+
+    def __init__(self, errors):
+        messages = "; ".join(error.get("message", str(error)) for error in errors)
+        super().__init__(f"GraphQLエラー: {messages}")
+        self.errors = errors
+
 
-    response = requests.get(url, headers=headers, params=params)
+@backoff.on_exception(
+    backoff.expo,
+    (requests.exceptions.RequestException, requests.exceptions.HTTPError),
+    max_tries=5,
+    max_time=30,
+    giveup=_is_permanent_error,
+    on_backoff=lambda details: increment("api_retries", api="github_graphql"),
+)
+def make_github_graphql_request(query, variables=None, provider=None, url=None):
+    """GitHub GraphQL APIにクエリを送信し、dataを返す"""
+    provider = provider or get_config_provider()
+    github_config = provider.get_config()["github"]
+    if url is None:
+        url = github_config.get("graphql_url") or f"{github_config['api_base_url']}/graphql"
+    timeout = provider.get_config().get("api", {}).get("timeout", 30)
+    scheduler = get_rate_limiter("github_graphql", provider)
+
+    scheduler.acquire()
+    increment("api_calls", api="github_graphql")
+    response = requests.post(
+        url,
+        json={"query": query, "variables": variables or {}},
+        headers=provider.get_github_headers(),
+        timeout=timeout,
+    )
+    scheduler.update_from_response(response)
     response.raise_for_status()
-    return response.json()
+
+    result = response.json()
+    if result.get("errors") and not result.get("data"):
+        raise GitHubGraphQLError(result["errors"])
+    return result.get("data", {})
 
 
 @backoff.on_exception(
@@ -77,20 +115,26 @@ def make_github_api_request(url, params=None, headers=None):
     requests.exceptions.RequestException,
     max_tries=3,
 )
-def check_rate_limit():
-    """GitHub APIのレート制限状況を確認する"""
-    config = load_config()
-    api_base_url = config["github"]["api_base_url"]
+def check_rate_limit(provider=None, refresh=False):
+    """GitHub APIのレート制限状況を確認する
 
-    url = f"{api_base_url}/rate_limit"
-    response = requests.get(url, headers=get_headers())
-    response.raise_for_status()
+    直近のレスポンスヘッダーから残り回数が分かっている場合は /rate_limit を呼び出さない。
+    """
+    provider = provider or get_config_provider()
+    scheduler = get_rate_limiter("github", provider)
+
+    if refresh or not scheduler.has_budget_info():
+        api_base_url = provider.get_config()["github"]["api_base_url"]
+
+        url = f"{api_base_url}/rate_limit"
+        response = requests.get(url, headers=provider.get_github_headers())
+        response.raise_for_status()
 
-    rate_limit_data = response.json()
-    core_rate = rate_limit_data["resources"]["core"]
+        rate_limit_data = response.json()
+        scheduler.update_from_rate_limit(rate_limit_data["resources"]["core"])
 
-    remaining = core_rate["remaining"]
-    reset_time = datetime.datetime.fromtimestamp(core_rate["reset"])
+    remaining = scheduler.remaining
+    reset_time = datetime.datetime.fromtimestamp(scheduler.reset_at)
     now = datetime.datetime.now()
 
     print(f"API制限: 残り {remaining} リクエスト")
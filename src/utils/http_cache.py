@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+HTTPレスポンスキャッシュ
+
+GitHub / Devin APIのレスポンスを data.temp_dir 配下にキャッシュし、
+ETag / Last-Modified による条件付きリクエストで再検証します。
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+from .config_provider import get_config_provider
+from .metrics import increment
+
+DEFAULT_ENDPOINT_TTLS = {
+    "*/sessions": 60,
+    "*/sessions/*": 300,
+    "*/rate_limit": 0,
+}
+
+DEFAULT_IMMUTABLE_SESSION_STATUSES = ["finished", "stopped", "expired"]
+
+
+class ResponseCache:
+    """URLとパラメータをキーにしたディスク上のレスポンスキャッシュ（サイズ上限付きLRU）"""
+
+    def __init__(self, cache_dir, max_size_bytes: int = 100 * 1024 * 1024, default_ttl: float = 300,
+                 endpoint_ttls: Optional[Dict[str, float]] = None,
+                 immutable_session_statuses=None, enabled: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = endpoint_ttls if endpoint_ttls is not None else dict(DEFAULT_ENDPOINT_TTLS)
+        self.immutable_session_statuses = set(
+            immutable_session_statuses or DEFAULT_IMMUTABLE_SESSION_STATUSES
+        )
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._total_size = None
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @classmethod
+    def from_config(cls, provider=None) -> "ResponseCache":
+        """設定ファイルの http_cache セクションから作成する"""
+        provider = provider or get_config_provider()
+        config = provider.get_config()
+        settings = config.get("http_cache", {})
+        temp_dir = config.get("data", {}).get("temp_dir", "./temp")
+
+        return cls(
+            cache_dir=settings.get("dir") or os.path.join(temp_dir, "http_cache"),
+            max_size_bytes=int(settings.get("max_size_mb", 100) * 1024 * 1024),
+            default_ttl=settings.get("default_ttl", 300),
+            endpoint_ttls=settings.get("endpoint_ttls"),
+            immutable_session_statuses=settings.get("immutable_session_statuses"),
+            enabled=settings.get("enabled", True),
+        )
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        """URLとパラメータからキャッシュキーを作成する"""
+        normalized = json.dumps(
+            [url, sorted((str(k), str(v)) for k, v in (params or {}).items())],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def lookup(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """キャッシュエントリを取得する"""
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(self.make_key(url, params))
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """エントリを再検証なしで使えるか判定する"""
+        if entry.get("immutable"):
+            return True
+        return time.time() - entry.get("stored_at", 0) < entry.get("ttl", 0)
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """再検証用の条件付きリクエストヘッダーを作成する"""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, params: Optional[Dict], response_headers, body) -> Optional[Dict]:
+        """レスポンスをキャッシュに保存する"""
+        if not self.enabled:
+            return None
+
+        ttl = self.ttl_for(url)
+        immutable = self.is_immutable(url, body)
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if ttl <= 0 and not immutable and not etag and not last_modified:
+            return None
+
+        entry = {
+            "url": url,
+            "params": params or {},
+            "stored_at": time.time(),
+            "ttl": ttl,
+            "immutable": immutable,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        }
+        self._write_entry(self.make_key(url, params), entry)
+        self.stats["stores"] += 1
+        return entry
+
+    def revalidate(self, entry: Dict):
+        """304応答を受けたエントリの鮮度を更新する"""
+        entry["stored_at"] = time.time()
+        self._write_entry(self.make_key(entry["url"], entry.get("params")), entry)
+
+    def ttl_for(self, url: str) -> float:
+        """URLのパスに対応するTTLを返す（最初にマッチしたパターンを採用）"""
+        path = urlsplit(url).path.rstrip("/")
+        for pattern, ttl in self.endpoint_ttls.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return self.default_ttl
+
+    def is_immutable(self, url: str, body) -> bool:
+        """今後変化しないレスポンスか判定する（完了済みセッション・クローズ済みPR）"""
+        if not isinstance(body, dict):
+            return False
+
+        path = urlsplit(url).path.rstrip("/")
+        if fnmatch.fnmatchcase(path, "*/sessions/*"):
+            status = body.get("status_enum") or body.get("status")
+            return status in self.immutable_session_statuses
+
+        if fnmatch.fnmatchcase(path, "*/pulls/*") or fnmatch.fnmatchcase(path, "*/issues/*"):
+            return body.get("state") == "closed" and bool(body.get("closed_at"))
+
+        return False
+
+    def clear(self):
+        """キャッシュをすべて削除する"""
+        with self._lock:
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._total_size = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _write_entry(self, key: str, entry: Dict):
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        path = self._entry_path(key)
+
+        with self._lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if self._total_size is None:
+                self._total_size = sum(p.stat().st_size for p in self.cache_dir.glob("*.json"))
+
+            try:
+                previous_size = path.stat().st_size
+            except OSError:
+                previous_size = 0
+
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+            self._total_size += len(data) - previous_size
+            if self._total_size > self.max_size_bytes:
+                self._evict(keep=path)
+
+    def _evict(self, keep: Path):
+        """最終アクセスが古いエントリから削除してサイズ上限内に収める"""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        for _, size, path in entries:
+            if self._total_size <= self.max_size_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            self._total_size -= size
+            self.stats["evictions"] += 1
+
+
+def cached_get(send: Callable, url: str, params: Optional[Dict], headers: Dict,
+               cache: Optional[ResponseCache] = None):
+    """キャッシュを経由してGETリクエストを実行し、JSONを返す
+
+    Args:
+        send: リクエストヘッダーを受け取り requests.Response を返す関数
+        url: キャッシュキーに使うURL
+        params: クエリパラメータ
+        headers: 送信するヘッダー
+        cache: 使用するキャッシュ（Noneならキャッシュしない）
+    """
+    if cache is None or not cache.enabled:
+        response = send(headers)
+        response.raise_for_status()
+        return response.json()
+
+    entry = cache.lookup(url, params)
+    if entry is not None and cache.is_fresh(entry):
+        cache.stats["hits"] += 1
+        increment("http_cache_hits")
+        return entry["body"]
+
+    request_headers = dict(headers)
+    request_headers.update(cache.conditional_headers(entry))
+    response = send(request_headers)
+
+    if response.status_code == 304 and entry is not None:
+        cache.stats["revalidated"] += 1
+        increment("http_cache_revalidated")
+        cache.revalidate(entry)
+        return entry["body"]
+
+    response.raise_for_status()
+    cache.stats["misses"] += 1
+    increment("http_cache_misses")
+    body = response.json()
+    cache.store(url, params, response.headers, body)
+    return body
+
+
+_response_caches = {}
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache(provider=None) -> ResponseCache:
+    """設定プロバイダごとに共有されるレスポンスキャッシュを取得する"""
+    provider = provider or get_config_provider()
+    with _response_cache_lock:
+        owner, cache = _response_caches.get(id(provider), (None, None))
+        if owner is not provider:
+            cache = ResponseCache.from_config(provider)
+            _response_caches[id(provider)] = (provider, cache)
+        return cache
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+ログ設定
+
+settings.yaml の logging セクション（level / format / file）に従って、
+devin_stat ロガーの出力先を設定します。コンソールへの進捗表示はこれまでどおり print で行います。
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict
+
+LOGGER_NAME = "devin_stat"
+
+
+def configure_logging(config: Dict) -> logging.Logger:
+    """
+    devin_stat ロガーを設定する（設定済みなら何もしない）
+
+    Args:
+        config: 設定辞書
+
+    Returns:
+        devin_stat ロガー
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    if logger.handlers:
+        return logger
+
+    logging_config = config.get("logging", {})
+    logger.setLevel(logging_config.get("level", "INFO"))
+    logger.propagate = False
+
+    log_file = logging_config.get("file")
+    if log_file:
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(log_file, encoding="utf-8")
+    else:
+        handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        logging_config.get("format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    ))
+    logger.addHandler(handler)
+    return logger
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+実行メトリクス
+
+処理ステージごとの実時間・CPU時間・メモリ（最大RSS、tracemalloc有効時は確保量の増減）と、
+読み込んだファイル数・バイト数・解析エラー・API呼び出し・再試行・キャッシュヒットなどのカウンタを記録し、
+実行終了時にJSON（1実行1行で追記）とPrometheusのtextfile collector形式で書き出します。
+
+メモリ確保量の増減は `PYTHONTRACEMALLOC=1` を設定して実行した場合のみ記録されます。
+"""
+
+import functools
+import json
+import logging
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger("devin_stat.metrics")
+
+_METRIC_NAME_RE = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _max_rss_bytes() -> Optional[int]:
+    """プロセスの最大RSS（取得できない環境ではNone）"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linuxはキロバイト、macOSはバイト単位
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class MetricsRegistry:
+    """ステージの計測値とカウンタを集めるクラス（スレッドセーフ）"""
+
+    def __init__(self):
+        """初期化"""
+        self._lock = threading.Lock()
+        # --profile 指定時のみ設定される（StageProfiler）
+        self.profiler = None
+        self.reset()
+
+    def reset(self):
+        """記録をすべて消去する"""
+        with self._lock:
+            self.stages: Dict[str, Dict] = {}
+            self.counters: Dict[Tuple[str, Tuple], float] = {}
+            self.started_at = time.time()
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        ブロックの実時間・CPU時間・メモリを計測する
+
+        CPU時間はプロセス全体の値のため、並行して動くスレッドの分も含まれる。
+
+        Args:
+            name: ステージ名（同じ名前の計測は合算する）
+        """
+        tracing = tracemalloc.is_tracing()
+        memory_before = tracemalloc.get_traced_memory()[0] if tracing else None
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        try:
+            with self.profiler.stage(name) if self.profiler is not None else nullcontext():
+                yield
+        finally:
+            wall = time.perf_counter() - wall_started
+            cpu = time.process_time() - cpu_started
+            memory_delta = tracemalloc.get_traced_memory()[0] - memory_before if tracing else None
+            max_rss = _max_rss_bytes()
+            with self._lock:
+                stage = self.stages.setdefault(name, {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0})
+                stage["calls"] += 1
+                stage["wall_seconds"] += wall
+                stage["cpu_seconds"] += cpu
+                if max_rss is not None:
+                    stage["max_rss_bytes"] = max(stage.get("max_rss_bytes", 0), max_rss)
+                if memory_delta is not None:
+                    stage["memory_delta_bytes"] = stage.get("memory_delta_bytes", 0) + memory_delta
+            logger.debug("stage %s: wall %.3fs cpu %.3fs", name, wall, cpu)
+
+    def timed(self, name: Optional[str] = None) -> Callable:
+        """関数の呼び出しをステージとして計測するデコレータ（省略時は関数名）"""
+        def decorator(func):
+            stage_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(stage_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def increment(self, name: str, value: float = 1, **labels):
+        """
+        カウンタを加算する
+
+        Args:
+            name: カウンタ名（files_read、api_calls など）
+            value: 加算する値
+            labels: 内訳を表すラベル（api="github" など）
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def has_data(self) -> bool:
+        """何か記録されているか"""
+        with self._lock:
+            return bool(self.stages or self.counters)
+
+    def snapshot(self) -> Dict:
+        """記録をJSONに変換できる形で取り出す"""
+        with self._lock:
+            counters: Dict[str, object] = {}
+            for (name, labels), value in sorted(self.counters.items()):
+                if labels:
+                    label_text = ",".join(f"{key}={label}" for key, label in labels)
+                    counters.setdefault(name, {})[label_text] = value
+                else:
+                    counters[name] = value
+            return {
+                "stages": {name: dict(stage) for name, stage in self.stages.items()},
+                "counters": counters,
+                "max_rss_bytes": _max_rss_bytes(),
+            }
+
+    def to_prometheus(self, command: str, success: bool) -> str:
+        """Prometheusのテキスト形式に変換する"""
+        lines = []
+
+        def gauge(metric: str, help_text: str, samples):
+            if not samples:
+                return
+            lines.append(f"# HELP devin_stat_{metric} {help_text}")
+            lines.append(f"# TYPE devin_stat_{metric} gauge")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{_escape_label(str(label))}"' for key, label in labels)
+                lines.append(f"devin_stat_{metric}{{{label_text}}} {value}")
+
+        with self._lock:
+            stages = sorted(self.stages.items())
+            counters = sorted(self.counters.items())
+
+        command_label = [("command", command)]
+        for field, help_text in (
+            ("calls", "Number of times the stage ran in the last run"),
+            ("wall_seconds", "Wall-clock seconds spent in the stage in the last run"),
+            ("cpu_seconds", "Process CPU seconds spent in the stage in the last run"),
+            ("max_rss_bytes", "Process peak RSS at the end of the stage"),
+            ("memory_delta_bytes", "Net traced memory allocated by the stage (PYTHONTRACEMALLOC only)"),
+        ):
+            gauge(f"stage_{field}", help_text, [
+                (command_label + [("stage", name)], stage[field]) for name, stage in stages if field in stage
+            ])
+
+        counter_names = sorted({name for (name, _), _ in counters})
+        for counter_name in counter_names:
+            gauge(_metric_name(counter_name), f"Counter {counter_name} in the last run", [
+                (command_label + list(labels), value) for (name, labels), value in counters if name == counter_name
+            ])
+
+        gauge("last_run_timestamp_seconds", "Unix time when the last run finished", [(command_label, time.time())])
+        gauge("last_run_success", "1 if the last run finished without error", [(command_label, int(success))])
+        gauge("last_run_duration_seconds", "Duration of the last run",
+              [(command_label, time.time() - self.started_at)])
+        rss = _max_rss_bytes()
+        if rss is not None:
+            gauge("max_rss_bytes", "Process peak RSS in the last run", [(command_label, rss)])
+        return "\n".join(lines) + "\n"
+
+
+def _metric_name(name: str) -> str:
+    return _METRIC_NAME_RE.sub("_", name)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """プロセス共通のメトリクスを返す"""
+    return _registry
+
+
+def stage(name: str):
+    """プロセス共通のメトリクスでステージを計測する（MetricsRegistry.stage）"""
+    return _registry.stage(name)
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    """プロセス共通のメトリクスで関数を計測するデコレータ（MetricsRegistry.timed）"""
+    return _registry.timed(name)
+
+
+def increment(name: str, value: float = 1, **labels):
+    """プロセス共通のメトリクスのカウンタを加算する（MetricsRegistry.increment）"""
+    _registry.increment(name, value, **labels)
+
+
+def start_run(command: str, profile_dir=None):
+    """
+    サブコマンドの実行開始時に、ログを設定してメトリクスを初期化する
+
+    Args:
+        command: 実行するサブコマンド名
+        profile_dir: 指定した場合、各ステージをプロファイルして結果をこのディレクトリに保存する
+    """
+    from .config_provider import get_config_provider
+    from .logging_config import configure_logging
+
+    config = get_config_provider().get_config()
+    configure_logging(config)
+    _registry.reset()
+    if profile_dir is not None:
+        from .profiling import start_profiler
+
+        _registry.profiler = start_profiler(config, profile_dir)
+        print(f"📊 プロファイルを有効にしました: {profile_dir}")
+    logger.info("%s: 開始", command)
+
+
+def finish_run(command: str, success: bool):
+    """サブコマンドの実行終了時に、プロファイルとメトリクスを書き出す"""
+    from .config_provider import get_config_provider
+
+    profiler, _registry.profiler = _registry.profiler, None
+    if profiler is not None:
+        try:
+            written = profiler.stop()
+            print(f"📊 プロファイルを保存しました: {profiler.output_dir}（{len(written)}ファイル）")
+        except Exception as e:
+            print(f"⚠️ プロファイルの書き出しに失敗しました: {e}")
+
+    try:
+        write_metrics(get_config_provider().get_config(), command, success)
+    except Exception as e:
+        print(f"⚠️ メトリクスの書き出しに失敗しました: {e}")
+
+
+def write_metrics(config: Dict, command: str, success: bool = True, registry: Optional[MetricsRegistry] = None):
+    """
+    メトリクスをJSON（1実行1行で追記）とPrometheusのtextfile collector形式で書き出す
+
+    Args:
+        config: 設定辞書（metrics セクションを使う）
+        command: 実行したサブコマンド名
+        success: 正常終了したか
+    """
+    from .file_utils import atomic_write_text
+
+    registry = registry or _registry
+    metrics_config = config.get("metrics", {})
+    if not metrics_config.get("enabled", True):
+        return
+
+    record = {
+        "command": command,
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+        "duration_seconds": time.time() - registry.started_at,
+        "success": success,
+        **registry.snapshot(),
+    }
+
+    json_file = metrics_config.get("json_file")
+    if json_file:
+        path = Path(json_file)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    prometheus_dir = metrics_config.get("prometheus_dir")
+    if prometheus_dir:
+        # textfile collector は書き込み途中のファイルを読まないよう、リネームで置き換える
+        atomic_write_text(Path(prometheus_dir) / f"devin_stat_{_metric_name(command)}.prom",
+                          registry.to_prometheus(command, success))
+
+    logger.info("%s: %.2fs, stages=%s", command, record["duration_seconds"],
+                {name: round(stage["wall_seconds"], 3) for name, stage in record["stages"].items()})
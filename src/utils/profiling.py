@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+プロファイリング
+
+`--profile` 指定時に、メトリクスのステージ（PR収集・Usage History読み込み・分析・Devin API・レポート生成）ごとに
+cProfile と tracemalloc で計測し、次のファイルを出力ディレクトリに書き出します。
+
+- `NN-<stage>.pstats`: cProfile の結果（`python -m pstats` や snakeviz で開く）
+- `NN-<stage>.txt`: 累積時間の上位N件
+- `NN-<stage>.alloc.txt`: ステージ中に増えたメモリ確保の上位N件（行単位）
+- `stacks.collapsed`: 一定間隔でサンプリングしたスタック（flamegraph.pl / speedscope 用の折りたたみ形式）
+
+入れ子のステージは子ステージの間だけ親のcProfileを止めるため、親の .pstats には子の処理時間は含まれません。
+`--profile` を指定しない場合はステージの計測時に何も追加しません。
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import re
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+_FILE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def default_profile_dir(config: Dict, command: str, output_dir: Optional[str] = None) -> Path:
+    """
+    プロファイルの既定の保存先（出力ディレクトリ/profile_<command>_YYYYmmdd_HHMMSS）
+
+    Args:
+        config: 設定辞書
+        command: 実行するサブコマンド名
+        output_dir: コマンドの出力ディレクトリ（省略時は data.reports_dir）
+    """
+    base_dir = output_dir or config.get("data", {}).get("reports_dir", "./reports")
+    return Path(base_dir) / f"profile_{command}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+
+class StageProfiler:
+    """ステージごとのcProfile・tracemallocと、スタックのサンプリングを行うクラス"""
+
+    def __init__(self, output_dir, top_n: int = 30, sample_interval: float = 0.005,
+                 tracemalloc_frames: int = 1):
+        """
+        初期化
+
+        Args:
+            output_dir: 結果の保存先
+            top_n: テキストのレポートに載せる件数
+            sample_interval: スタックのサンプリング間隔（秒、0ならサンプリングしない）
+            tracemalloc_frames: tracemalloc が記録するスタックの深さ
+        """
+        self.output_dir = Path(output_dir)
+        self.top_n = top_n
+        self.sample_interval = sample_interval
+        self.tracemalloc_frames = tracemalloc_frames
+        self._lock = threading.Lock()
+        self._active: Dict[int, List[Optional[cProfile.Profile]]] = {}
+        self._sequence = 0
+        self._stacks: Counter = Counter()
+        self._sampler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._started_tracemalloc = False
+        self.written: List[Path] = []
+
+    def start(self):
+        """計測を開始する"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.tracemalloc_frames)
+            self._started_tracemalloc = True
+        if self.sample_interval > 0:
+            self._sampler = threading.Thread(target=self._sample, name="stage-profiler-sampler", daemon=True)
+            self._sampler.start()
+
+    def stop(self) -> List[Path]:
+        """
+        計測を終了し、折りたたみスタックを書き出す
+
+        Returns:
+            書き出したファイルのリスト
+        """
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            self._sampler = None
+            self._write_text("stacks.collapsed", "".join(
+                f"{stack} {count}\n" for stack, count in sorted(self._stacks.items())
+            ))
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        return self.written
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        ステージをcProfile・tracemallocで計測する（MetricsRegistry.stage から呼ばれる）
+
+        Args:
+            name: ステージ名
+        """
+        with self._lock:
+            self._sequence += 1
+            prefix = f"{self._sequence:02d}-{_FILE_NAME_RE.sub('_', name)}"
+            stack = self._active.setdefault(threading.get_ident(), [])
+
+        parent = stack[-1] if stack else None
+        if parent is not None:
+            parent.disable()
+        before = self._snapshot()
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12以降は別スレッドで計測中のプロファイラと同時に有効にできない
+            profile = None
+        stack.append(profile)
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            after = self._snapshot()
+            stack.pop()
+            if parent is not None:
+                try:
+                    parent.enable()
+                except ValueError:
+                    pass
+            self._write_stage(prefix, name, profile, before, after)
+
+    def _snapshot(self) -> Optional[tracemalloc.Snapshot]:
+        if not tracemalloc.is_tracing():
+            return None
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, pstats.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ])
+
+    def _write_stage(self, prefix: str, name: str, profile: Optional[cProfile.Profile],
+                     before: Optional[tracemalloc.Snapshot], after: Optional[tracemalloc.Snapshot]):
+        if profile is not None:
+            pstats_file = self.output_dir / f"{prefix}.pstats"
+            profile.dump_stats(str(pstats_file))
+            self.written.append(pstats_file)
+
+            buffer = io.StringIO()
+            buffer.write(f"# stage: {name}（累積時間の上位{self.top_n}件）\n")
+            stats = pstats.Stats(profile, stream=buffer)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
+            self._write_text(f"{prefix}.txt", buffer.getvalue())
+        else:
+            self._write_text(f"{prefix}.txt", f"# stage: {name}\n別スレッドで計測中のためcProfileを取得できませんでした\n")
+
+        if before is None or after is None:
+            return
+        differences = after.compare_to(before, "lineno")
+        total = sum(difference.size_diff for difference in differences)
+        lines = [
+            f"# stage: {name}（メモリ確保の増減の上位{self.top_n}件）",
+            f"# 合計: {total / 1024:+.1f} KiB, tracemallocのピーク: {tracemalloc.get_traced_memory()[1] / 1024:.1f} KiB",
+        ]
+        lines.extend(str(difference) for difference in differences[:self.top_n])
+        self._write_text(f"{prefix}.alloc.txt", "\n".join(lines) + "\n")
+
+    def _write_text(self, file_name: str, content: str):
+        path = self.output_dir / file_name
+        path.write_text(content, encoding="utf-8")
+        self.written.append(path)
+
+    def _sample(self):
+        """一定間隔で全スレッドのスタックを記録する"""
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.sample_interval):
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                frames = []
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                frames.append(thread_names.get(thread_id, str(thread_id)))
+                self._stacks[";".join(reversed(frames))] += 1
+
+
+def start_profiler(config: Dict, output_dir) -> StageProfiler:
+    """
+    settings.yaml の profiling セクションに従ってプロファイラを作成し、計測を開始する
+
+    Args:
+        config: 設定辞書
+        output_dir: 結果の保存先
+    """
+    profiling_config = config.get("profiling", {})
+    profiler = StageProfiler(
+        output_dir,
+        top_n=profiling_config.get("top_n", 30),
+        sample_interval=profiling_config.get("sample_interval", 0.005),
+        tracemalloc_frames=profiling_config.get("tracemalloc_frames", 1),
+    )
+    profiler.start()
+    return profiler
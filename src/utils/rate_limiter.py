@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+APIレート制限スケジューラ
+
+レスポンスの X-RateLimit-* / Retry-After ヘッダーから残りリクエスト数を把握し、
+スレッド間で共有する予算に基づいてリクエストを事前に調整します。
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from .config_provider import get_config_provider
+
+
+class RateLimitExceeded(Exception):
+    """レート制限に達し、待機しない設定の場合に送出される例外"""
+
+    def __init__(self, name: str, wait_seconds: float):
+        super().__init__(f"{name} APIのレート制限に達しました（リセットまで {wait_seconds:.1f}秒）")
+        self.wait_seconds = wait_seconds
+
+
+def is_rate_limited_response(response) -> bool:
+    """レスポンスがレート制限による拒否か判定する"""
+    if response is None:
+        return False
+    if response.status_code == 429:
+        return True
+    if response.status_code == 403:
+        headers = response.headers
+        return headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in headers
+    return False
+
+
+def _parse_retry_after(value: Optional[str], now: float) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - now
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitScheduler:
+    """レート制限ヘッダーに基づいてリクエストを調整するスケジューラ"""
+
+    def __init__(self, name: str, request_delay: float = 0.0, reserve: int = 0,
+                 wait_on_limit: bool = True, clock=time.time):
+        """
+        初期化
+
+        Args:
+            name: API名（メトリクス・メッセージ用）
+            request_delay: リクエスト間の最小間隔（秒）
+            reserve: 残り回数がこの値以下になったらリセットまで待機する
+            wait_on_limit: Falseなら待機せずRateLimitExceededを送出する
+        """
+        self.name = name
+        self.request_delay = request_delay
+        self.reserve = reserve
+        self.wait_on_limit = wait_on_limit
+        self._clock = clock
+        self._condition = threading.Condition()
+
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.blocked_until: float = 0.0
+        self._next_slot: float = 0.0
+
+        self.metrics = {
+            "requests": 0,
+            "throttled": 0,
+            "total_wait_seconds": 0.0,
+            "rate_limited_responses": 0,
+        }
+
+    @classmethod
+    def from_config(cls, name: str, provider=None) -> "RateLimitScheduler":
+        """設定ファイルの api セクションから作成する"""
+        provider = provider or get_config_provider()
+        api_config = provider.get_config().get("api", {})
+        return cls(
+            name=name,
+            request_delay=api_config.get("request_delay", 0.0),
+            reserve=api_config.get("rate_limit_reserve", 0),
+            wait_on_limit=api_config.get("rate_limit_wait", True),
+        )
+
+    def acquire(self):
+        """リクエスト1回分の予算を確保する（必要なら待機する）"""
+        with self._condition:
+            while True:
+                now = self._clock()
+                wait_seconds, exhausted = self._required_wait(now)
+                if wait_seconds <= 0:
+                    break
+                if exhausted and not self.wait_on_limit:
+                    raise RateLimitExceeded(self.name, wait_seconds)
+
+                self.metrics["throttled"] += 1
+                self.metrics["total_wait_seconds"] += wait_seconds
+                self._condition.wait(wait_seconds)
+
+            if self.remaining is not None:
+                self.remaining -= 1
+            self._next_slot = now + self.request_delay
+            self.metrics["requests"] += 1
+
+    def update_from_response(self, response):
+        """レスポンスヘッダーから予算を更新する"""
+        headers = response.headers
+        now = self._clock()
+
+        with self._condition:
+            if headers.get("X-RateLimit-Limit") is not None:
+                self.limit = int(headers["X-RateLimit-Limit"])
+            self._update_budget(headers.get("X-RateLimit-Remaining"), headers.get("X-RateLimit-Reset"))
+
+            if is_rate_limited_response(response):
+                self.metrics["rate_limited_responses"] += 1
+                retry_after = _parse_retry_after(headers.get("Retry-After"), now)
+                if retry_after is not None:
+                    self.blocked_until = max(self.blocked_until, now + retry_after)
+                elif self.reset_at is not None:
+                    self.blocked_until = max(self.blocked_until, self.reset_at)
+                else:
+                    self.blocked_until = max(self.blocked_until, now + 60)
+
+            self._condition.notify_all()
+
+    def _update_budget(self, remaining: Optional[str], reset: Optional[str]):
+        """残り回数とリセット時刻を反映する（呼び出し側でロックを取得済み）
+
+        並行リクエストのレスポンスは順不同で返るため、同じウィンドウ（リセット時刻が同じ）では
+        少ない方の残り回数を採用し、acquire で消費済みの予算が古いレスポンスで戻らないようにする。
+        残り回数が増えるのはリセット時刻が進んだ（新しいウィンドウの）場合だけ。
+        """
+        reset_at = float(reset) if reset is not None else None
+        if reset_at is not None and self.reset_at is not None and reset_at < self.reset_at:
+            return  # 前のウィンドウのレスポンス
+
+        if remaining is not None:
+            remaining = int(remaining)
+            if reset_at is not None and reset_at == self.reset_at and self.remaining is not None:
+                remaining = min(self.remaining, remaining)
+            self.remaining = remaining
+        if reset_at is not None:
+            self.reset_at = reset_at
+
+    def update_from_rate_limit(self, core_rate: Dict):
+        """/rate_limit の core 情報から予算を更新する"""
+        with self._condition:
+            self.limit = core_rate.get("limit", self.limit)
+            self.remaining = core_rate["remaining"]
+            self.reset_at = float(core_rate["reset"])
+            self._condition.notify_all()
+
+    def has_budget_info(self) -> bool:
+        """ヘッダーから予算情報を取得済みか"""
+        return self.remaining is not None and self.reset_at is not None
+
+    def get_metrics(self) -> Dict:
+        """予算とスケジューリングのメトリクスを返す"""
+        with self._condition:
+            now = self._clock()
+            return {
+                "name": self.name,
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "reset_in_seconds": max(0.0, self.reset_at - now) if self.reset_at else None,
+                "blocked_for_seconds": max(0.0, self.blocked_until - now),
+                **self.metrics,
+            }
+
+    def _required_wait(self, now: float):
+        """(待機秒数, 予算切れによる待機か) を返す"""
+        if self.blocked_until > now:
+            return self.blocked_until - now, True
+
+        if self.remaining is not None and self.remaining <= self.reserve:
+            if self.reset_at is not None and self.reset_at > now:
+                return self.reset_at - now, True
+            # リセット時刻を過ぎていれば次のレスポンスで更新されるまで制限しない
+            self.remaining = None
+
+        if self._next_slot > now:
+            return self._next_slot - now, False
+
+        return 0.0, False
+
+
+_schedulers = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, provider=None) -> RateLimitScheduler:
+    """API名と設定プロバイダごとに共有されるスケジューラを取得する"""
+    provider = provider or get_config_provider()
+    key = (name, id(provider))
+    with _schedulers_lock:
+        owner, scheduler = _schedulers.get(key, (None, None))
+        if owner is not provider:
+            scheduler = RateLimitScheduler.from_config(name, provider)
+            _schedulers[key] = (provider, scheduler)
+        return scheduler
+
+
+def get_rate_limit_metrics() -> Dict[str, Dict]:
+    """すべてのスケジューラのメトリクスを返す"""
+    with _schedulers_lock:
+        schedulers = [scheduler for _, scheduler in _schedulers.values()]
+    return {scheduler.name: scheduler.get_metrics() for scheduler in schedulers}